@@ -0,0 +1,60 @@
+"""
+Quantile Sketch Benchmark for VectoPy
+=====================================
+This file compares exact quantiles (selection on the whole array) with the
+KLL sketch behind `median(approx=True)`: time, rank error and items retained.
+
+Run: python examples/02_quantile_sketch_benchmark.py [n]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import time
+from bisect import bisect_left, bisect_right
+
+import vectopy as vp
+
+QUANTILES = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+
+def rank_error(ordered, value, q):
+    """Distance between q and the range of ranks `value` occupies in the data."""
+    low = bisect_left(ordered, value) / len(ordered)
+    high = bisect_right(ordered, value) / len(ordered)
+    return 0.0 if low <= q <= high else min(abs(low - q), abs(high - q))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print("=" * 60)
+    print(f"Quantiles of {n:,} latency-like values (log-normal)")
+    print("=" * 60)
+
+    rng = random.Random(42)
+    data = vp.array([rng.lognormvariate(3, 1) for _ in range(n)])
+    ordered = sorted(data)
+
+    start = time.perf_counter()
+    exact = vp.array(data).quantile(QUANTILES)
+    exact_time = time.perf_counter() - start
+    print(f"\n{'method':<14}{'time (s)':>10}{'max rank err':>14}{'items kept':>12}")
+    print("-" * 50)
+    print(f"{'exact':<14}{exact_time:>10.3f}{0.0:>14.4f}{n:>12,}")
+
+    for eps in (0.05, 0.01, 0.005):
+        start = time.perf_counter()
+        sketch = vp.sketches.KLLSketch.from_error(eps, seed=0).update(data)
+        approx = sketch.quantile(QUANTILES)
+        elapsed = time.perf_counter() - start
+        worst = max(rank_error(ordered, value, q) for q, value in zip(QUANTILES, approx))
+        print(f"{'eps=' + str(eps):<14}{elapsed:>10.3f}{worst:>14.4f}{sketch.size:>12,}")
+
+    print("\nExact:", [round(x, 2) for x in exact])
+    print("Sketch (eps=0.005):", [round(x, 2) for x in approx])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Vector Index Benchmark for VectoPy
+==================================
+This file compares exact search (FlatIndex) with the approximate IVFIndex on
+clustered vectors: build time, query throughput and recall@k for several
+nprobe values.
+
+Run: python examples/03_vector_index_benchmark.py [n] [dim]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import time
+
+import vectopy as vp
+
+K = 10
+QUERIES = 100
+
+
+def clustered(rng, centers, n, spread=1.0):
+    """Vectors scattered around randomly chosen centers (like embeddings of topics)."""
+    return [[x + rng.gauss(0, spread) for x in rng.choice(centers)] for _ in range(n)]
+
+
+def recall(found, truth):
+    hits = sum(len({i for i, _ in a} & {i for i, _ in b}) for a, b in zip(found, truth))
+    return hits / (K * len(truth))
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    rng = random.Random(42)
+    centers = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(100)]
+    vectors = clustered(rng, centers, n)
+    queries = clustered(rng, centers, QUERIES)
+
+    print("=" * 60)
+    print(f"Nearest neighbours: {n:,} vectors of length {dim}, {QUERIES} queries, k={K}")
+    print("=" * 60)
+
+    flat, build = timed(vp.index.FlatIndex(dim, 'cosine').add, vectors)
+    truth, elapsed = timed(flat.search_batch, queries, K)
+    print(f"\n{'index':<22}{'build (s)':>10}{'queries/s':>12}{'recall@10':>11}")
+    print("-" * 55)
+    print(f"{'flat (exact)':<22}{build:>10.2f}{QUERIES / elapsed:>12.1f}{1.0:>11.3f}")
+
+    nlist = max(16, int(n ** 0.5) // 2)
+    ivf = vp.index.IVFIndex(dim, nlist=nlist, metric='cosine')
+    _, build = timed(lambda: ivf.train(vectors).add(vectors))
+    for nprobe in (1, 2, 4, 8, 16):
+        found, elapsed = timed(ivf.search_batch, queries, K, nprobe=nprobe)
+        label = f"ivf nlist={nlist} nprobe={nprobe}"
+        print(f"{label:<22}{build:>10.2f}{QUERIES / elapsed:>12.1f}{recall(found, truth):>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
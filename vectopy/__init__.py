@@ -3,9 +3,22 @@ VectoPy - A pure Python, educational implementation of a NumPy-like library for
 """
 
 from .core.arrays import VectoPyArray
-from .core.function_base import array, zeros, ones, full, arange
+from .core.function_base import array, frombuffer, memmap, zeros, ones, full, arange
+from .core.fileio import save, savez, load
+from .core.arithmetic import add, subtract, multiply, divide
+from .core.lazy import lazy, LazyArray
+from .core.parallel import set_parallel, get_parallel
+from .core.stream import stream, Stream
+from .core.ring import RingArray
+from .core.chunked import ChunkedArray
+from .core.batch import Batch
+from .core import stats, sketches, time_series, index
 
 
 __all__ = [
-    'VectoPyArray', 'array', 'zeros', 'ones', 'arange', 'full'
+    'VectoPyArray', 'array', 'frombuffer', 'memmap', 'zeros', 'ones', 'arange', 'full',
+    'save', 'savez', 'load', 'add', 'subtract', 'multiply', 'divide',
+    'lazy', 'LazyArray', 'set_parallel', 'get_parallel', 'stream', 'Stream',
+    'RingArray', 'ChunkedArray', 'Batch',
+    'stats', 'sketches', 'time_series', 'index'
 ]
\ No newline at end of file
@@ -1,3 +1,6 @@
+from array import array as _typed_array
+
+
 class ShapeError(Exception):
     """Raised for operations involving incompatible shapes."""
     pass
@@ -6,8 +9,50 @@ class DtypeError(Exception):
     """Raised for operations involving incompatible data types."""
     pass
 
+# Number of elements processed per step by chunked loops (bounds temporary memory).
+_CHUNK_SIZE = 1 << 16
+
+# Default array.array typecodes used to store each Python dtype.
+_DEFAULT_TYPECODES = {float: 'd', int: 'q'}
+
+# Every array.array typecode we accept as an explicit (possibly narrower) dtype.
+_TYPECODE_DTYPES = {
+    'b': int, 'B': int, 'h': int, 'H': int, 'i': int, 'I': int,
+    'l': int, 'L': int, 'q': int, 'Q': int, 'f': float, 'd': float,
+}
+
 def _check_same_shape(a, b):
     """Helper function to check if two arrays have the same shape."""
     if a.shape != b.shape:
         raise ShapeError(f"Operands must have the same shape. Got {a.shape} and {b.shape}.")
-    
+
+def _resolve_dtype(dtype):
+    """Split a dtype (a Python type or an array typecode) into (python type, typecode)."""
+    if isinstance(dtype, str):
+        if dtype not in _TYPECODE_DTYPES:
+            raise DtypeError(f"Unsupported typecode '{dtype}'.")
+        return _TYPECODE_DTYPES[dtype], dtype
+    return dtype, _DEFAULT_TYPECODES.get(dtype)
+
+def _itemsize(typecode):
+    """Bytes per element of an array.array typecode."""
+    return _typed_array(typecode).itemsize
+
+def _make_storage(typecode, dtype, buffer, size):
+    """Build the storage for an array: a typed array.array when possible, otherwise a list."""
+    if typecode is None:
+        return list(buffer) if buffer is not None else [dtype(0)] * size
+    if buffer is None:
+        # Repeating a one-element array fills the buffer in C without temporaries.
+        return _typed_array(typecode, [0]) * size
+    if isinstance(buffer, memoryview) and buffer.format == typecode:
+        # Copy straight from the (possibly strided) view without boxing elements.
+        return _typed_array(typecode, buffer.tobytes())
+    if not isinstance(buffer, (list, tuple, _typed_array)):
+        buffer = list(buffer)
+    try:
+        return _typed_array(typecode, buffer)
+    except (TypeError, OverflowError):
+        # Values that don't fit the machine type (floats in an int array after clip,
+        # ints beyond 64 bits) keep the original list-of-objects behaviour.
+        return list(buffer)
@@ -3,12 +3,33 @@ Algorithm implementations for VectoPyArray.
 """
 
 from .arrays import VectoPyArray
+from .statistics import _select
+from .sketches import MisraGries, HyperLogLog
+from collections import Counter
+from bisect import bisect_left, bisect_right
+from itertools import compress, groupby, repeat
+import heapq
+import operator
 
-def majority_element(self):
-    """Find majority element using Boyer-Moore algorithm."""
+def majority_element(self, approx=False, k=1024):
+    """Find majority element using Boyer-Moore algorithm.
+
+    With `approx=True` a single chunked pass feeds a Misra-Gries sketch of `k`
+    counters (Boyer-Moore is the k=1 case) and the verifying second pass is skipped:
+    the candidate is returned when its count, known to within len(array) / (k + 1),
+    can exceed half the array.
+    """
     if not self._data:
         raise ValueError("Cannot find majority element in empty array.")
     
+    if approx:
+        sketch = MisraGries(k, self)
+        # Every counter can cancel out on high-cardinality data: then nothing is a candidate
+        for candidate, count in sketch.most_common(1):
+            if count + sketch.error > len(self._data) // 2:
+                return candidate
+        raise ValueError("No majority element found.")
+    
     candidate = None
     count = 0
     
@@ -21,30 +42,187 @@ def majority_element(self):
         else:
             count -= 1
     
-    # Verify if candidate is actually majority
-    if self._data.count(candidate) > len(self._data) // 2:
+    # Verify if candidate is actually majority (countOf scans at C speed)
+    if operator.countOf(self._data, candidate) > len(self._data) // 2:
         return candidate
     else:
         raise ValueError("No majority element found.")
 
-def unique(self):
-    """Return unique elements in array."""
-    unique_data = list(set(self._data))
-    return VectoPyArray((len(unique_data),), dtype=self._dtype, buffer=unique_data)
+def unique(self, return_index=False, return_counts=False):
+    """Return unique elements in array (in sorted order when the array is known to be sorted).
+
+    `return_index` adds the index of each value's first occurrence and `return_counts`
+    how often it occurs, as int arrays aligned with the values (NumPy's order:
+    values, index, counts). Either one alone comes from a C-level hashing pass and
+    both together from a single dict pass, or from the run boundaries when the
+    array is known to be sorted.
+    """
+    data = self._data
+    if self._known('is_sorted'):
+        # Sorted data: equal values are adjacent, so one merge-style pass drops the repeats
+        if return_index or return_counts:
+            starts = [0] + list(compress(range(1, len(data)), map(operator.ne, data[1:], data))) if data else []
+            unique_data = [data[i] for i in starts]
+            counts = list(map(operator.sub, starts[1:] + [len(data)], starts))
+        else:
+            unique_data = [value for value, _ in groupby(data)]
+        result = VectoPyArray((len(unique_data),), dtype=self._typecode or self._dtype, buffer=unique_data)
+        result._remember('is_sorted', True)
+    elif return_index or return_counts:
+        # Values come out in order of first occurrence
+        if return_index and return_counts:
+            # One dict pass: each value maps to [first index, count]
+            seen = {}
+            for i, value in enumerate(data):
+                entry = seen.get(value)
+                if entry is None:
+                    seen[value] = [i, 1]
+                else:
+                    entry[1] += 1
+            unique_data = list(seen)
+            starts = [entry[0] for entry in seen.values()]
+            counts = [entry[1] for entry in seen.values()]
+        elif return_index:
+            # Scanning backwards, the last write for each value is its first index
+            first = dict(zip(reversed(data), range(len(data) - 1, -1, -1)))
+            starts = sorted(first.values())
+            unique_data = list(map(data.__getitem__, starts))
+        else:
+            counter = Counter(data)
+            unique_data = list(counter)
+            counts = list(counter.values())
+        result = VectoPyArray((len(unique_data),), dtype=self._typecode or self._dtype, buffer=unique_data)
+    else:
+        unique_data = list(set(data))
+        return VectoPyArray((len(unique_data),), dtype=self._typecode or self._dtype, buffer=unique_data)
+    if not (return_index or return_counts):
+        return result
+    extras = [result]
+    if return_index:
+        extras.append(VectoPyArray((len(starts),), dtype=int, buffer=starts))
+    if return_counts:
+        extras.append(VectoPyArray((len(counts),), dtype=int, buffer=counts))
+    return tuple(extras)
+
+def count_distinct(self, approx=False, p=14):
+    """Number of distinct values.
+
+    The exact count hashes every value into a set (or counts run boundaries when the
+    array is known to be sorted). With `approx=True` a HyperLogLog sketch of 2**p
+    registers is filled chunk by chunk instead, using 2**p bytes of memory for a
+    relative standard error of 1.04 / sqrt(2**p).
+    """
+    if approx:
+        return self._cached(('count_distinct', p), lambda: round(HyperLogLog(p, self).cardinality()))
+    return self._cached('count_distinct', lambda: _count_distinct(self._data, self._known('is_sorted')))
+
+def _count_distinct(data, is_sorted):
+    if is_sorted:
+        return operator.countOf(map(operator.ne, data[1:], data), True) + 1 if data else 0
+    return len(set(data))
+
+def is_sorted(self):
+    """Check if the array is in non-decreasing order (cached until the array is written)."""
+    # map() over two offset views compares neighbours in C and stops at the first descent
+    return self._cached('is_sorted', lambda: all(map(operator.le, self._data, self._data[1:])))
 
 def is_monotonic(self):
     """Check if array is monotonic (non-decreasing or non-increasing)."""
     if len(self._data) <= 1:
         return True
-    
-    increasing = all(self._data[i] <= self._data[i + 1] for i in range(len(self._data) - 1))
-    decreasing = all(self._data[i] >= self._data[i + 1] for i in range(len(self._data) - 1))
-    
-    return increasing or decreasing
+    # Each check stops at the first pair out of order
+    return self.is_sorted() or all(map(operator.ge, self._data, self._data[1:]))
+
+def sort(self):
+    """Return a sorted copy of the array, flagged as sorted."""
+    result = VectoPyArray(self.shape, dtype=self._typecode or self._dtype, buffer=sorted(self._data))
+    result._remember('is_sorted', True)
+    return result
+
+def argsort(self):
+    """Return the indices that would sort the array (stable for equal values)."""
+    order = sorted(range(len(self._data)), key=self._data.__getitem__)
+    return VectoPyArray((len(order),), dtype=int, buffer=order)
+
+def searchsorted(self, values, side='left'):
+    """Indices where `values` would be inserted to keep this sorted array in order.
+
+    `values` may be a single number (returns an int) or a sequence/array of query
+    keys (returns an int array), answered by binary search in O(log n) each.
+    """
+    if side not in ('left', 'right'):
+        raise ValueError(f"side must be 'left' or 'right', got '{side}'.")
+    search = bisect_left if side == 'left' else bisect_right
+    if isinstance(values, (int, float)):
+        return search(self._data, values)
+    keys = values._data if isinstance(values, VectoPyArray) else values
+    positions = list(map(search, repeat(self._data), keys))
+    return VectoPyArray((len(positions),), dtype=int, buffer=positions)
+
+def contains(self, value):
+    """Membership test; O(log n) when the array is known to be sorted."""
+    if self._known('is_sorted'):
+        index = bisect_left(self._data, value)
+        return index < len(self._data) and self._data[index] == value
+    return value in self._data
+
+def count_range(self, low, high):
+    """Number of elements with low <= x <= high; O(log n) when the array is known to be sorted."""
+    if self._known('is_sorted'):
+        return max(bisect_right(self._data, high) - bisect_left(self._data, low), 0)
+    return sum(1 for x in self._data if low <= x <= high)
+
+def top_k(self, k, largest=True):
+    """The k largest (or smallest) values, best first, using a size-k heap: O(n log k)."""
+    if k <= 0:
+        raise ValueError("k must be positive.")
+    if self._known('is_sorted'):
+        values = self._data[::-1][:k] if largest else self._data[:k]
+        values = list(values)
+    else:
+        values = (heapq.nlargest if largest else heapq.nsmallest)(k, self._data)
+    return VectoPyArray((len(values),), dtype=self._typecode or self._dtype, buffer=values)
+
+def argpartition(self, k):
+    """Indices that put the k-th smallest element at position k, smaller ones before it
+    and larger ones after it (each side in no particular order), in O(n) expected time."""
+    n = len(self._data)
+    if not -n <= k < n:
+        raise IndexError(f"k={k} is out of bounds for an array of length {n}.")
+    k %= n
+    pivot = _select(self._data, [k])[k]
+    data = self._data
+    # compress() over index ranges builds each group in C, without a Python-level loop
+    order = list(compress(range(n), map(operator.lt, data, repeat(pivot))))
+    order += compress(range(n), map(operator.eq, data, repeat(pivot)))
+    order += compress(range(n), map(operator.gt, data, repeat(pivot)))
+    return VectoPyArray((n,), dtype=int, buffer=order)
 
+def argmax(self):
+    """Index of the first occurrence of the maximum value."""
+    if not len(self._data):
+        raise ValueError("Cannot find argmax of empty array.")
+    return operator.indexOf(self._data, self.max())
 
+def argmin(self):
+    """Index of the first occurrence of the minimum value."""
+    if not len(self._data):
+        raise ValueError("Cannot find argmin of empty array.")
+    return operator.indexOf(self._data, self.min())
 
 # Attach methods to VectoPyArray
 VectoPyArray.majority_element = majority_element
 VectoPyArray.unique = unique
+VectoPyArray.count_distinct = count_distinct
+VectoPyArray.is_sorted = is_sorted
 VectoPyArray.is_monotonic = is_monotonic
+VectoPyArray.sort = sort
+VectoPyArray.argsort = argsort
+VectoPyArray.searchsorted = searchsorted
+VectoPyArray.contains = contains
+VectoPyArray.__contains__ = contains
+VectoPyArray.count_range = count_range
+VectoPyArray.top_k = top_k
+VectoPyArray.argpartition = argpartition
+VectoPyArray.argmax = argmax
+VectoPyArray.argmin = argmin
@@ -0,0 +1,26 @@
+"""
+Element-wise arithmetic functions with optional output buffers.
+
+`vp.add(a, b, out=c)` is `a + b` written into the preallocated array `c`
+instead of a new array, so update loops can reuse their result memory.
+`workers=` overrides the default set with `vp.set_parallel()` for one call.
+"""
+
+import operator
+
+
+def add(a, b, out=None, workers=None):
+    """Element-wise a + b, stored in `out` if given."""
+    return a._element_wise_operation(b, operator.add, out=out, workers=workers)
+
+def subtract(a, b, out=None, workers=None):
+    """Element-wise a - b, stored in `out` if given."""
+    return a._element_wise_operation(b, operator.sub, out=out, workers=workers)
+
+def multiply(a, b, out=None, workers=None):
+    """Element-wise a * b, stored in `out` if given."""
+    return a._element_wise_operation(b, operator.mul, out=out, workers=workers)
+
+def divide(a, b, out=None, workers=None):
+    """Element-wise a / b (always float), stored in `out` if given."""
+    return a._element_wise_operation(b, operator.truediv, out=out, workers=workers)
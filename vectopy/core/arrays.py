@@ -1,4 +1,18 @@
-from ._internals import ShapeError, DtypeError, _check_same_shape
+import operator
+import sys
+from collections import namedtuple
+from collections.abc import Sequence
+
+from array import array as _typed_array
+
+from ._internals import (ShapeError, DtypeError, _CHUNK_SIZE, _check_same_shape,
+                         _resolve_dtype, _make_storage)
+from .kernels import get_kernel
+from . import parallel
+
+_BYTEORDER = '<' if sys.byteorder == 'little' else '>'
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize', 'version'])
 
 class VectoPyArray:
   """The core 1-dimensional array object."""
@@ -7,9 +21,144 @@ class VectoPyArray:
     if len(shape) != 1:
       raise ShapeError("VectoPyArray only supports 1-dimensional arrays.")
     self._shape = tuple(shape)
-    self._dtype = dtype
+    self._dtype, self._typecode = _resolve_dtype(dtype)
     self._size = shape[0]
-    self._data = list(buffer) if buffer is not None else [dtype(0)] * self._size
+    self._buffer = _make_storage(self._typecode, self._dtype, buffer, self._size)
+    # Values that could not be packed fall back to a list, which has no typecode.
+    self._typecode = getattr(self._buffer, 'typecode', None)
+    # Typed data is always read through a memoryview so slices can share it.
+    self._data = memoryview(self._buffer) if self._typecode else self._buffer
+    self._base = None
+    self._offset = 0
+    self._stride = 1
+    self._version = 0
+    self._tracked = True
+    self._cache = None
+
+  @classmethod
+  def _from_memory(cls, data, dtype, buffer, base=None, offset=0, stride=1, tracked=True):
+    """Wrap a typed memoryview `data` over `buffer` without copying it.
+
+    Pass `tracked=False` when other code can write the memory behind our back
+    (user buffers, memory maps), so reductions over it are never memoized.
+    """
+    arr = cls.__new__(cls)
+    arr._data = data
+    arr._shape = (len(data),)
+    arr._dtype = dtype
+    arr._typecode = data.format
+    arr._size = arr._shape[0]
+    arr._buffer = buffer
+    arr._base = base
+    arr._offset = offset
+    arr._stride = stride
+    arr._version = 0
+    arr._tracked = tracked
+    arr._cache = None
+    return arr
+
+  @classmethod
+  def _from_storage(cls, dtype, storage):
+    """Adopt a freshly built typed array (no copy) or list as a new owning array."""
+    if isinstance(storage, _typed_array):
+      return cls._from_memory(memoryview(storage), dtype, storage)
+    return cls((len(storage),), dtype, buffer=storage)
+
+  @classmethod
+  def _from_chunks(cls, dtype, chunks):
+    """Build an owning array from an iterable of element lists, one chunk at a time."""
+    py_type, typecode = _resolve_dtype(dtype)
+    storage = _typed_array(typecode) if typecode else []
+    for chunk in chunks:
+      if typecode:
+        try:
+          storage.fromlist(chunk)
+          continue
+        except (TypeError, OverflowError):
+          # fromlist is atomic, so nothing of this chunk was stored yet
+          storage, typecode = storage.tolist(), None
+      storage.extend(chunk)
+    return cls._from_storage(py_type, storage)
+
+  def _chunks(self, size=_CHUNK_SIZE):
+    """Yield consecutive pieces of the data, at most `size` elements each (views when typed)."""
+    data = self._data
+    for start in range(0, self._size, size):
+      yield data[start:start + size]
+
+  def _view(self, index):
+    """Return a VectoPyArray sharing this array's buffer for the slice `index`."""
+    start, _, step = index.indices(self._size)
+    return VectoPyArray._from_memory(
+      self._data[index], self._dtype, self._buffer,
+      base=self if self._base is None else self._base,
+      offset=self._offset + start * self._stride,
+      stride=self._stride * step,
+      tracked=self._tracked,
+    )
+
+  # ---- Memoized reductions ----
+  # The array owning the memory keeps a version counter that every write through
+  # VectoPyArray (in-place operators, out=, `.data[...] = x`) bumps, whether it goes
+  # through the owner or through one of its views. Each array memoizes its own
+  # reduction results together with the version they were computed at.
+
+  def _root(self):
+    return self if self._base is None else self._base
+
+  def _touch(self):
+    """Record a write to the memory: results cached by this array and its views go stale."""
+    self._root()._version += 1
+
+  def _current_cache(self):
+    """This array's cache, emptied if the memory was written since it was filled."""
+    cache = self._cache
+    version = self._root()._version
+    if cache is None:
+      cache = self._cache = _ReductionCache()
+    if cache.version != version:
+      cache.values.clear()
+      cache.version = version
+    return cache
+
+  def _cached(self, key, compute):
+    """Return the memoized value of `compute()` for `key`, recomputing it after any write."""
+    if not self._root()._tracked:
+      return compute()
+    cache = self._current_cache()
+    if key in cache.values:
+      cache.hits += 1
+      return cache.values[key]
+    cache.misses += 1
+    value = cache.values[key] = compute()
+    return value
+
+  def _remember(self, key, value):
+    """Store a by-product of another computation (e.g. the mean found while computing std)."""
+    if self._root()._tracked:
+      self._current_cache().values.setdefault(key, value)
+
+  def _known(self, key):
+    """The cached value for `key` if it is still valid, else None; never computes anything."""
+    if not self._root()._tracked or self._cache is None or self._cache.version != self._root()._version:
+      return None
+    return self._cache.values.get(key)
+
+  @property
+  def version(self):
+    """Number of writes made to this array's memory through VectoPy (views share it)."""
+    return self._root()._version
+
+  def cache_info(self):
+    """Hits, misses and size of this array's reduction cache, and the current version."""
+    cache = self._cache or _ReductionCache()
+    currsize = len(cache.values) if cache.version == self.version else 0
+    return CacheInfo(cache.hits, cache.misses, currsize, self.version)
+
+  def cache_clear(self):
+    """Drop the memoized reductions and reset the hit/miss counters (also for views sharing the memory)."""
+    self._cache = None
+    self._touch()
 
   @property
   def shape(self):
@@ -18,62 +167,272 @@ class VectoPyArray:
   @property
   def dtype(self):
     return self._dtype
+
+  @property
+  def typecode(self):
+    """The array.array typecode of the storage, or None for object storage."""
+    return self._typecode
+
+  @property
+  def itemsize(self):
+    """Size in bytes of one element of the storage."""
+    return self._data.itemsize if self._typecode else 8
+
+  @property
+  def nbytes(self):
+    """Total bytes used by the elements of the array."""
+    return self._size * self.itemsize
+
+  @property
+  def readonly(self):
+    """True if the array wraps memory that cannot be written (e.g. bytes)."""
+    return self._typecode is not None and self._data.readonly
+
+  @property
+  def base(self):
+    """The array owning the memory if this array is a view, otherwise None."""
+    return self._base
+
+  @property
+  def offset(self):
+    """Index of this array's first element inside the base array."""
+    return self._offset
+
+  @property
+  def strides(self):
+    """Bytes to step in memory to move to the next element."""
+    return (self._stride * self.itemsize,)
   
   @property
   def data(self):
-    """Direct access to the underlying Python list. For educational purposee."""
-    return self._data
+    """Direct, writable access to the underlying elements. For educational purposes."""
+    return _DataView(self)
   
   def __str__(self):
-    return f"VectoPyArray({self._data}, dtype={self._dtype})"
+    return f"VectoPyArray({list(self._data)}, dtype={self._dtype})"
   
   def __repr__(self):
     return self.__str__()
   
   def __len__(self):
     return self._size
+
+  def __iter__(self):
+    return iter(self._data)
   
   def __getitem__(self, index):
     if isinstance(index, slice):
-      # Return a new VectoPyArray for slices
-      return VectoPyArray((len(self._data[index]),), self._dtype, buffer=self._data[index])
+      if self._typecode:
+        # Typed slices are views sharing our buffer: no element is copied
+        return self._view(index)
+      sliced = self._data[index]
+      return VectoPyArray((len(sliced),), self._dtype, buffer=sliced)
     return self._data[index]
+
+  def flush(self):
+    """Write pending changes of a memory-mapped array to disk (no-op for in-memory arrays)."""
+    flush = getattr(self._buffer, 'flush', None)
+    if flush is not None and not self.readonly:
+      flush()
+
+  def copy(self):
+    """Return a new array owning a contiguous copy of the data."""
+    return VectoPyArray(self.shape, self._typecode or self._dtype, buffer=self._data)
+
+  def _export(self):
+    """Hand out our memory: VectoPy no longer sees every write to it, so stop caching reductions."""
+    self._root()._tracked = False
+    self._root()._cache = None
+
+  def to_memoryview(self):
+    """Return a memoryview sharing the array's memory (no copy).
+
+    Code holding it can write behind VectoPy's back, so from then on reductions
+    over this memory (and its views) are no longer cached.
+    """
+    if not self._typecode:
+      raise DtypeError("Arrays in object storage do not expose a buffer.")
+    self._export()
+    return self._data
+
+  def __buffer__(self, flags):
+    # Python 3.12+ buffer protocol: lets memoryview(arr), bytes(arr), etc. share our memory
+    return self.to_memoryview()
+
+  def tobytes(self):
+    """Return the raw bytes of the elements, in memory order of the array."""
+    if not self._typecode:
+      raise DtypeError("Arrays in object storage do not expose a buffer.")
+    return self._data.tobytes()
+
+  @property
+  def __array_interface__(self):
+    """NumPy array interface (version 3) describing our memory, for zero-copy interop."""
+    if not self._typecode:
+      raise AttributeError("Arrays in object storage do not expose an array interface.")
+    kind = 'f' if self._dtype is float else ('u' if self._typecode.isupper() else 'i')
+    interface = {
+      'version': 3,
+      'shape': self._shape,
+      'typestr': f"{_BYTEORDER}{kind}{self.itemsize}",
+    }
+    self._export()
+    if self._stride == 1:
+      interface['data'] = self._data
+    else:
+      # Strided views describe the base buffer plus a byte offset and strides
+      interface['data'] = self._base._data
+      interface['offset'] = self._offset * self.itemsize
+      interface['strides'] = self.strides
+    return interface
   
   def __eq__(self, other):
     if not isinstance(other, VectoPyArray):
       return False
-    return self._data == other.data and self._dtype == other.dtype
+    return self._dtype == other.dtype and _equal_items(self._data, other._data)
   
-  def _element_wise_operation(self, other, op):
-    """Helper for element-wise operations."""
+  def _element_wise_operation(self, other, op, out=None, workers=None):
+    """Helper for element-wise operations; writes into `out` instead of allocating if given."""
     if isinstance(other, (int, float)):
-      result_data = [op(x, other) for x in self._data]
-      # Determine appropriate dtype for result
-      result_dtype = float if(isinstance(other, float) or self._dtype is float) else self._dtype
-      return VectoPyArray(self.shape, dtype=result_dtype, buffer=result_data)
+      operand, other_dtype, scalar = other, (float if isinstance(other, float) else int), True
     elif isinstance(other, VectoPyArray):
       _check_same_shape(self, other)
-      result_data = [op(x, y) for x, y in zip(self._data, other.data)]
-      #Determinig the resulting dtype: float if eaither operand is float
-      result_dtype = float if (self._dtype is float or other.dtype is float) else self._dtype
-      return VectoPyArray(self.shape, dtype=result_dtype, buffer=result_data)
+      operand, other_dtype, scalar = other._data, other.dtype, False
     else:
       raise TypeError(f"Unsupported operand type(s): 'VectoPyArray' and '{type(other).__name__}'")
+    # The kernel also decides the result dtype: float if either operand is float
+    kernel = get_kernel(op, self._dtype, other_dtype, scalar)
+    # Large arrays may be split across worker processes (see vp.set_parallel)
+    storage = parallel.elementwise(self, other, op, kernel.dtype, workers)
+    if storage is None:
+      storage = kernel(self._data, operand, out._typecode if out is not None else None)
+    if out is None:
+      return VectoPyArray._from_storage(kernel.dtype, storage)
+    return out._write(storage, kernel.dtype)
+
+  def _write(self, values, dtype):
+    """Store a full-length sequence of `dtype` values into this array's own memory."""
+    if self._root().readonly:
+      raise ValueError("array is read-only")
+    if len(values) != self._size:
+      raise ShapeError(f"Output must have shape ({len(values)},). Got {self.shape}.")
+    if dtype is float and self._dtype is not float:
+      raise DtypeError(f"Cannot store float results in an array of dtype {self._dtype.__name__}.")
+    if self._typecode:
+      if getattr(values, 'typecode', None) != self._typecode:
+        try:
+          values = _typed_array(self._typecode, values)
+        except (TypeError, OverflowError):
+          raise DtypeError(f"Results do not fit in an array of dtype {self._dtype.__name__} "
+                           f"(typecode '{self._typecode}').")
+      self._data[:] = values
+    else:
+      self._data[:] = list(values)
+    self._touch()
+    return self
     
+  def _operator(self, other, op, out=None):
+    """Operator entry point: defer to the other operand's reflected method for unknown types."""
+    if not isinstance(other, (int, float, VectoPyArray)):
+      return NotImplemented
+    return self._element_wise_operation(other, op, out=out)
+
   def __add__(self, other):
-    return self._element_wise_operation(other, lambda x, y: x + y)
+    return self._operator(other, operator.add)
   
   def __sub__(self, other):
-    return self._element_wise_operation(other, lambda x, y: x - y)
+    return self._operator(other, operator.sub)
   
   def __mul__(self, other):
-    return self._element_wise_operation(other, lambda x, y: x * y)
+    return self._operator(other, operator.mul)
   
   def __truediv__(self, other):
-    result = self._element_wise_operation(other, lambda x, y: x / y)
-    return VectoPyArray(self.shape, dtype=float, buffer=result.data)
+    return self._operator(other, operator.truediv)
+
+  def __iadd__(self, other):
+    return self._operator(other, operator.add, out=self)
+
+  def __isub__(self, other):
+    return self._operator(other, operator.sub, out=self)
 
-  def dot(self, other):
+  def __imul__(self, other):
+    return self._operator(other, operator.mul, out=self)
+
+  def __itruediv__(self, other):
+    return self._operator(other, operator.truediv, out=self)
+
+  def dot(self, other, workers=None):
     """Dot product of two arrays."""
     _check_same_shape(self, other)
-    return sum(x * y for x, y in zip(self._data, other.data))
\ No newline at end of file
+    result = parallel.dot(self, other, workers)
+    if result is not None:
+      return result
+    return sum(map(operator.mul, self._data, other._data))
+
+
+def _equal_items(a, b):
+  """Element-wise equality of two storages, regardless of their container types."""
+  if isinstance(a, memoryview) and isinstance(b, memoryview):
+    return a == b
+  return len(a) == len(b) and all(x == y for x, y in zip(a, b))
+
+
+class _ReductionCache:
+  """Memoized reduction results of one array, valid for one version of its memory."""
+
+  def __init__(self):
+    self.values = {}
+    self.version = 0
+    self.hits = 0
+    self.misses = 0
+
+
+class _DataView(Sequence):
+  """A live, list-like window onto an array's storage, returned by `VectoPyArray.data`."""
+
+  def __init__(self, owner):
+    self._owner = owner
+
+  def __len__(self):
+    return len(self._owner._data)
+
+  def __iter__(self):
+    return iter(self._owner._data)
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return list(self._owner._data[index])
+    return self._owner._data[index]
+
+  def __setitem__(self, index, value):
+    owner = self._owner
+    if owner._root().readonly:
+      raise ValueError("array is read-only")
+    if isinstance(index, slice):
+      value = list(value)
+      expected = len(range(*index.indices(len(owner._data))))
+      if len(value) != expected:
+        raise ShapeError(f"Cannot assign {len(value)} values to a slice of {expected} elements.")
+    if owner._typecode:
+      # Pack first so values that don't fit raise before anything is written
+      try:
+        packed = _typed_array(owner._typecode, value if isinstance(index, slice) else [value])
+      except (TypeError, OverflowError):
+        raise DtypeError(f"Cannot store {value!r} in an array of dtype {owner._dtype.__name__} "
+                         f"(typecode '{owner._typecode}').")
+      value = packed if isinstance(index, slice) else packed[0]
+    owner._data[index] = value
+    owner._touch()
+
+  def __eq__(self, other):
+    if isinstance(other, (list, _DataView)):
+      return _equal_items(self, other)
+    return NotImplemented
+
+  def __repr__(self):
+    return repr(self.tolist())
+
+  def tolist(self):
+    """Return the elements as a new Python list."""
+    data = self._owner._data
+    return data.tolist() if isinstance(data, memoryview) else list(data)
@@ -0,0 +1,203 @@
+"""
+Many same-length vectors in one contiguous buffer.
+
+A Batch stores N vectors of length d row after row in a single typed
+`array.array`, instead of N separate VectoPyArrays each with its own buffer
+and object overhead. Row-wise operations (`dot` against a query, pairwise
+dots, `normalize`, `minmax_scale`, `mean`, `std`) walk zero-copy memoryview
+slices of that buffer with C-level maps, and `batch[i]` is a VectoPyArray
+view of one row that shares the buffer (writes through it are visible in
+the batch and invalidate cached reductions as usual).
+"""
+
+import math
+import operator
+from array import array as _typed_array
+from itertools import repeat
+
+from .arrays import VectoPyArray
+from ._internals import ShapeError, DtypeError, _resolve_dtype
+
+
+class Batch:
+    """N vectors of the same length d, stored row after row in one typed buffer."""
+
+    def __init__(self, rows, dtype=float):
+        py_type, typecode = _resolve_dtype(dtype)
+        if typecode is None:
+            raise DtypeError(f"Batch needs a numeric dtype with a typed buffer, got {dtype}.")
+        storage = _typed_array(typecode)
+        dim = None
+        for i, row in enumerate(rows):
+            start = len(storage)
+            try:
+                storage.fromlist(list(row))
+            except (TypeError, OverflowError):
+                raise DtypeError(f"Row {i} has values that do not fit the '{typecode}' buffer.")
+            if dim is None:
+                dim = len(storage)
+            elif len(storage) - start != dim:
+                raise ShapeError(f"All rows must have length {dim}, got {len(storage) - start} for row {i}.")
+        if not dim:
+            raise ValueError("Cannot create a Batch without rows or with empty rows.")
+        self._flat = VectoPyArray._from_storage(py_type, storage)
+        self._dim = dim
+
+    @classmethod
+    def from_flat(cls, values, dim):
+        """A Batch of rows of length `dim` over a flat array (shared, not copied, when typed)."""
+        if not isinstance(values, VectoPyArray):
+            values = VectoPyArray((len(values),), dtype=float, buffer=values)
+        if values.typecode is None:
+            raise DtypeError("Batch needs values stored in a typed buffer.")
+        if dim <= 0 or len(values) % dim:
+            raise ShapeError(f"Cannot split {len(values)} values into rows of length {dim}.")
+        return cls._wrap(values, dim)
+
+    @classmethod
+    def _wrap(cls, flat, dim):
+        batch = cls.__new__(cls)
+        batch._flat = flat
+        batch._dim = dim
+        return batch
+
+    @property
+    def shape(self):
+        return (len(self), self._dim)
+
+    @property
+    def dim(self):
+        return self._dim
+
+    @property
+    def dtype(self):
+        return self._flat.dtype
+
+    @property
+    def typecode(self):
+        return self._flat.typecode
+
+    @property
+    def flat(self):
+        """All values, row after row, as one VectoPyArray sharing the buffer."""
+        return self._flat
+
+    def __len__(self):
+        return len(self._flat) // self._dim
+
+    def __repr__(self):
+        return f"Batch(shape={self.shape}, dtype={self.dtype})"
+
+    # ---- Rows ----
+
+    def _rows(self):
+        """Memoryview slices of the rows (no copies)."""
+        data, d = self._flat._data, self._dim
+        end = len(data)
+        return map(data.__getitem__, map(slice, range(0, end, d), range(d, end + d, d)))
+
+    def __getitem__(self, index):
+        n, d = len(self), self._dim
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step != 1:
+                return Batch(map(self.__getitem__, range(start, stop, step)), self.typecode)
+            stop = max(start, stop)
+            if stop == start:
+                raise ValueError("Cannot create an empty Batch.")
+            return Batch._wrap(self._flat[start * d:stop * d], d)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("Batch index out of range.")
+        return self._flat[index * d:(index + 1) * d]
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+    def tolist(self):
+        """The rows as a list of lists."""
+        return list(map(list, self._rows()))
+
+    # ---- Batched products ----
+
+    def _vector(self, query):
+        values = query._data if isinstance(query, VectoPyArray) else list(query)
+        if len(values) != self._dim:
+            raise ShapeError(f"Query must have length {self._dim}, got {len(values)}.")
+        return values
+
+    def _product_dtype(self, values):
+        if self.dtype is int and all(isinstance(x, int) for x in values):
+            return int
+        return float
+
+    def dot(self, query):
+        """Dot product of every row with `query`, as a VectoPyArray of length N."""
+        query = self._vector(query)
+        # map(map, ...) pairs each row with the query; sum() then reduces each product stream in C
+        dots = list(map(sum, map(map, repeat(operator.mul), self._rows(), repeat(query))))
+        return VectoPyArray._from_chunks(self._product_dtype(query), [dots])
+
+    def pairwise_dots(self, other=None):
+        """Dot products of every row with every row of `other` (default: itself), as an N x M Batch."""
+        other = self if other is None else other
+        if other.dim != self._dim:
+            raise ShapeError(f"Rows must have the same length. Got {self._dim} and {other.dim}.")
+        columns = list(other._rows())
+        dtype = int if self.dtype is int and other.dtype is int else float
+        storage = _typed_array(_resolve_dtype(dtype)[1])
+        for row in self._rows():
+            storage.fromlist(list(map(sum, map(map, repeat(operator.mul), repeat(row), columns))))
+        return Batch._wrap(VectoPyArray._from_storage(dtype, storage), len(columns))
+
+    # ---- Row-wise statistics and scaling ----
+
+    def _row_values(self, values):
+        return VectoPyArray._from_chunks(float, [values])
+
+    def sum(self):
+        """Sum of each row."""
+        return VectoPyArray._from_chunks(self.dtype, [list(map(sum, self._rows()))])
+
+    def mean(self):
+        """Mean of each row."""
+        return self._row_values(list(map(operator.truediv, map(sum, self._rows()), repeat(self._dim))))
+
+    def std(self):
+        """Standard deviation (population, like VectoPyArray.std) of each row."""
+        return self._row_values([math.sqrt(m2 / self._dim) for _, m2 in self._moments()])
+
+    def _moments(self):
+        """(deviations from the mean, sum of squared deviations) of each row."""
+        d = self._dim
+        for row in self._rows():
+            deviations = list(map(operator.sub, row, repeat(sum(row) / d, d)))
+            yield deviations, sum(map(operator.mul, deviations, deviations))
+
+    def normalize(self):
+        """Normalize every row to mean 0 and standard deviation 1 (constant rows become 0.0)."""
+        if self._dim < 2:
+            raise ValueError("Normalization requires at least two elements per row.")
+        d = self._dim
+        storage = _typed_array('d')
+        for deviations, m2 in self._moments():
+            sigma = math.sqrt(m2 / d)
+            if sigma == 0:
+                storage.fromlist([0.0] * d)
+            else:
+                storage.fromlist(list(map(operator.truediv, deviations, repeat(sigma, d))))
+        return Batch._wrap(VectoPyArray._from_storage(float, storage), d)
+
+    def minmax_scale(self):
+        """Scale every row to [0, 1] by its own min and max (constant rows become 0.5)."""
+        d = self._dim
+        storage = _typed_array('d')
+        for row in self._rows():
+            low, high = min(row), max(row)
+            if low == high:
+                storage.fromlist([0.5] * d)
+            else:
+                shifted = map(operator.sub, row, repeat(low, d))
+                storage.fromlist(list(map(operator.truediv, shifted, repeat(high - low, d))))
+        return Batch._wrap(VectoPyArray._from_storage(float, storage), d)
@@ -0,0 +1,230 @@
+"""
+Growable arrays made of fixed-size typed chunks.
+
+A ChunkedArray stores its values in a list of `array.array` chunks of
+`chunk_size` elements. Appending only ever grows the last chunk (amortized
+O(1), like a list) and starts a new one when it is full, so values already
+stored are never copied again. Reductions and scans run chunk by chunk and
+stitch their results at the boundaries; `consolidate()` copies everything into
+one contiguous VectoPyArray when a flat buffer is needed.
+"""
+
+import operator
+from array import array as _typed_array
+from itertools import accumulate, chain, islice
+
+from .arrays import VectoPyArray
+from .stats import RunningStats, Description
+from .statistics import _interpolated_quantiles, _select_chunks
+from ._internals import _CHUNK_SIZE, _resolve_dtype
+
+
+def _pack(typecode, values):
+    """A typed chunk holding `values`, or a list when they do not fit the typecode."""
+    if typecode:
+        try:
+            return _typed_array(typecode, values)
+        except (TypeError, OverflowError):
+            pass
+    return list(values)
+
+
+class ChunkedArray:
+    """A 1-dimensional array with amortized O(1) append, stored as fixed-size chunks."""
+
+    def __init__(self, values=(), dtype=float, chunk_size=_CHUNK_SIZE):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        self._dtype, self._typecode = _resolve_dtype(dtype)
+        self._chunk_size = chunk_size
+        self._chunk_list = []
+        self._size = 0
+        self.extend(values)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def shape(self):
+        return (self._size,)
+
+    @property
+    def chunk_size(self):
+        return self._chunk_size
+
+    @property
+    def num_chunks(self):
+        return len(self._chunk_list)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return (f"ChunkedArray(length={self._size}, chunks={len(self._chunk_list)}, "
+                f"dtype={self._dtype})")
+
+    # ---- Growing ----
+
+    def _tail(self):
+        """The chunk new values go into, starting a new one when the last is full."""
+        if not self._chunk_list or len(self._chunk_list[-1]) == self._chunk_size:
+            self._chunk_list.append(_pack(self._typecode, []))
+        return self._chunk_list[-1]
+
+    def append(self, value):
+        """Add one value at the end, in amortized O(1)."""
+        tail = self._tail()
+        try:
+            tail.append(value)
+        except (TypeError, OverflowError):
+            # Like VectoPyArray, values that do not fit fall back to object storage
+            self._chunk_list[-1] = tail = tail.tolist()
+            tail.append(value)
+        self._size += 1
+
+    def extend(self, values):
+        """Add every value of an iterable at the end, filling chunks in bulk."""
+        values = iter(values)
+        while True:
+            tail = self._tail()
+            piece = list(islice(values, self._chunk_size - len(tail)))
+            if not piece:
+                if not tail:
+                    self._chunk_list.pop()
+                return
+            try:
+                if isinstance(tail, list):
+                    tail.extend(piece)
+                else:
+                    tail.fromlist(piece)
+            except (TypeError, OverflowError):
+                # fromlist is atomic, so nothing of this piece was stored yet
+                self._chunk_list[-1] = tail = tail.tolist()
+                tail.extend(piece)
+            self._size += len(piece)
+
+    # ---- Reading ----
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunk_list)
+
+    def _chunks(self):
+        """The stored chunks, like `VectoPyArray._chunks()` (RunningStats and the sketches read these)."""
+        return iter(self._chunk_list)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                return self.consolidate()[index]
+            return self._range(start, max(start, stop))
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ChunkedArray index out of range.")
+        return self._chunk_list[index // self._chunk_size][index % self._chunk_size]
+
+    def _range(self, start, stop):
+        """Copy of the elements start..stop, gathering only the chunks they cover."""
+        pieces = []
+        for i in range(start // self._chunk_size, -(-stop // self._chunk_size)):
+            base = i * self._chunk_size
+            pieces.append(self._chunk_list[i][max(start - base, 0):stop - base])
+        return _join(self._dtype, self._typecode, pieces)
+
+    def consolidate(self):
+        """Copy all values into one contiguous VectoPyArray."""
+        return _join(self._dtype, self._typecode, self._chunk_list)
+
+    # ---- Reductions, one chunk at a time ----
+
+    def _require_data(self, what):
+        if not self._size:
+            raise ValueError(f"Cannot compute {what} of empty array.")
+
+    def sum(self):
+        """Sum of all elements."""
+        total = self._dtype(0)
+        for chunk in self._chunk_list:
+            total += sum(chunk)
+        return total
+
+    def min(self):
+        """Minimum value."""
+        self._require_data('minimum')
+        return min(map(min, self._chunk_list))
+
+    def max(self):
+        """Maximum value."""
+        self._require_data('maximum')
+        return max(map(max, self._chunk_list))
+
+    def mean(self):
+        """Mean of the elements."""
+        self._require_data('mean')
+        return self.sum() / self._size
+
+    def running_stats(self):
+        """Mergeable summary (count/mean/variance/std/min/max), one chunk at a time."""
+        stats = RunningStats()
+        for chunk in self._chunk_list:
+            stats.update(chunk)
+        return stats
+
+    def std(self):
+        """Standard deviation of the elements."""
+        self._require_data('standard deviation')
+        return self.running_stats().std
+
+    def describe(self, quantiles=(0.25, 0.5, 0.75), method='linear'):
+        """Summary statistics like `VectoPyArray.describe`, without consolidating the chunks."""
+        self._require_data('summary statistics')
+        quantiles = tuple(quantiles)
+        select = lambda wanted: _select_chunks(self._chunks, self._size, wanted)
+        return Description(self.running_stats(), quantiles,
+                           _interpolated_quantiles(self._size, quantiles, method, select))
+
+    # ---- Scans, stitched across chunk boundaries ----
+
+    def _like(self, dtype, chunks):
+        result = ChunkedArray(dtype=dtype, chunk_size=self._chunk_size)
+        result._chunk_list = chunks
+        result._size = sum(map(len, chunks))
+        return result
+
+    def diff(self):
+        """Differences between consecutive elements, as a new ChunkedArray."""
+        if self._size < 2:
+            raise ValueError("Need at least 2 elements for differences.")
+        chunks = []
+        for i, chunk in enumerate(self._chunk_list):
+            result = list(map(operator.sub, chunk[1:], chunk))
+            if i + 1 < len(self._chunk_list):
+                # Stitch the difference across the chunk boundary
+                result.append(self._chunk_list[i + 1][0] - chunk[-1])
+            if result:
+                chunks.append(_pack(self._typecode, result))
+        return self._like(self._typecode or self._dtype, chunks)
+
+    def cumulative_sum(self):
+        """Running total of the elements, as a new ChunkedArray with the same chunks."""
+        chunks = []
+        current_sum = self._dtype(0)
+        for chunk in self._chunk_list:
+            sums = accumulate(chunk, initial=current_sum)
+            next(sums)
+            result = list(sums)
+            current_sum = result[-1]
+            chunks.append(_pack(self._typecode, result))
+        return self._like(self._typecode or self._dtype, chunks)
+
+
+def _join(dtype, typecode, pieces):
+    """Concatenate chunks into one owning VectoPyArray (a memcpy per typed chunk)."""
+    if typecode and all(isinstance(piece, _typed_array) for piece in pieces):
+        storage = _typed_array(typecode)
+        for piece in pieces:
+            storage.extend(piece)
+        return VectoPyArray._from_storage(dtype, storage)
+    return VectoPyArray._from_chunks(dtype, (list(piece) for piece in pieces))
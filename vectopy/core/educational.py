@@ -6,14 +6,22 @@ from .arrays import VectoPyArray
 
 def explain(self):
     """Explain the array's properties and internals."""
-    itemsize = 8 if self._dtype is float else 4
+    itemsize = self.itemsize
+    if self.typecode is None:
+        storage = f"Elements are Python {self._dtype.__name__} objects (pointer size shown)."
+    else:
+        storage = f"Elements are packed C values with typecode '{self.typecode}' in an array.array buffer."
     print(f"VectoPyArray Metadata Explanation:")
     print(f"  • Shape: {self.shape} - A 1-dimensional array with {self._size} elements.")
-    print(f"  • Dtype: {self._dtype} - Elements are Python {self._dtype.__name__} objects.")
-    print(f"  • Strides: ({itemsize},) - To move to the next element, step {itemsize} bytes in memory (simulated).")
-    print(f"  • Base: None - This array owns its data (simulated).")
-    print(f"  • Underlying Data: {self._data}")
-    print(f"  • Memory Size: {self._size * itemsize} bytes (simulated)")
+    print(f"  • Dtype: {self._dtype} - {storage}")
+    stride = self.strides[0]
+    print(f"  • Strides: ({stride},) - To move to the next element, step {stride} bytes in memory.")
+    if self.base is None:
+        print(f"  • Base: None - This array owns its data.")
+    else:
+        print(f"  • Base: VectoPyArray of {len(self.base)} elements - This array is a view starting at element {self.offset} of its base.")
+    print(f"  • Underlying Data: {list(self._data)}")
+    print(f"  • Memory Size: {self.nbytes} bytes")
 
 # Attach methods to NDArray1D
 VectoPyArray.explain = explain
@@ -0,0 +1,177 @@
+"""
+Binary save/load of VectoPyArray.
+
+A single-array file is a 64-byte header followed by the raw typed payload:
+
+    magic (7 bytes) | version (1) | typecode (1) | byteorder (1) | flags (1) |
+    length (8) | crc32 (4) | padding up to 64 bytes
+
+The header itself is always little-endian; `byteorder` describes the payload.
+An archive file stores several such records behind a small directory of names
+and offsets, so a whole dataset is read (or memory-mapped) in one open.
+"""
+
+import mmap
+import struct
+import sys
+import zlib
+from array import array as _typed_array
+
+from .arrays import VectoPyArray
+from .function_base import _MEMMAP_MODES
+from ._internals import DtypeError, _TYPECODE_DTYPES, _itemsize
+
+_ARRAY_MAGIC = b'\x93VPYARR'
+_ARCHIVE_MAGIC = b'\x93VPYARC'
+_VERSION = 1
+_HEADER = struct.Struct('<7sBccBQI')
+_HEADER_SIZE = 64
+_ARCHIVE_HEADER = struct.Struct('<7sBI')
+_ENTRY = struct.Struct('<QH')
+_ALIGNMENT = 64
+_FLAG_CHECKSUM = 1
+_BYTEORDER = b'<' if sys.byteorder == 'little' else b'>'
+
+
+def _aligned(n):
+    """Round n up to the payload alignment."""
+    return -(-n // _ALIGNMENT) * _ALIGNMENT
+
+def _payload_chunks(arr):
+    """Bytes-like pieces of an array's payload, without copying contiguous data."""
+    view = arr._data  # read-only use, so the array keeps caching (unlike to_memoryview())
+    if view.contiguous:
+        return [view]
+    return (chunk.tobytes() for chunk in arr._chunks())
+
+def _write_record(f, arr, checksum):
+    """Write one header + payload record at the current position."""
+    flags, crc = 0, 0
+    if checksum:
+        flags = _FLAG_CHECKSUM
+        for chunk in _payload_chunks(arr):
+            crc = zlib.crc32(chunk, crc)
+    header = _HEADER.pack(_ARRAY_MAGIC, _VERSION, arr.typecode.encode(), _BYTEORDER,
+                          flags, len(arr), crc)
+    f.write(header.ljust(_HEADER_SIZE, b'\0'))
+    f.writelines(_payload_chunks(arr))
+
+def _parse_header(raw):
+    """Decode a record header into (typecode, byteorder, length, crc or None)."""
+    if len(raw) < _HEADER.size:
+        raise ValueError("File is truncated: incomplete array header.")
+    magic, version, typecode, byteorder, flags, length, crc = _HEADER.unpack_from(raw)
+    if magic != _ARRAY_MAGIC:
+        raise ValueError("Not a VectoPy array file.")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported VectoPy file version {version}.")
+    typecode = typecode.decode()
+    if typecode not in _TYPECODE_DTYPES:
+        raise DtypeError(f"Unsupported typecode '{typecode}' in file.")
+    return typecode, byteorder, length, (crc if flags & _FLAG_CHECKSUM else None)
+
+def _check_crc(view, crc):
+    if crc is not None and zlib.crc32(view) != crc:
+        raise ValueError("Checksum mismatch: the file is corrupted.")
+
+def _read_record(f, verify):
+    """Read one record from the current position into a new owning array."""
+    typecode, byteorder, length, crc = _parse_header(f.read(_HEADER_SIZE))
+    storage = _typed_array(typecode, [0]) * length
+    raw = memoryview(storage).cast('B')
+    if f.readinto(raw) != len(raw):
+        raise ValueError("File is truncated: incomplete array payload.")
+    if verify:
+        _check_crc(raw, crc)
+    if byteorder != _BYTEORDER:
+        storage.byteswap()
+    return VectoPyArray._from_memory(memoryview(storage), _TYPECODE_DTYPES[typecode], storage)
+
+def _map_record(mapped, offset, verify):
+    """Wrap the record at `offset` of a memory map as an array, without copying."""
+    typecode, byteorder, length, crc = _parse_header(mapped[offset:offset + _HEADER_SIZE])
+    if byteorder != _BYTEORDER:
+        raise ValueError("Cannot memory-map data saved with a different byte order; load it without mmap_mode.")
+    start = offset + _HEADER_SIZE
+    raw = memoryview(mapped)[start:start + length * _itemsize(typecode)]
+    if len(raw) != length * _itemsize(typecode):
+        raise ValueError("File is truncated: incomplete array payload.")
+    if verify:
+        _check_crc(raw, crc)
+    return VectoPyArray._from_memory(raw.cast(typecode), _TYPECODE_DTYPES[typecode], mapped, tracked=False)
+
+
+def _check_saveable(arrays):
+    """Raise before any file is opened, so a failed save leaves nothing behind."""
+    if any(arr.typecode is None for arr in arrays):
+        raise DtypeError("Arrays in object storage cannot be saved.")
+
+def save(path, arr, checksum=False):
+    """Save an array to a binary file; `checksum=True` stores a CRC32 of the payload."""
+    _check_saveable([arr])
+    with open(path, 'wb') as f:
+        _write_record(f, arr, checksum)
+
+def savez(path, checksum=False, **arrays):
+    """Save several named arrays into one archive file."""
+    if not arrays:
+        raise ValueError("savez needs at least one array.")
+    _check_saveable(arrays.values())
+    encoded = [(name.encode('utf-8'), arr) for name, arr in arrays.items()]
+    directory_size = _ARCHIVE_HEADER.size + sum(_ENTRY.size + len(name) for name, _ in encoded)
+    offset = _aligned(directory_size)
+    entries = []
+    for name, arr in encoded:
+        entries.append(_ENTRY.pack(offset, len(name)) + name)
+        offset = _aligned(offset + _HEADER_SIZE + arr.nbytes)
+    with open(path, 'wb') as f:
+        f.write(_ARCHIVE_HEADER.pack(_ARCHIVE_MAGIC, _VERSION, len(entries)))
+        f.writelines(entries)
+        for (_, arr), entry in zip(encoded, entries):
+            f.seek(_ENTRY.unpack_from(entry)[0])
+            _write_record(f, arr, checksum)
+
+def _read_directory(f):
+    """Read an archive's directory as a list of (name, offset)."""
+    magic, version, count = _ARCHIVE_HEADER.unpack(f.read(_ARCHIVE_HEADER.size))
+    if version != _VERSION:
+        raise ValueError(f"Unsupported VectoPy file version {version}.")
+    directory = []
+    for _ in range(count):
+        offset, name_length = _ENTRY.unpack(f.read(_ENTRY.size))
+        directory.append((f.read(name_length).decode('utf-8'), offset))
+    return directory
+
+def load(path, mmap_mode=None, verify=None):
+    """Load an array (or a dict of arrays for an archive) saved with save()/savez().
+
+    With `mmap_mode` ('r', 'r+' or 'c') the payload is memory-mapped instead of read,
+    so nothing is copied. Checksums are verified by default unless memory-mapping.
+    """
+    if mmap_mode is not None and mmap_mode not in ('r', 'r+', 'c'):
+        raise ValueError("mmap_mode must be None, 'r', 'r+' or 'c'.")
+    if verify is None:
+        verify = mmap_mode is None
+    access, file_mode = _MEMMAP_MODES[mmap_mode or 'r']
+    with open(path, file_mode) as f:
+        magic = f.read(len(_ARRAY_MAGIC))
+        f.seek(0)
+        if magic == _ARCHIVE_MAGIC:
+            directory = _read_directory(f)
+        elif magic == _ARRAY_MAGIC:
+            directory = None
+        else:
+            raise ValueError("Not a VectoPy file.")
+        if mmap_mode is not None:
+            mapped = mmap.mmap(f.fileno(), 0, access=access)
+            if directory is None:
+                return _map_record(mapped, 0, verify)
+            return {name: _map_record(mapped, offset, verify) for name, offset in directory}
+        if directory is None:
+            return _read_record(f, verify)
+        arrays = {}
+        for name, offset in directory:
+            f.seek(offset)
+            arrays[name] = _read_record(f, verify)
+        return arrays
+
@@ -2,7 +2,11 @@
 Factory functions for creating arrays.
 """
 
+import mmap
+import os
+
 from .arrays import VectoPyArray
+from ._internals import DtypeError, _resolve_dtype, _itemsize
 
 def array(obj, dtype=None):
   """Create an VectoPyArray from a sequence."""
@@ -10,25 +14,83 @@ def array(obj, dtype=None):
     raise TypeError("Input object must be a sequence.")
   if not obj:
     raise ValueError("Cannot create an array from an empty sequence.")
+  if isinstance(obj, VectoPyArray) and dtype is None:
+    # Already typed: copy the buffer directly instead of converting element by element
+    return obj.copy()
   if dtype is None:
     # Make whole list of type float if any element of list is float
     dtype = float if any(isinstance(x, float) for x in obj) else int
-    # Convert all elements to the chosen dtype
-    converted_data = [dtype(x) for x in obj]
+  # Convert all elements to the chosen dtype (a Python type or an array typecode)
+  py_type = _resolve_dtype(dtype)[0]
+  converted_data = [py_type(x) for x in obj]
   return VectoPyArray((len(obj),), dtype=dtype, buffer=converted_data)
 
+def frombuffer(buffer, dtype=float, count=-1, offset=0):
+  """Interpret a buffer (bytes, bytearray, array.array, mmap, ...) as an array without copying."""
+  py_type, typecode = _resolve_dtype(dtype)
+  if typecode is None:
+    raise DtypeError(f"frombuffer needs a numeric dtype, got {dtype}.")
+  view = memoryview(buffer)
+  if view.format != typecode or offset:
+    view = view.cast('B')[offset:]
+    if len(view) % _itemsize(typecode):
+      raise ValueError("Buffer size must be a multiple of the element size.")
+    view = view.cast(typecode)
+  if count >= 0:
+    if count > len(view):
+      raise ValueError("count is larger than the number of elements in the buffer.")
+    view = view[:count]
+  return VectoPyArray._from_memory(view, py_type, buffer, tracked=False)
+
+# mmap access flag and file open mode for each memmap mode (same letters as NumPy)
+_MEMMAP_MODES = {
+  'r': (mmap.ACCESS_READ, 'rb'),
+  'r+': (mmap.ACCESS_WRITE, 'r+b'),
+  'w+': (mmap.ACCESS_WRITE, 'w+b'),
+  'c': (mmap.ACCESS_COPY, 'rb'),
+}
+
+def memmap(path, dtype=float, mode='r+', shape=None, offset=0):
+  """Return an array backed by a memory-mapped file, for data larger than RAM.
+
+  Modes: 'r' read-only, 'r+' read-write, 'w+' create or overwrite (needs `shape`),
+  'c' copy-on-write (changes stay in memory). Call `flush()` to push writes to disk.
+  """
+  if mode not in _MEMMAP_MODES:
+    raise ValueError(f"mode must be one of {list(_MEMMAP_MODES)}, got '{mode}'.")
+  py_type, typecode = _resolve_dtype(dtype)
+  if typecode is None:
+    raise DtypeError(f"memmap needs a numeric dtype, got {dtype}.")
+  if isinstance(shape, tuple):
+    shape = shape[0]
+  itemsize = _itemsize(typecode)
+  access, file_mode = _MEMMAP_MODES[mode]
+  with open(path, file_mode) as f:
+    if mode == 'w+':
+      if shape is None:
+        raise ValueError("shape is required to create a new memmap.")
+      f.truncate(offset + shape * itemsize)
+    elif shape is None:
+      shape = (os.fstat(f.fileno()).st_size - offset) // itemsize
+    if shape <= 0:
+      raise ValueError("Cannot memory-map an empty array.")
+    # The mapping stays valid after the file object is closed
+    mapped = mmap.mmap(f.fileno(), offset + shape * itemsize, access=access)
+  view = memoryview(mapped)[offset:offset + shape * itemsize].cast(typecode)
+  return VectoPyArray._from_memory(view, py_type, mapped, tracked=False)
+
 def zeros(shape, dtype=float):
   """Return a new array of given shape and type, filled with zeros."""
   return VectoPyArray((shape,), dtype=dtype)
 
 def ones(shape, dtype=float):
   """Return a new array of given shape and type, filled with ones"""
-  return VectoPyArray((shape,), dtype=dtype, buffer=[dtype(1)] * shape)
+  return full(shape, 1, dtype=dtype)
   
 def full(shape, fill_value, dtype=None):
   """Return a new array of given shape and type, filled with 'fill_value'"""
   dtype = type(fill_value) if dtype is None else dtype
-  return VectoPyArray((shape,), dtype=dtype, buffer=[dtype(fill_value)] * shape)
+  return VectoPyArray((shape,), dtype=dtype, buffer=[_resolve_dtype(dtype)[0](fill_value)] * shape)
 
 def arange(start, stop=None, step=1, dtype=None):
   """Return evenly spaced value within a given interval."""
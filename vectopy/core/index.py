@@ -0,0 +1,298 @@
+"""
+Nearest-neighbour search over many vectors.
+
+FlatIndex scores a query against every stored vector with one batched
+`Batch.dot` and keeps the best k with a bounded heap: a size-k heap finds the
+k-th best score, then C-level filtering pulls out everything at least as
+good, so no Python-level sort of all scores is ever done. IVFIndex first
+partitions the vectors with k-means into `nlist` inverted lists and only
+scans the `nprobe` lists whose centroids score best for a query, trading a
+little recall for much less work per query.
+
+Both support three metrics: 'cosine' (vectors are L2-normalized when added,
+so it becomes a dot product), 'ip' (inner product) and 'l2' (Euclidean
+distance, ranked through |x|^2 - 2 q.x so it also reduces to dot products).
+Results are lists of (id, score) pairs, best first; ids count the added
+vectors from 0 and the score is the similarity, or the distance for 'l2'.
+"""
+
+import heapq
+import math
+import operator
+import random
+from array import array as _typed_array
+from itertools import compress, repeat
+
+from .arrays import VectoPyArray
+from .batch import Batch
+from .fileio import savez, load as _load
+from ._internals import ShapeError
+
+_METRICS = ('cosine', 'l2', 'ip')
+
+
+def _best(keys, ids, k):
+    """The k (key, id) pairs with the largest keys, best first.
+
+    A size-k heap over the keys alone finds the k-th largest, then compress()
+    keeps every position at least that good in C, so only about k pairs are built.
+    """
+    if len(keys) > k:
+        threshold = heapq.nlargest(k, keys)[-1]
+        chosen = list(compress(range(len(keys)), map(operator.ge, keys, repeat(threshold))))
+    else:
+        chosen = range(len(keys))
+    return heapq.nlargest(k, zip(map(keys.__getitem__, chosen), map(ids.__getitem__, chosen)))
+
+
+def _squared_norms(rows):
+    return _typed_array('d', [sum(map(operator.mul, row, row)) for row in rows])
+
+
+class _VectorIndex:
+    """What both indexes share: metric handling, vector preparation and batch search."""
+
+    def __init__(self, dim, metric):
+        if dim <= 0:
+            raise ValueError("dim must be positive.")
+        if metric not in _METRICS:
+            raise ValueError(f"metric must be one of {list(_METRICS)}, got '{metric}'.")
+        self.dim = dim
+        self.metric = metric
+
+    def _prepare(self, vector):
+        """The vector as a list of floats, unit length for 'cosine' (zero vectors stay zero)."""
+        values = list(map(float, vector))
+        if len(values) != self.dim:
+            raise ShapeError(f"Vectors must have length {self.dim}, got {len(values)}.")
+        if self.metric == 'cosine':
+            norm = math.sqrt(sum(map(operator.mul, values, values)))
+            if norm:
+                values = list(map(operator.truediv, values, repeat(norm, self.dim)))
+        return values
+
+    def _keys(self, batch, query, norms):
+        """Larger-is-better ranking keys of every row of `batch` for a prepared query."""
+        dots = batch.dot(query)._data
+        if self.metric != 'l2':
+            return dots
+        # |x - q|^2 = |q|^2 - (2 q.x - |x|^2): the bracket is the key to maximize
+        return list(map(operator.sub, map(operator.mul, dots, repeat(2.0)), norms))
+
+    def _results(self, best, query):
+        if self.metric != 'l2':
+            return [(i, key) for key, i in best]
+        query_norm = sum(map(operator.mul, query, query))
+        return [(i, math.sqrt(max(query_norm - key, 0.0))) for key, i in best]
+
+    def search_batch(self, queries, k=10, **options):
+        """`search` for every query in a Batch or an iterable of vectors."""
+        return [self.search(query, k, **options) for query in queries]
+
+
+class FlatIndex(_VectorIndex):
+    """Exact nearest-neighbour search: every stored vector is scored for each query."""
+
+    def __init__(self, dim, metric='cosine'):
+        super().__init__(dim, metric)
+        self._storage = _typed_array('d')
+        self._norms = _typed_array('d')
+
+    def __len__(self):
+        return len(self._storage) // self.dim
+
+    def __repr__(self):
+        return f"FlatIndex(dim={self.dim}, metric='{self.metric}', size={len(self)})"
+
+    def add(self, vectors):
+        """Add vectors (a Batch or an iterable of vectors); they get the next ids in order."""
+        rows = [self._prepare(vector) for vector in vectors]
+        for row in rows:
+            self._storage.fromlist(row)
+        if self.metric == 'l2':
+            self._norms.extend(_squared_norms(rows))
+        return self
+
+    def search(self, query, k=10):
+        """The k stored vectors most similar to `query`, as (id, score) pairs, best first."""
+        if k <= 0:
+            raise ValueError("k must be positive.")
+        if not len(self):
+            return []
+        query = self._prepare(query)
+        # A Batch view over the storage for this search only, so add() can still grow it
+        batch = Batch.from_flat(VectoPyArray._from_storage(float, self._storage), self.dim)
+        keys = self._keys(batch, query, self._norms)
+        return self._results(_best(keys, range(len(keys)), k), query)
+
+    def save(self, path):
+        """Save the index to one archive file (see `vp.savez`)."""
+        savez(path, meta=_meta(self, 0, 0), vectors=_as_array(self._storage))
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by `save`."""
+        arrays = _load(path)
+        dim, metric, _, _ = _read_meta(arrays)
+        index = cls(dim, metric)
+        index._storage = _typed_array('d', arrays['vectors'].tobytes())
+        if metric == 'l2' and len(index):
+            index._norms = _squared_norms(Batch.from_flat(arrays['vectors'], dim)._rows())
+        return index
+
+
+class IVFIndex(_VectorIndex):
+    """Approximate search over k-means partitions (an inverted file): only `nprobe` lists are scanned."""
+
+    def __init__(self, dim, nlist=64, metric='cosine', nprobe=8, seed=0):
+        super().__init__(dim, metric)
+        if nlist <= 0 or nprobe <= 0:
+            raise ValueError("nlist and nprobe must be positive.")
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.seed = seed
+        self._centroids = None
+        self._centroid_norms = None
+        self._lists = [_typed_array('d') for _ in range(nlist)]
+        self._ids = [_typed_array('q') for _ in range(nlist)]
+        self._norms = [_typed_array('d') for _ in range(nlist)]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return (f"IVFIndex(dim={self.dim}, nlist={self.nlist}, nprobe={self.nprobe}, "
+                f"metric='{self.metric}', size={self._size}, trained={self.is_trained})")
+
+    @property
+    def is_trained(self):
+        return self._centroids is not None
+
+    def _assign(self, row):
+        """Index of the centroid whose key is best for a prepared vector."""
+        keys = self._keys(self._centroids, row, self._centroid_norms)
+        return operator.indexOf(keys, max(keys))
+
+    def _set_centroids(self, centroids):
+        self._centroids = Batch(centroids)
+        self._centroid_norms = _squared_norms(self._centroids._rows())
+
+    def train(self, vectors, iterations=10, sample_size=None):
+        """Learn the `nlist` centroids with k-means on (a random sample of) `vectors`.
+
+        Training costs sample_size x nlist x dim multiplications per iteration, so by
+        default only 32 vectors per list are used, which is plenty to place centroids.
+        """
+        rows = [self._prepare(vector) for vector in vectors]
+        if len(rows) < self.nlist:
+            raise ValueError(f"Need at least nlist={self.nlist} vectors to train, got {len(rows)}.")
+        rng = random.Random(self.seed)
+        sample_size = min(len(rows), sample_size or 32 * self.nlist)
+        sample = rng.sample(rows, sample_size)
+        self._set_centroids(rng.sample(sample, self.nlist))
+        for _ in range(iterations):
+            sums = [[0.0] * self.dim for _ in range(self.nlist)]
+            counts = [0] * self.nlist
+            for row in sample:
+                c = self._assign(row)
+                sums[c] = list(map(operator.add, sums[c], row))
+                counts[c] += 1
+            centroids = []
+            for total, count, old in zip(sums, counts, self._centroids._rows()):
+                if not count:
+                    # An empty list is re-seeded with a random training vector
+                    centroids.append(rng.choice(sample))
+                    continue
+                centroid = list(map(operator.truediv, total, repeat(count, self.dim)))
+                # Spherical k-means for cosine: centroids stay on the unit sphere
+                centroids.append(self._prepare(centroid) if self.metric == 'cosine' else centroid)
+            self._set_centroids(centroids)
+        return self
+
+    def add(self, vectors):
+        """Add vectors to the lists of their nearest centroids; they get the next ids in order."""
+        if not self.is_trained:
+            raise ValueError("IVFIndex must be trained before adding vectors.")
+        for vector in vectors:
+            row = self._prepare(vector)
+            c = self._assign(row)
+            self._lists[c].fromlist(row)
+            self._ids[c].append(self._size)
+            if self.metric == 'l2':
+                self._norms[c].append(sum(map(operator.mul, row, row)))
+            self._size += 1
+        return self
+
+    def _probe(self, query, centroid_keys, k, nprobe):
+        best = []
+        for c in heapq.nlargest(nprobe, range(self.nlist), key=centroid_keys.__getitem__):
+            if not self._ids[c]:
+                continue
+            batch = Batch.from_flat(VectoPyArray._from_storage(float, self._lists[c]), self.dim)
+            best += _best(self._keys(batch, query, self._norms[c]), self._ids[c], k)
+        return self._results(heapq.nlargest(k, best), query)
+
+    def search(self, query, k=10, nprobe=None):
+        """Approximate k nearest vectors to `query` from the `nprobe` closest lists, best first."""
+        if k <= 0:
+            raise ValueError("k must be positive.")
+        if not self.is_trained:
+            raise ValueError("IVFIndex must be trained before searching.")
+        query = self._prepare(query)
+        centroid_keys = self._keys(self._centroids, query, self._centroid_norms)
+        return self._probe(query, centroid_keys, k, nprobe or self.nprobe)
+
+    def search_batch(self, queries, k=10, nprobe=None):
+        """`search` for many queries; all centroid scores come from one pairwise_dots call."""
+        if not self.is_trained:
+            raise ValueError("IVFIndex must be trained before searching.")
+        queries = Batch([self._prepare(query) for query in queries])
+        scores = queries.pairwise_dots(self._centroids)
+        results = []
+        for query, dots in zip(queries.tolist(), scores._rows()):
+            if self.metric == 'l2':
+                dots = list(map(operator.sub, map(operator.mul, dots, repeat(2.0)), self._centroid_norms))
+            results.append(self._probe(query, dots, k, nprobe or self.nprobe))
+        return results
+
+    def save(self, path):
+        """Save the trained index (centroids and inverted lists) to one archive file."""
+        if not self.is_trained:
+            raise ValueError("Only a trained IVFIndex can be saved.")
+        vectors, ids = _typed_array('d'), _typed_array('q')
+        for values, list_ids in zip(self._lists, self._ids):
+            vectors.extend(values)
+            ids.extend(list_ids)
+        savez(path, meta=_meta(self, self.nlist, self.nprobe),
+              centroids=self._centroids.flat, vectors=_as_array(vectors), ids=_as_array(ids),
+              sizes=_as_array(_typed_array('q', map(len, self._ids))))
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by `save`."""
+        arrays = _load(path)
+        dim, metric, nlist, nprobe = _read_meta(arrays)
+        index = cls(dim, nlist, metric, nprobe)
+        index._set_centroids(Batch.from_flat(arrays['centroids'], dim).tolist())
+        vectors, ids = arrays['vectors'], arrays['ids']
+        start = 0
+        for c, size in enumerate(arrays['sizes']):
+            index._lists[c] = _typed_array('d', vectors[start * dim:(start + size) * dim].tobytes())
+            index._ids[c] = _typed_array('q', ids[start:start + size].tobytes())
+            if metric == 'l2' and size:
+                index._norms[c] = _squared_norms(Batch.from_flat(vectors[start * dim:(start + size) * dim], dim)._rows())
+            start += size
+        index._size = start
+        return index
+
+
+def _as_array(storage):
+    return VectoPyArray._from_storage(float if storage.typecode == 'd' else int, storage)
+
+def _meta(index, nlist, nprobe):
+    return _as_array(_typed_array('q', [index.dim, _METRICS.index(index.metric), nlist, nprobe]))
+
+def _read_meta(arrays):
+    dim, metric, nlist, nprobe = arrays['meta']
+    return dim, _METRICS[metric], nlist, nprobe
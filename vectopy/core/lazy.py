@@ -0,0 +1,184 @@
+"""
+Lazy expression graphs for VectoPyArray arithmetic.
+
+`vp.lazy(a)` returns a LazyArray. Arithmetic on it records an expression tree
+instead of computing anything. `evaluate()` compiles the whole tree into one
+generated Python expression and runs it in a single pass over all operands,
+allocating only the final result. Reductions (`sum`, `mean`, `dot`) consume
+that single pass directly, so the element-wise result is never materialized.
+"""
+
+import operator
+from array import array as _typed_array
+
+from .arrays import VectoPyArray
+from .kernels import result_dtype
+from ._internals import ShapeError, _DEFAULT_TYPECODES
+
+_SYMBOLS = {
+    operator.add: '+',
+    operator.sub: '-',
+    operator.mul: '*',
+    operator.truediv: '/',
+}
+
+# Compiled loop bodies, keyed by the generated expression source
+_fused_cache = {}
+
+
+class LazyArray:
+    """A deferred element-wise expression over one or more VectoPyArrays."""
+
+    def __init__(self, op=None, left=None, right=None, array=None):
+        self._op = op
+        self._left = left
+        self._right = right
+        self._array = array
+        if array is not None:
+            self._shape, self._dtype = array.shape, array.dtype
+        else:
+            self._shape = left.shape
+            right_dtype = right.dtype if isinstance(right, LazyArray) else _scalar_dtype(right)
+            self._dtype = result_dtype(op, left.dtype, right_dtype)
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __repr__(self):
+        return f"LazyArray({self._source(_Names())}, dtype={self._dtype})"
+
+    def _combine(self, other, op, reflected=False):
+        if isinstance(other, VectoPyArray):
+            other = LazyArray(array=other)
+        elif not isinstance(other, (LazyArray, int, float)):
+            return NotImplemented
+        if isinstance(other, LazyArray) and other.shape != self._shape:
+            raise ShapeError(f"Operands must have the same shape. Got {self._shape} and {other.shape}.")
+        if reflected:
+            if not isinstance(other, LazyArray):
+                # scalar op lazy: keep the array on the left so shape/dtype come from it
+                return LazyArray(op, _Scalar(other, self), self)
+            return LazyArray(op, other, self)
+        return LazyArray(op, self, other)
+
+    def __add__(self, other):
+        return self._combine(other, operator.add)
+
+    def __radd__(self, other):
+        return self._combine(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        return self._combine(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._combine(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        return self._combine(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._combine(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other):
+        return self._combine(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._combine(other, operator.truediv, reflected=True)
+
+    def _source(self, names):
+        """Python source of this expression, registering leaves and scalars in `names`."""
+        if self._array is not None:
+            return names.array(self._array)
+        left = self._left._source(names)
+        right = self._right._source(names) if isinstance(self._right, LazyArray) else names.scalar(self._right)
+        return f"({left} {_SYMBOLS[self._op]} {right})"
+
+    def _fused(self):
+        """Compile the tree into one generated function and return the single-pass iterator."""
+        names = _Names()
+        source = self._source(names)
+        factory = _fused_cache.get(source)
+        if factory is None:
+            params = ', '.join(f"x{i}" for i in range(len(names.arrays)))
+            scalars = ', '.join(f"s{i}" for i in range(len(names.scalars)))
+            code = f"def factory({scalars}):\n    return lambda {params}: {source}\n"
+            namespace = {}
+            exec(code, namespace)
+            factory = _fused_cache[source] = namespace['factory']
+        fn = factory(*names.scalars)
+        return map(fn, *(arr._data for arr in names.arrays))
+
+    def evaluate(self, out=None):
+        """Compute the expression in one pass into a single new array (or into `out`)."""
+        typecode = out.typecode if out is not None else _DEFAULT_TYPECODES.get(self._dtype)
+        try:
+            storage = _typed_array(typecode, self._fused())
+        except (TypeError, OverflowError):
+            storage = list(self._fused())
+        if out is not None:
+            return out._write(storage, self._dtype)
+        return VectoPyArray._from_storage(self._dtype, storage)
+
+    def sum(self):
+        """Sum of the expression's elements, without materializing them."""
+        return sum(self._fused(), self._dtype(0))
+
+    def mean(self):
+        """Mean of the expression's elements, without materializing them."""
+        return self.sum() / self._shape[0]
+
+    def dot(self, other):
+        """Dot product with another array or expression, folded into the same pass."""
+        product = self * other
+        if product is NotImplemented:
+            raise TypeError(f"Cannot take the dot product with '{type(other).__name__}'.")
+        return product.sum()
+
+
+class _Scalar:
+    """A scalar on the left of a reflected operation, e.g. the 2 in `2 - lazy`."""
+
+    def __init__(self, value, like):
+        self.value = value
+        self.shape = like.shape
+        self.dtype = _scalar_dtype(value)
+
+    def _source(self, names):
+        return names.scalar(self.value)
+
+
+class _Names:
+    """Assigns parameter names to the distinct arrays and the scalars of an expression."""
+
+    def __init__(self):
+        self.arrays = []
+        self.scalars = []
+
+    def array(self, arr):
+        for i, seen in enumerate(self.arrays):
+            if seen is arr:
+                return f"x{i}"
+        self.arrays.append(arr)
+        return f"x{len(self.arrays) - 1}"
+
+    def scalar(self, value):
+        self.scalars.append(value)
+        return f"s{len(self.scalars) - 1}"
+
+
+def _scalar_dtype(value):
+    return float if isinstance(value, float) else int
+
+def lazy(arr):
+    """Start a lazy expression from an array; arithmetic on it is deferred until evaluate()."""
+    if not isinstance(arr, VectoPyArray):
+        raise TypeError(f"lazy() expects a VectoPyArray, got '{type(arr).__name__}'.")
+    return LazyArray(array=arr)
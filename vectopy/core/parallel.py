@@ -0,0 +1,235 @@
+"""
+Multi-core execution of VectoPyArray operations.
+
+Large typed arrays are copied once into `multiprocessing.shared_memory` blocks.
+A process pool then works on contiguous slices of those blocks: element-wise
+kernels write into a shared output block, reductions return one partial result
+per slice (merged here), and prefix scans run a local scan per slice followed
+by a carry fix-up pass. Arrays below the configured threshold, object-storage
+arrays and single-worker runs stay on the serial path.
+"""
+
+import atexit
+import operator
+from array import array as _typed_array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+from multiprocessing import shared_memory
+
+from ._internals import _DEFAULT_TYPECODES
+from .stats import RunningStats
+
+_config = {'workers': 1, 'threshold': 1_000_000}
+_pool = None
+_pool_workers = 0
+
+
+def set_parallel(workers=None, threshold=None):
+    """Set the default number of worker processes and the minimum size worth parallelizing."""
+    if workers is not None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        _config['workers'] = workers
+    if threshold is not None:
+        if threshold < 0:
+            raise ValueError("threshold cannot be negative.")
+        _config['threshold'] = threshold
+
+def get_parallel():
+    """Return the current parallel settings as a dict."""
+    return dict(_config)
+
+def _workers_for(arr, workers):
+    """Number of workers to use for `arr`, or 0 when the serial path should run."""
+    workers = _config['workers'] if workers is None else workers
+    if workers < 2 or arr.typecode is None or len(arr) < max(_config['threshold'], workers):
+        return 0
+    return workers
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        shutdown()
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    return _pool
+
+@atexit.register
+def shutdown():
+    """Stop the worker processes (they are restarted on demand)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+def _ranges(n, parts):
+    """Split range(n) into `parts` contiguous (start, stop) pieces."""
+    step = -(-n // parts)
+    return [(start, min(start + step, n)) for start in range(0, n, step)]
+
+
+class _Shared:
+    """A shared-memory block holding a typed 1-D buffer; unlinked when the block is closed."""
+
+    def __init__(self, typecode, length, source=None):
+        itemsize = _typed_array(typecode).itemsize
+        self.typecode = typecode
+        self.length = length
+        self.shm = shared_memory.SharedMemory(create=True, size=max(length * itemsize, 1))
+        if source is not None:
+            if getattr(source, 'format', None) != typecode:
+                source = _typed_array(typecode, source)
+            self.view()[:] = source
+
+    def view(self):
+        return self.shm.buf[:self.length * _typed_array(self.typecode).itemsize].cast(self.typecode)
+
+    @property
+    def spec(self):
+        return (self.shm.name, self.typecode, self.length)
+
+    def to_array(self):
+        """Copy the block into a new typed array.array."""
+        view = self.view()
+        try:
+            return _typed_array(self.typecode, view.tobytes())
+        finally:
+            view.release()
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _with_views(task, specs, *args):
+    """Attach to shared blocks in a worker and call `task(*views, *args)`."""
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    try:
+        # The views only live for the duration of the call, so the blocks can be closed after it
+        return task(*[block.buf[:length * _typed_array(typecode).itemsize].cast(typecode)
+                      for block, (_, typecode, length) in zip(blocks, specs)], *args)
+    finally:
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass  # a view is still referenced by a propagating exception
+
+def _run(workers, task, specs, n, *args):
+    """Run `task(*views, *args, start, stop)` over `workers` slices of range(n), in order."""
+    pool = _get_pool(workers)
+    futures = [pool.submit(_with_views, task, specs, *args, start, stop)
+               for start, stop in _ranges(n, workers)]
+    return [future.result() for future in futures]
+
+
+# ---- Worker tasks (run in the pool processes) ----
+
+def _reduce_task(data, kind, start, stop):
+    chunk = data[start:stop]
+    if kind == 'sum':
+        return sum(chunk)
+    if kind == 'min':
+        return min(chunk)
+    if kind == 'max':
+        return max(chunk)
+    # 'stats': a mergeable summary of the slice
+    return RunningStats(chunk)
+
+def _dot_task(left, right, start, stop):
+    return sum(map(operator.mul, left[start:stop], right[start:stop]))
+
+def _elementwise_task(out, left, op, right, start, stop):
+    out[start:stop] = _typed_array(out.format, map(op, left[start:stop], repeat(right, stop - start)))
+
+def _elementwise_arrays_task(out, left, right, op, start, stop):
+    out[start:stop] = _typed_array(out.format, map(op, left[start:stop], right[start:stop]))
+
+def _scan_task(data, start, stop):
+    data[start:stop] = _typed_array(data.format, accumulate(data[start:stop]))
+    return data[stop - 1]
+
+def _add_carry_task(data, carry, start, stop):
+    data[start:stop] = _typed_array(data.format, map(operator.add, data[start:stop], repeat(carry, stop - start)))
+
+
+# ---- Entry points used by the array methods ----
+
+def reduce(arr, kind, workers=None):
+    """Parallel sum/min/max (a value) or 'stats' (a RunningStats) of `arr`; None for the serial path."""
+    workers = _workers_for(arr, workers)
+    if not workers:
+        return None
+    shared = _Shared(arr.typecode, len(arr), arr._data)
+    try:
+        if kind == 'sum':
+            return sum(_run(workers, _reduce_task, [shared.spec], len(arr), 'sum'), arr.dtype(0))
+        if kind in ('min', 'max'):
+            partials = _run(workers, _reduce_task, [shared.spec], len(arr), kind)
+            return min(partials) if kind == 'min' else max(partials)
+        stats = RunningStats()
+        for partial in _run(workers, _reduce_task, [shared.spec], len(arr), 'stats'):
+            stats.merge(partial)
+        return stats
+    finally:
+        shared.close()
+
+def dot(a, b, workers=None):
+    """Parallel dot product, or None when the serial path should be used."""
+    workers = _workers_for(a, workers)
+    if not workers or b.typecode is None:
+        return None
+    left = _Shared(a.typecode, len(a), a._data)
+    right = _Shared(b.typecode, len(b), b._data)
+    try:
+        return sum(_run(workers, _dot_task, [left.spec, right.spec], len(a)))
+    finally:
+        left.close()
+        right.close()
+
+def elementwise(arr, other, op, dtype, workers=None):
+    """Parallel element-wise `arr op other` as a typed array.array, or None for the serial path."""
+    workers = _workers_for(arr, workers)
+    typecode = _DEFAULT_TYPECODES.get(dtype)
+    scalar = not hasattr(other, 'typecode')
+    if not workers or typecode is None or (not scalar and other.typecode is None):
+        return None
+    blocks = [_Shared(typecode, len(arr)), _Shared(arr.typecode, len(arr), arr._data)]
+    try:
+        if scalar:
+            _run(workers, _elementwise_task, [b.spec for b in blocks], len(arr), op, other)
+        else:
+            blocks.append(_Shared(other.typecode, len(other), other._data))
+            _run(workers, _elementwise_arrays_task, [b.spec for b in blocks], len(arr), op)
+        return blocks[0].to_array()
+    except (TypeError, OverflowError):
+        # Results that don't fit the typed output are left to the serial path
+        return None
+    finally:
+        for block in blocks:
+            block.close()
+
+def cumulative_sum(arr, workers=None):
+    """Parallel prefix sum as a typed array.array, or None for the serial path."""
+    workers = _workers_for(arr, workers)
+    typecode = _DEFAULT_TYPECODES.get(arr.dtype)
+    if not workers or typecode is None:
+        return None
+    shared = _Shared(typecode, len(arr), arr._data)
+    try:
+        # Pass 1: independent scans per slice; pass 2: add the total of all earlier slices
+        totals = _run(workers, _scan_task, [shared.spec], len(arr))
+        pool = _get_pool(workers)
+        futures = []
+        carry = arr.dtype(0)
+        for (start, stop), total in zip(_ranges(len(arr), workers), totals):
+            if carry:
+                futures.append(pool.submit(_with_views, _add_carry_task, [shared.spec], carry, start, stop))
+            carry += total
+        for future in futures:
+            future.result()
+        return shared.to_array()
+    except OverflowError:
+        return None
+    finally:
+        shared.close()
@@ -0,0 +1,235 @@
+"""
+Fixed-capacity ring buffer for live data.
+
+RingArray keeps the last `capacity` samples in one preallocated typed buffer.
+`push` overwrites the oldest sample in O(1) and updates the running statistics
+incrementally: a (compensated) running sum, Welford's mean/M2 with add and
+remove updates, and monotonic deques for the window min and max. Every
+`capacity` evictions the sum and M2 are recomputed from the buffer, which costs
+O(1) amortized per push and keeps rounding from drifting over long runs.
+"""
+
+import math
+from array import array as _typed_array
+from collections import deque
+from itertools import chain
+
+from .arrays import VectoPyArray
+from ._internals import _resolve_dtype, _make_storage
+
+
+class RingArray:
+    """The last `capacity` pushed values, with O(1) push and live statistics."""
+
+    def __init__(self, capacity, dtype=float):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        self._dtype, typecode = _resolve_dtype(dtype)
+        self._capacity = capacity
+        self._storage = _make_storage(typecode, self._dtype, None, capacity)
+        self._typecode = getattr(self._storage, 'typecode', None)
+        self.clear()
+
+    def clear(self):
+        """Remove all values (the buffer is kept)."""
+        self._start = 0
+        self._size = 0
+        self._pushed = 0
+        self._evicted = 0
+        self._total = self._dtype(0)
+        self._compensation = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        # (push number, value) pairs; values increase (low) / decrease (high) front to back
+        self._low = deque()
+        self._high = deque()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def typecode(self):
+        return self._typecode
+
+    @property
+    def shape(self):
+        return (self._size,)
+
+    def is_full(self):
+        return self._size == self._capacity
+
+    def __len__(self):
+        return self._size
+
+    # ---- Writing ----
+
+    def push(self, value):
+        """Append a value, dropping the oldest one when the buffer is full."""
+        if self._size == self._capacity:
+            index = self._start
+            old = self._storage[index]
+            # The store raises for values the storage cannot hold, before any state changes
+            self._storage[index] = value
+            self._start = (index + 1) % self._capacity
+            self._remove(old)
+        else:
+            index = (self._start + self._size) % self._capacity
+            self._storage[index] = value
+        # Track what the storage holds (e.g. 3.0 for an int pushed into a float buffer)
+        value = self._storage[index]
+        self._add(value)
+        self._track_extremes(value)
+        if self._evicted >= self._capacity:
+            self._resync()
+
+    def extend(self, values):
+        """Push every value of an iterable; only the last `capacity` ones are kept."""
+        values = list(values)
+        if len(values) >= self._capacity:
+            # Everything currently stored would be evicted: load the tail directly
+            tail = values[-self._capacity:]
+            packed = _typed_array(self._typecode, tail) if self._typecode else tail
+            self.clear()
+            self._storage[:] = packed
+            self._size = self._capacity
+            self._pushed = self._capacity
+            for seq, value in enumerate(self._storage):
+                self._track_extremes(value, seq)
+            self._resync()
+            return
+        for value in values:
+            self.push(value)
+
+    def _add(self, x):
+        self._size += 1
+        self._add_to_total(x)
+        delta = x - self._mean
+        self._mean += delta / self._size
+        self._m2 += delta * (x - self._mean)
+
+    def _remove(self, x):
+        self._size -= 1
+        self._evicted += 1
+        self._add_to_total(-x)
+        if self._size:
+            delta = x - self._mean
+            self._mean -= delta / self._size
+            self._m2 -= delta * (x - self._mean)
+        else:
+            self._mean, self._m2 = 0.0, 0.0
+
+    def _add_to_total(self, x):
+        if self._dtype is int:
+            self._total += x
+            return
+        # Neumaier compensated summation
+        t = self._total + x
+        if abs(self._total) >= abs(x):
+            self._compensation += (self._total - t) + x
+        else:
+            self._compensation += (x - t) + self._total
+        self._total = t
+
+    def _track_extremes(self, value, seq=None):
+        if seq is None:
+            seq = self._pushed
+            self._pushed += 1
+        while self._high and self._high[-1][1] <= value:
+            self._high.pop()
+        self._high.append((seq, value))
+        while self._low and self._low[-1][1] >= value:
+            self._low.pop()
+        self._low.append((seq, value))
+        oldest = self._pushed - self._size
+        while self._high[0][0] < oldest:
+            self._high.popleft()
+        while self._low[0][0] < oldest:
+            self._low.popleft()
+
+    def _resync(self):
+        """Recompute the sum, mean and M2 exactly from the stored values."""
+        values = list(self)
+        self._evicted = 0
+        if self._dtype is int:
+            self._total = sum(values)
+        else:
+            self._total, self._compensation = math.fsum(values), 0.0
+        self._mean = self._total / len(values)
+        self._m2 = math.fsum((x - self._mean) ** 2 for x in values)
+
+    # ---- Live statistics, O(1) ----
+
+    def _require_data(self, what):
+        if not self._size:
+            raise ValueError(f"Cannot compute {what} of empty RingArray.")
+
+    def sum(self):
+        """Sum of the stored values."""
+        if self._dtype is int:
+            return self._total
+        return self._total + self._compensation
+
+    def mean(self):
+        """Mean of the stored values."""
+        self._require_data('mean')
+        return self.sum() / self._size
+
+    def var(self):
+        """Population variance of the stored values."""
+        self._require_data('variance')
+        return max(self._m2, 0.0) / self._size
+
+    def std(self):
+        """Standard deviation of the stored values (population, like VectoPyArray.std)."""
+        self._require_data('standard deviation')
+        return math.sqrt(self.var())
+
+    def min(self):
+        """Minimum of the stored values."""
+        self._require_data('minimum')
+        return self._low[0][1]
+
+    def max(self):
+        """Maximum of the stored values."""
+        self._require_data('maximum')
+        return self._high[0][1]
+
+    # ---- Read access ----
+
+    def _parts(self):
+        """The stored values in order, as at most two slices of the buffer."""
+        end = self._start + self._size
+        if end <= self._capacity:
+            return self._storage[self._start:end], self._storage[:0]
+        return self._storage[self._start:], self._storage[:end - self._capacity]
+
+    def __iter__(self):
+        return chain(*self._parts())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.snapshot()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingArray index out of range.")
+        return self._storage[(self._start + index) % self._capacity]
+
+    def snapshot(self):
+        """Return the stored values, oldest first, as a new contiguous VectoPyArray."""
+        first, second = self._parts()
+        return VectoPyArray._from_storage(self._dtype, first + second)
+
+    def __getattr__(self, name):
+        # Other VectoPyArray methods (median, normalize, diff, ...) run on a snapshot
+        if name.startswith('_') or not hasattr(VectoPyArray, name):
+            raise AttributeError(f"'RingArray' object has no attribute '{name}'")
+        return getattr(self.snapshot(), name)
+
+    def __repr__(self):
+        return f"RingArray({list(self)}, capacity={self._capacity}, dtype={self._dtype})"
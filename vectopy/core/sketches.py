@@ -0,0 +1,371 @@
+"""
+Mergeable frequency and quantile sketches.
+
+MisraGries keeps at most `k` counters and finds the frequent values of a
+stream: every value occurring more than n/(k+1) times is guaranteed to be
+kept, and each estimate undercounts by at most the reported `error`.
+CountMinSketch estimates the frequency of any value in a fixed `depth` x
+`width` table of counters, overcounting by at most about e/width * n with
+probability 1 - exp(-depth). Both read data chunk by chunk (each chunk is
+first counted with a C-level Counter, then folded in) and two sketches built
+on different pieces of the data, even in different processes, combine with
+`merge()`. KLLSketch answers approximate quantile and rank queries in
+O(k log(n/k)) memory, and HyperLogLog estimates the number of distinct values
+in 2**p bytes.
+"""
+
+import heapq
+import math
+import operator
+import random
+from array import array as _typed_array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, repeat
+
+# Mersenne prime 2**61 - 1, the modulus of Python's numeric hash
+_PRIME = (1 << 61) - 1
+
+# 64-bit mixing constants (from SplitMix64)
+_MIX1 = 0xbf58476d1ce4e5b9
+_MIX2 = 0x94d049bb133111eb
+_MASK64 = (1 << 64) - 1
+
+# KLL rank error is about this / k (measured at 99% confidence, see KLLSketch.from_error)
+_KLL_ERROR_SCALE = 2.0
+
+
+def _chunks_of(values):
+    """The chunks of a VectoPyArray, ChunkedArray or Stream, or any other iterable as one chunk."""
+    if hasattr(values, '_chunks'):
+        return values._chunks()
+    return (values,)
+
+
+class MisraGries:
+    """Frequent values of a stream with at most `k` counters (Misra-Gries summary)."""
+
+    def __init__(self, k=1024, values=None):
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        self.count = 0
+        self._error = 0
+        self._counters = Counter()
+        if values is not None:
+            self.update(values)
+
+    def update(self, values):
+        """Add a chunk of values (a VectoPyArray, ChunkedArray, list or any iterable)."""
+        for chunk in _chunks_of(values):
+            counts = Counter(chunk)
+            self._absorb(counts, sum(counts.values()))
+        return self
+
+    def push(self, value):
+        """Add a single value."""
+        self._absorb({value: 1}, 1)
+        return self
+
+    def merge(self, other):
+        """Fold another MisraGries (e.g. from another chunk or worker) into this one."""
+        self._absorb(other._counters, other.count)
+        self._error += other._error
+        return self
+
+    def _absorb(self, counts, n):
+        # Mergeable-summaries update: add the counts, then subtract the (k+1)-th largest
+        # counter from all of them, which leaves at most k positive counters
+        self.count += n
+        counters = self._counters
+        counters.update(counts)
+        if len(counters) > self.k:
+            cut = heapq.nlargest(self.k + 1, counters.values())[-1]
+            self._error += cut
+            self._counters = Counter({value: c - cut for value, c in counters.items() if c > cut})
+
+    @property
+    def error(self):
+        """Maximum undercount of any estimate (at most count / (k + 1))."""
+        return self._error
+
+    def estimate(self, value):
+        """Lower bound on the frequency of `value`; the true count is at most this + error."""
+        return self._counters.get(value, 0)
+
+    def most_common(self, n=None):
+        """The tracked values with their estimated counts, most frequent first."""
+        return self._counters.most_common(n)
+
+    def heavy_hitters(self, fraction):
+        """Every value that may occur in more than `fraction` of the data (no false negatives)."""
+        if not 0 < fraction < 1:
+            raise ValueError(f"fraction must be between 0 and 1, got {fraction}.")
+        threshold = fraction * self.count - self._error
+        return [value for value, c in self._counters.most_common() if c > threshold]
+
+    def __repr__(self):
+        return f"MisraGries(k={self.k}, count={self.count}, tracked={len(self._counters)}, error={self._error})"
+
+
+class CountMinSketch:
+    """Approximate frequency of any value in a `depth` x `width` table of counters."""
+
+    def __init__(self, width=2048, depth=5, seed=0, values=None):
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be at least 1.")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.count = 0
+        # One (a, b) pair per row for the hashes ((a * hash(x) + b) mod p) mod width
+        rng = random.Random(seed)
+        self._hashes = [(rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(depth)]
+        self._rows = [_typed_array('q', bytes(8 * width)) for _ in range(depth)]
+        if values is not None:
+            self.update(values)
+
+    @classmethod
+    def from_error(cls, epsilon, delta=0.01, seed=0):
+        """A sketch overcounting by at most epsilon * count with probability 1 - delta."""
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1.")
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), seed)
+
+    def _columns(self, a, b, hashes):
+        # ((a * h + b) mod p) mod width for every hash, as chained C-level maps
+        products = map(operator.add, map(operator.mul, repeat(a), hashes), repeat(b))
+        return map(operator.mod, map(operator.mod, products, repeat(_PRIME)), repeat(self.width))
+
+    def update(self, values):
+        """Add a chunk of values (a VectoPyArray, ChunkedArray, list or any iterable)."""
+        for chunk in _chunks_of(values):
+            hashes = list(map(hash, chunk))
+            for (a, b), row in zip(self._hashes, self._rows):
+                # Counting the columns first leaves at most `width` Python-level additions
+                for column, c in Counter(self._columns(a, b, hashes)).items():
+                    row[column] += c
+            self.count += len(hashes)
+        return self
+
+    def push(self, value):
+        """Add a single value."""
+        return self.update((value,))
+
+    def merge(self, other):
+        """Add the counters of a sketch with the same width, depth and seed."""
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Can only merge sketches with the same width, depth and seed.")
+        for row, other_row in zip(self._rows, other._rows):
+            row[:] = _typed_array('q', map(operator.add, row, other_row))
+        self.count += other.count
+        return self
+
+    def estimate(self, value):
+        """Upper bound on the frequency of `value` (never an undercount)."""
+        return min(row[next(self._columns(a, b, (hash(value),)))]
+                   for (a, b), row in zip(self._hashes, self._rows))
+
+    def __repr__(self):
+        return f"CountMinSketch(width={self.width}, depth={self.depth}, count={self.count})"
+
+
+class KLLSketch:
+    """Approximate quantiles of a stream in O(k log(n / k)) memory (KLL sketch)."""
+
+    def __init__(self, k=200, seed=None, values=None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.count = 0
+        self._min = None
+        self._max = None
+        # levels[h] holds items that each stand for 2**h original values
+        self._levels = [[]]
+        self._rng = random.Random(seed)
+        self._sorted = None
+        if values is not None:
+            self.update(values)
+
+    @classmethod
+    def from_error(cls, epsilon, seed=None):
+        """A sketch whose quantiles are within about epsilon in rank (99% confidence)."""
+        if not 0 < epsilon < 1:
+            raise ValueError(f"epsilon must be between 0 and 1, got {epsilon}.")
+        return cls(max(8, math.ceil(_KLL_ERROR_SCALE / epsilon)), seed)
+
+    def update(self, values):
+        """Add a chunk of values (a VectoPyArray, ChunkedArray, list or any iterable)."""
+        for chunk in _chunks_of(values):
+            chunk = list(chunk)
+            if not chunk:
+                continue
+            low, high = min(chunk), max(chunk)
+            if self._min is None or low < self._min:
+                self._min = low
+            if self._max is None or high > self._max:
+                self._max = high
+            self.count += len(chunk)
+            self._levels[0].extend(chunk)
+            self._compress()
+        return self
+
+    def push(self, value):
+        """Add a single value."""
+        return self.update((value,))
+
+    def merge(self, other):
+        """Fold another KLLSketch with the same k into this one."""
+        if self.k != other.k:
+            raise ValueError("Can only merge sketches with the same k.")
+        if not other.count:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for level, other_level in zip(self._levels, other._levels):
+            level.extend(other_level)
+        self.count += other.count
+        self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = other._max if self._max is None else max(self._max, other._max)
+        self._compress()
+        return self
+
+    def _capacity(self, h):
+        # Lower levels get geometrically smaller buffers (ratio 2/3), the top level k
+        return max(2, math.ceil(self.k * (2 / 3) ** (len(self._levels) - 1 - h)))
+
+    def _compress(self):
+        """Halve every full level: sort it and promote every other item (random offset)."""
+        self._sorted = None
+        compacted = True
+        while compacted:
+            compacted = False
+            for h, level in enumerate(self._levels):
+                if len(level) < self._capacity(h):
+                    continue
+                if h + 1 == len(self._levels):
+                    self._levels.append([])
+                level.sort()
+                # An odd item out stays on this level, so the total weight is preserved
+                even = len(level) - len(level) % 2
+                self._levels[h + 1].extend(level[self._rng.getrandbits(1):even:2])
+                self._levels[h] = level[even:]
+                compacted = True
+
+    def _cumulative(self):
+        """The retained items in order with the cumulative weight up to each one."""
+        if self._sorted is None:
+            items = sorted((x, 1 << h) for h, level in enumerate(self._levels) for x in level)
+            self._sorted = ([x for x, _ in items], list(accumulate(w for _, w in items)))
+        return self._sorted
+
+    @property
+    def size(self):
+        """Number of items retained by the sketch."""
+        return sum(map(len, self._levels))
+
+    def quantile(self, qs):
+        """Approximate quantile(s) for fractions `qs` in [0, 1] (a number or a sequence)."""
+        if not self.count:
+            raise ValueError("Cannot compute quantiles of an empty sketch.")
+        single = isinstance(qs, (int, float))
+        values, weights = self._cumulative()
+        results = []
+        for q in ((qs,) if single else qs):
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantiles must be between 0 and 1, got {q}.")
+            if q == 0:
+                results.append(self._min)
+            elif q == 1:
+                results.append(self._max)
+            else:
+                results.append(values[min(bisect_right(weights, q * (self.count - 1)), len(values) - 1)])
+        return results[0] if single else results
+
+    def rank(self, value):
+        """Approximate fraction of the values that are <= `value`."""
+        if not self.count:
+            raise ValueError("Cannot compute ranks of an empty sketch.")
+        values, weights = self._cumulative()
+        i = bisect_right(values, value)
+        return weights[i - 1] / self.count if i else 0.0
+
+    def __repr__(self):
+        return f"KLLSketch(k={self.k}, count={self.count}, size={self.size})"
+
+
+def _mixed_hashes(chunk):
+    """64-bit hashes with well-spread bits: Python's hash(), then multiply-xorshift-multiply.
+
+    Python hashes small ints to themselves, far too regular for HyperLogLog, and the
+    mixing steps run as chained C-level maps over the whole chunk.
+    """
+    first = list(map(operator.and_, map(operator.mul, map(hash, chunk), repeat(_MIX1)), repeat(_MASK64)))
+    shifted = map(operator.xor, first, map(operator.rshift, first, repeat(32)))
+    return map(operator.and_, map(operator.mul, shifted, repeat(_MIX2)), repeat(_MASK64))
+
+
+class HyperLogLog:
+    """Approximate number of distinct values in 2**p one-byte registers (HyperLogLog)."""
+
+    def __init__(self, p=14, values=None):
+        if not 4 <= p <= 18:
+            raise ValueError(f"p must be between 4 and 18, got {p}.")
+        self.p = p
+        self.count = 0
+        self._registers = _typed_array('B', bytes(1 << p))
+        if values is not None:
+            self.update(values)
+
+    def update(self, values):
+        """Add a chunk of values (a VectoPyArray, ChunkedArray, list or any iterable)."""
+        rest = 64 - self.p
+        registers = self._registers
+        for chunk in _chunks_of(values):
+            hashes = list(_mixed_hashes(chunk))
+            self.count += len(hashes)
+            # rank (leading zeros after the register bits, plus one) << p | register index;
+            # sorted ascending, dict() keeps the last, i.e. highest, rank for each register
+            keys = sorted(set(map(operator.or_,
+                                  map(operator.lshift,
+                                      map(operator.sub, repeat(rest + 1),
+                                          map(int.bit_length, map(operator.and_, hashes, repeat((1 << rest) - 1)))),
+                                      repeat(self.p)),
+                                  map(operator.rshift, hashes, repeat(rest)))))
+            mask = (1 << self.p) - 1
+            for index, rank in dict(zip(map(operator.and_, keys, repeat(mask)),
+                                        map(operator.rshift, keys, repeat(self.p)))).items():
+                if rank > registers[index]:
+                    registers[index] = rank
+        return self
+
+    def push(self, value):
+        """Add a single value."""
+        return self.update((value,))
+
+    def merge(self, other):
+        """Fold in another HyperLogLog with the same precision (register-wise maximum)."""
+        if self.p != other.p:
+            raise ValueError("Can only merge sketches with the same precision p.")
+        self._registers = _typed_array('B', map(max, self._registers, other._registers))
+        self.count += other.count
+        return self
+
+    @property
+    def error(self):
+        """Relative standard error of the estimate, 1.04 / sqrt(2**p)."""
+        return 1.04 / math.sqrt(1 << self.p)
+
+    def cardinality(self):
+        """Estimated number of distinct values added."""
+        m = 1 << self.p
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / math.fsum(map(math.ldexp, repeat(1.0), map(operator.neg, self._registers)))
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction: linear counting over the empty registers
+            estimate = m * math.log(m / zeros)
+        return estimate
+
+    def __repr__(self):
+        return f"HyperLogLog(p={self.p}, count={self.count}, cardinality~{round(self.cardinality())})"
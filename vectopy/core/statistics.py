@@ -3,67 +3,353 @@ Statistical operations for VectoPyArray.
 """
 
 from .arrays import VectoPyArray
+from . import parallel
+from .stats import RunningStats, Description
+from .sketches import MisraGries, KLLSketch
+from bisect import bisect_left, bisect_right
 from collections import Counter
-import math
+from itertools import chain, repeat
 import builtins
+import functools
+import operator
 
 
-def sum(self):
+def _memoized(func):
+    """Memoize a reduction on the array until its memory is next written.
+
+    Arguments only choose how the value is computed (e.g. `workers`), so they
+    are not part of the cache key.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self._cached(func.__name__, lambda: func(self, *args, **kwargs))
+    return wrapper
+
+@_memoized
+def sum(self, workers=None):
     """Sum of array elements."""
+    result = parallel.reduce(self, 'sum', workers)
+    if result is not None:
+        return result
     total = self._dtype(0)
-    for item in self._data:
-        total += item
+    for chunk in self._chunks():
+        total += builtins.sum(chunk)
     return total
 
-def max(self):
+@_memoized
+def max(self, workers=None):
     """Maximum value of the array."""
-    mx = self._data[0]  
-    for item in self._data:
-        if item > mx:
-            mx = item 
+    if self._known('is_sorted'):
+        return self._data[-1]
+    result = parallel.reduce(self, 'max', workers)
+    if result is not None:
+        return result
+    mx = self._data[0]
+    for chunk in self._chunks():
+        chunk_max = builtins.max(chunk)
+        if chunk_max > mx:
+            mx = chunk_max
     return mx
 
-def min(self):
+@_memoized
+def min(self, workers=None):
     """Minimum value of the array."""
-    mn = self._data[0]  
-    for item in self._data:
-        if item < mn:
-            mn = item 
+    if self._known('is_sorted'):
+        return self._data[0]
+    result = parallel.reduce(self, 'min', workers)
+    if result is not None:
+        return result
+    mn = self._data[0]
+    for chunk in self._chunks():
+        chunk_min = builtins.min(chunk)
+        if chunk_min < mn:
+            mn = chunk_min
     return mn
 
-def mean(self):
+@_memoized
+def minmax(self):
+    """Minimum and maximum together, as a (min, max) pair, in one pass over memory.
+
+    Each chunk is small enough to stay in cache, so its min() and max() scans read
+    main memory (or a memory-mapped file) only once.
+    """
+    if not len(self._data):
+        raise ValueError("Cannot compute minmax of empty array.")
+    if self._known('is_sorted'):
+        return self._data[0], self._data[-1]
+    low, high = self._known('min'), self._known('max')
+    if low is None or high is None:
+        low = high = self._data[0]
+        for chunk in self._chunks():
+            chunk_min, chunk_max = builtins.min(chunk), builtins.max(chunk)
+            if chunk_min < low:
+                low = chunk_min
+            if chunk_max > high:
+                high = chunk_max
+        self._remember('min', low)
+        self._remember('max', high)
+    return low, high
+
+def _running_stats(self, workers):
+    stats = parallel.reduce(self, 'stats', workers)
+    if stats is None:
+        stats = RunningStats(self)
+    if stats.count:
+        # The same pass produced these, with the same arithmetic as the dedicated methods
+        for key in ('sum', 'mean', 'min', 'max'):
+            self._remember(key, getattr(stats, key))
+    return stats
+
+def running_stats(self, workers=None):
+    """Single-pass, mergeable summary (count/mean/variance/std/min/max) of the array."""
+    stats = self._cached('running_stats', lambda: _running_stats(self, workers))
+    # Hand out a copy so updating it cannot corrupt the cached summary
+    return RunningStats().merge(stats)
+
+@_memoized
+def mean(self, workers=None):
     """Mean of the array elements."""
-    return self.sum() / len(self._data)
+    if not len(self._data):
+        raise ValueError("Cannot compute mean of empty array.")
+    # Same chunked single pass as RunningStats.mean, without also tracking spread and extremes
+    return self.sum(workers) / len(self._data)
 
-def std(self):
+@_memoized
+def std(self, workers=None):
     """Standard deviation of the array elements."""
-    m = self.mean()
-    mean_sqr = ((x - m) ** 2 for x in self._data)
-    sm = 0
-    for val in mean_sqr:
-        sm += val
-    variance = sm / len(self._data)
-    return math.sqrt(variance)
-
-def median(self):
-    """Median of the array elements."""
-    if not self._data:
+    if not len(self._data):
+        raise ValueError("Cannot compute standard deviation of empty array.")
+    return self.running_stats(workers).std
+
+# Below this size a partition is simply sorted
+_SELECT_CUTOFF = 32
+# With more positions than this, one full sort beats repeated partitioning
+_SELECT_MAX_TARGETS = 8
+
+def _select(data, ks):
+    """Return {k: k-th smallest element of `data`} for the sorted positions `ks`.
+
+    Multi-target quickselect: each pass splits the data around a median-of-three
+    pivot with C-level `filter` calls, and only the sides still holding requested
+    positions are kept, so one shared partitioning serves every k in O(n) expected
+    time. Like introselect, a run that stops shrinking quickly falls back to sorting.
+    """
+    found = {}
+    ks = sorted(set(ks))
+    depth_limit = 0 if len(ks) > _SELECT_MAX_TARGETS else 2 * builtins.max(len(data), 1).bit_length()
+    # Work items: (values, offset of values[0] in sorted order, positions wanted, depth)
+    pending = [(data, 0, ks, 0)]
+    while pending:
+        values, offset, wanted, depth = pending.pop()
+        n = len(values)
+        if n <= _SELECT_CUTOFF or depth >= depth_limit:
+            ordered = sorted(values)
+            for k in wanted:
+                found[k] = ordered[k - offset]
+            continue
+        a, b, c = values[0], values[n // 2], values[-1]
+        pivot = builtins.max(builtins.min(a, b), builtins.min(builtins.max(a, b), c))
+        lower = list(filter(functools.partial(operator.gt, pivot), values))
+        lower_end = offset + len(lower)
+        if wanted[-1] < lower_end:
+            # Everything requested lies below the pivot: the upper side is never built
+            pending.append((lower, offset, wanted, depth + 1))
+            continue
+        upper = list(filter(functools.partial(operator.lt, pivot), values))
+        equal_end = offset + n - len(upper)
+        below = [k for k in wanted if k < lower_end]
+        above = [k for k in wanted if k >= equal_end]
+        for k in wanted:
+            if lower_end <= k < equal_end:
+                found[k] = pivot
+        # A side whose only wanted position is its edge element needs one min/max scan,
+        # not another partitioning (common for the two neighbours of an interpolation)
+        if below == [lower_end - 1]:
+            found[below[0]] = builtins.max(lower)
+        elif below:
+            pending.append((lower, offset, below, depth + 1))
+        if above == [equal_end]:
+            found[above[0]] = builtins.min(upper)
+        elif above:
+            pending.append((upper, equal_end, above, depth + 1))
+    return found
+
+_QUANTILE_METHODS = ('linear', 'lower', 'higher', 'nearest', 'midpoint')
+
+def _select_chunks(chunks, n, ks, samples=1024):
+    """Like `_select`, for data only readable as chunks (memory maps, chunked arrays).
+
+    `chunks()` must return a fresh iterable of the data's chunks on every call. About
+    `samples` evenly strided values become sorted pivots; one counting pass places every
+    element in a bucket (strictly between two pivots, or equal to one) using C-level
+    bisect calls, and a second pass collects just the few open buckets holding a wanted
+    position, which are then sorted. Only the pivots and those buckets are ever held in
+    memory, never a copy of the data.
+    """
+    step = builtins.max(n // samples, 1)
+    pivots = sorted(set(chain.from_iterable(chunk[::step] for chunk in chunks())))
+    # bisect_left + bisect_right is 2b for pivots[b-1] < x < pivots[b] and 2b + 1 for x == pivots[b]
+    counts = Counter()
+    for chunk in chunks():
+        counts.update(map(operator.add, map(bisect_left, repeat(pivots), chunk),
+                          map(bisect_right, repeat(pivots), chunk)))
+    found, needed = {}, {}
+    start = 0
+    ks = sorted(set(ks))
+    for key in range(2 * len(pivots) + 1):
+        size = counts.get(key, 0)
+        inside = [k for k in ks if start <= k < start + size]
+        if inside:
+            if key % 2:
+                for k in inside:
+                    found[k] = pivots[key // 2]
+            else:
+                needed[key] = (start, inside)
+        start += size
+    for key, (start, inside) in needed.items():
+        b = key // 2
+        members = []
+        for chunk in chunks():
+            values = chunk
+            if b > 0:
+                values = filter(functools.partial(operator.lt, pivots[b - 1]), values)
+            if b < len(pivots):
+                values = filter(functools.partial(operator.gt, pivots[b]), values)
+            members.extend(values)
+        members.sort()
+        for k in inside:
+            found[k] = members[k - start]
+    return found
+
+def _interpolated_quantiles(n, qs, method, select):
+    """Quantiles `qs` of n values, given `select(positions) -> {position: value}`."""
+    if method not in _QUANTILE_METHODS:
+        raise ValueError(f"method must be one of {list(_QUANTILE_METHODS)}, got '{method}'.")
+    if not n:
+        raise ValueError("Cannot compute quantiles of empty array.")
+    positions = []
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantiles must be between 0 and 1, got {q}.")
+        h = (n - 1) * q
+        low = int(h)
+        positions.append((h, low, builtins.min(low + 1, n - 1)))
+    found = select([k for _, low, high in positions for k in (low, high)])
+    results = []
+    for h, low, high in positions:
+        frac = h - low
+        if method == 'lower' or (method == 'nearest' and round(h) == low):
+            results.append(found[low])
+        elif method in ('higher', 'nearest'):
+            results.append(found[high] if frac else found[low])
+        elif method == 'midpoint':
+            results.append((found[low] + found[high]) / 2 if frac else found[low])
+        else:
+            results.append(found[low] + (found[high] - found[low]) * frac)
+    return results
+
+def _quantiles(self, qs, method):
+    """Quantiles `qs` (fractions in [0, 1]) of the array, from one shared selection."""
+    if self._known('is_sorted'):
+        select = lambda wanted: {k: self._data[k] for k in wanted}
+    else:
+        select = lambda wanted: _select(self._data, wanted)
+    return _interpolated_quantiles(len(self._data), qs, method, select)
+
+def quantile(self, qs, method='linear', approx=False, eps=0.01):
+    """Quantile(s) of the array for fractions `qs` in [0, 1] (a number or a sequence).
+
+    All quantiles come from one shared selection pass, O(n) expected time. `method`
+    picks the value between the two nearest elements like NumPy: 'linear', 'lower',
+    'higher', 'nearest' or 'midpoint'. With `approx=True` they come from a cached KLL
+    sketch instead (see `median`) and `method` is ignored.
+    """
+    single = isinstance(qs, (int, float))
+    if approx:
+        return _sketch(self, eps).quantile(qs)
+    key = ('quantile', (qs,) if single else tuple(qs), method)
+    results = self._cached(key, lambda: _quantiles(self, key[1], method))
+    return results[0] if single else list(results)
+
+def percentile(self, ps, method='linear', approx=False, eps=0.01):
+    """Percentile(s) of the array for `ps` in [0, 100]; see `quantile`."""
+    if isinstance(ps, (int, float)):
+        return self.quantile(ps / 100, method, approx, eps)
+    return self.quantile([p / 100 for p in ps], method, approx, eps)
+
+def _describe(self, quantiles, method, chunked, workers):
+    if not len(self._data):
+        raise ValueError("Cannot describe empty array.")
+    if not chunked:
+        return Description(self.running_stats(workers), quantiles, self.quantile(list(quantiles), method))
+    # One pass for the moments, then the chunked selection: nothing n-sized is allocated
+    stats = RunningStats(self)
+    select = lambda wanted: _select_chunks(self._chunks, len(self._data), wanted)
+    return Description(stats, quantiles, _interpolated_quantiles(len(self._data), quantiles, method, select))
+
+def describe(self, quantiles=(0.25, 0.5, 0.75), method='linear', chunked=False, workers=None):
+    """Summary statistics (count, sum, mean, variance, std, min, max and quantiles).
+
+    The moments come from one fused pass and the quantiles from one shared selection.
+    With `chunked=True` the data is only read chunk by chunk and never copied, which
+    suits memory-mapped arrays larger than RAM.
+    """
+    quantiles = tuple(quantiles)
+    return self._cached(('describe', quantiles, method),
+                        lambda: _describe(self, quantiles, method, chunked, workers))
+
+def _median(self):
+    n = len(self._data)
+    if not n:
         raise ValueError("Cannot compute median of empty array.")
-    sorted_data = sorted(self._data)
-    n = len(sorted_data)
+    if self._known('is_sorted'):
+        data = self._data
+        return data[n // 2] if n % 2 == 1 else (data[n // 2 - 1] + data[n // 2]) / 2
     if n % 2 == 1:
-        return sorted_data[n // 2]
-    else:
-        return (sorted_data[n // 2 - 1] + sorted_data[n // 2]) / 2
-    
-def mode(self):
-    """Find the most frequent element(s)."""
+        return _select(self._data, [n // 2])[n // 2]
+    found = _select(self._data, [n // 2 - 1, n // 2])
+    return (found[n // 2 - 1] + found[n // 2]) / 2
+
+def median(self, approx=False, eps=0.01):
+    """Median of the array elements, found by selection in O(n) expected time.
+
+    With `approx=True` it is read from a KLL quantile sketch built chunk by chunk in
+    O(log n / eps) memory; its rank is within about `eps` of 0.5 (99% confidence).
+    """
+    if approx:
+        return self.quantile(0.5, approx=True, eps=eps)
+    return self._cached('median', lambda: _median(self))
+
+def _sketch(self, eps):
+    """The array's KLL sketch for rank error `eps`, built once and cached like a reduction."""
+    if not len(self._data):
+        raise ValueError("Cannot compute quantiles of empty array.")
+    # A fixed seed keeps approximate results repeatable for the same data
+    return self._cached(('kll', eps), lambda: KLLSketch.from_error(eps, seed=0).update(self))
+
+def mode(self, approx=False, k=1024):
+    """Find the most frequent element(s).
+
+    With `approx=True` the values are counted chunk by chunk in a Misra-Gries sketch
+    of `k` counters instead of one Counter holding every distinct value, so memory
+    stays bounded on high-cardinality data. The result is exact whenever the array
+    has at most `k` distinct values, and otherwise each count it compares is low by
+    at most len(array) / (k + 1). When no value occurs often enough to survive in
+    the sketch (e.g. all values distinct), there is no meaningful approximate mode
+    and ValueError is raised.
+    """
     if not self._data:
         raise ValueError("Cannot find mode of empty array.")
     
-    counter = Counter(self._data)
-    max_count = builtins.max(counter.values())
-    modes = [item for item, count in counter.items() if count == max_count]
+    if approx:
+        counts = MisraGries(k, self).most_common()
+        if not counts:
+            raise ValueError(f"No value occurs more than len(array) / {k + 1} times; "
+                             "use approx=False for the exact mode.")
+    else:
+        counts = Counter(self._data).items()
+    max_count = builtins.max(count for _, count in counts)
+    modes = [item for item, count in counts if count == max_count]
     
     if len(modes) == 1:
         return modes[0]
@@ -74,7 +360,12 @@ def mode(self):
 VectoPyArray.sum = sum
 VectoPyArray.max = max
 VectoPyArray.min = min
+VectoPyArray.minmax = minmax
+VectoPyArray.running_stats = running_stats
 VectoPyArray.mean = mean
 VectoPyArray.std = std
 VectoPyArray.median = median
+VectoPyArray.quantile = quantile
+VectoPyArray.percentile = percentile
+VectoPyArray.describe = describe
 VectoPyArray.mode = mode
\ No newline at end of file
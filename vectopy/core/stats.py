@@ -0,0 +1,148 @@
+"""
+Mergeable streaming statistics.
+
+RunningStats summarizes data seen chunk by chunk in O(1) memory. Each chunk
+is reduced on its own (sum, mean and sum of squared deviations around the
+chunk mean, while it is hot in cache), then folded into the running totals
+with Chan et al.'s parallel update. Two RunningStats built on different
+pieces of the data, even in different processes, combine exactly with
+`merge()`.
+"""
+
+import math
+from array import array as _typed_array
+
+
+class RunningStats:
+    """Count, sum, mean, variance, std, min and max of a stream of numbers."""
+
+    def __init__(self, values=None):
+        self.count = 0
+        self._sum = 0
+        self._m2 = 0.0
+        self._min = None
+        self._max = None
+        if values is not None:
+            self.update(values)
+
+    def update(self, values):
+        """Add a chunk of values (a VectoPyArray, memoryview, list or any iterable)."""
+        if hasattr(values, '_chunks'):
+            for chunk in values._chunks():
+                self._update_chunk(chunk)
+            return self
+        if not isinstance(values, (list, tuple, memoryview, _typed_array)):
+            values = list(values)
+        self._update_chunk(values)
+        return self
+
+    def push(self, value):
+        """Add a single value (Welford's update)."""
+        old_mean = self._mean_or_zero()
+        self.count += 1
+        self._sum += value
+        self._m2 += (value - old_mean) * (value - self._sum / self.count)
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+        return self
+
+    def _update_chunk(self, chunk):
+        n = len(chunk)
+        if n == 0:
+            return
+        chunk_sum = sum(chunk)
+        chunk_mean = chunk_sum / n
+        chunk_m2 = sum([(x - chunk_mean) * (x - chunk_mean) for x in chunk])
+        self._combine(n, chunk_sum, chunk_m2, min(chunk), max(chunk))
+
+    def _combine(self, n, total, m2, low, high):
+        """Chan et al.'s update of (count, sum, M2) with another group's summary."""
+        if self.count == 0:
+            self.count, self._sum, self._m2, self._min, self._max = n, total, m2, low, high
+            return
+        delta = total / n - self._sum / self.count
+        combined = self.count + n
+        self._m2 += m2 + delta * delta * self.count * n / combined
+        self.count = combined
+        self._sum += total
+        if low < self._min:
+            self._min = low
+        if high > self._max:
+            self._max = high
+
+    def merge(self, other):
+        """Fold another RunningStats (e.g. from another chunk or worker) into this one."""
+        if other.count:
+            self._combine(other.count, other._sum, other._m2, other._min, other._max)
+        return self
+
+    def _mean_or_zero(self):
+        return self._sum / self.count if self.count else 0.0
+
+    def _require_data(self):
+        if not self.count:
+            raise ValueError("No values have been added to these statistics.")
+
+    @property
+    def sum(self):
+        return self._sum
+
+    @property
+    def mean(self):
+        self._require_data()
+        return self._sum / self.count
+
+    @property
+    def variance(self):
+        """Population variance (divides by count, like VectoPyArray.std)."""
+        self._require_data()
+        return self._m2 / self.count
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self):
+        self._require_data()
+        return self._min
+
+    @property
+    def max(self):
+        self._require_data()
+        return self._max
+
+    def __repr__(self):
+        if not self.count:
+            return "RunningStats(count=0)"
+        return (f"RunningStats(count={self.count}, mean={self.mean}, std={self.std}, "
+                f"min={self._min}, max={self._max})")
+
+
+class Description:
+    """The result of `describe()`: a fixed set of summary statistics."""
+
+    __slots__ = ('count', 'sum', 'mean', 'variance', 'std', 'min', 'max', 'quantiles')
+
+    def __init__(self, stats, quantiles, values):
+        self.count = stats.count
+        self.sum = stats.sum
+        self.mean = stats.mean
+        self.variance = stats.variance
+        self.std = stats.std
+        self.min = stats.min
+        self.max = stats.max
+        self.quantiles = dict(zip(quantiles, values))
+
+    def as_dict(self):
+        """All statistics as a plain dict (quantiles keyed like '25%')."""
+        result = {name: getattr(self, name) for name in self.__slots__[:-1]}
+        for q, value in self.quantiles.items():
+            result[f"{q * 100:g}%"] = value
+        return result
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={value}" for name, value in self.as_dict().items())
+        return f"Description({fields})"
@@ -0,0 +1,233 @@
+"""
+Lazy, chunked streaming pipelines.
+
+`vp.stream(iterable)` reads any iterable, even an unbounded one, in chunks of
+`chunk_size` values. Each stage (`diff`, `shift`, `cumulative_sum`, ...) wraps
+the chunk generator of the previous one, carrying only the few values it needs
+across chunk boundaries, so a pipeline runs in constant memory. Nothing is read
+until a terminal step pulls chunks through: a reduction (`sum`, `mean`, `std`,
+...), `batches()` for VectoPyArrays of bounded size, or `collect()`.
+"""
+
+import operator
+from itertools import accumulate, chain, islice, repeat
+
+from .arrays import VectoPyArray
+from .stats import RunningStats
+from ._internals import _CHUNK_SIZE, _resolve_dtype
+
+
+class Stream:
+    """A lazy pipeline over chunks of values; each stage returns a new Stream."""
+
+    def __init__(self, chunks, dtype):
+        self._source = chunks
+        self._dtype = dtype
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    def __repr__(self):
+        return f"Stream(dtype={self._dtype})"
+
+    def __iter__(self):
+        return chain.from_iterable(self._source)
+
+    def _chunks(self):
+        """The chunks still to come (consumed as they are read)."""
+        return self._source
+
+    def _stage(self, chunks, dtype=None):
+        return Stream(chunks, dtype or self._dtype)
+
+    # ---- Stages ----
+
+    def diff(self):
+        """Differences between consecutive values (one value shorter than the input)."""
+        def differences(chunks):
+            previous = None
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                result = list(map(operator.sub, chunk[1:], chunk))
+                if previous is not None:
+                    result.insert(0, chunk[0] - previous)
+                previous = chunk[-1]
+                yield result
+        return self._stage(differences(self._source))
+
+    def shift(self, periods=1):
+        """Shift values by `periods`, filling with zeros like `VectoPyArray.shift`."""
+        fill = self._dtype(0)
+
+        def shifted_right(chunks):
+            # The last `periods` values are held back and dropped at the end of the stream
+            pending = [fill] * periods
+            for chunk in chunks:
+                pending.extend(chunk)
+                if len(pending) > periods:
+                    yield pending[:-periods]
+                    pending = pending[-periods:]
+
+        def shifted_left(chunks):
+            to_skip = -periods
+            for chunk in chunks:
+                if to_skip:
+                    dropped = min(to_skip, len(chunk))
+                    to_skip -= dropped
+                    chunk = chunk[dropped:]
+                if chunk:
+                    yield chunk
+            # Zeros only replace values that were actually dropped
+            filled = -periods - to_skip
+            if filled:
+                yield [fill] * filled
+
+        if periods == 0:
+            return self._stage(self._source)
+        if periods > 0:
+            return self._stage(shifted_right(self._source))
+        return self._stage(shifted_left(self._source))
+
+    def cumulative_sum(self):
+        """Running total of the values."""
+        def prefix_sums(chunks):
+            current_sum = self._dtype(0)
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                sums = accumulate(chunk, initial=current_sum)
+                next(sums)
+                result = list(sums)
+                current_sum = result[-1]
+                yield result
+        return self._stage(prefix_sums(self._source))
+
+    def moving_average(self, window):
+        """Average of each full window of `window` consecutive values."""
+        if window <= 0:
+            raise ValueError("Window size must be positive.")
+
+        def averages(chunks):
+            tail = []  # the last window - 1 values, for windows spanning two chunks
+            for chunk in chunks:
+                values = tail + list(chunk)
+                if len(values) >= window:
+                    # Prefix sums restart at every chunk, so rounding cannot build up
+                    sums = list(accumulate(values, initial=0))
+                    yield list(map(operator.truediv, map(operator.sub, sums[window:], sums[:-window]),
+                                   repeat(window)))
+                tail = values[1 - window:] if window > 1 else []
+        return self._stage(averages(self._source), float)
+
+    def clip(self, min_val, max_val):
+        """Clip the values to be between min_val and max_val."""
+        def clipped(chunks):
+            for chunk in chunks:
+                yield [max(min_val, min(x, max_val)) for x in chunk]
+        return self._stage(clipped(self._source))
+
+    def minmax_scale(self, fit_on):
+        """Scale values to [0, 1] using the min and max of `fit_on`.
+
+        A stream cannot look ahead, so the range comes from reference data: an
+        array, any iterable of values, or simply a `(min, max)` pair.
+        """
+        low, high = min(fit_on), max(fit_on)
+        span = high - low
+
+        def scaled(chunks):
+            for chunk in chunks:
+                if span == 0:
+                    yield [0.5] * len(chunk)
+                else:
+                    yield [(x - low) / span for x in chunk]
+        return self._stage(scaled(self._source), float)
+
+    # ---- Terminal steps ----
+
+    def batches(self, size=None):
+        """Yield the stream as VectoPyArrays of `size` values (default: as chunks arrive)."""
+        chunks = self._source
+        if size is not None:
+            if size <= 0:
+                raise ValueError("Batch size must be positive.")
+            values = iter(self)
+            chunks = iter(lambda: list(islice(values, size)), [])
+        for chunk in chunks:
+            if chunk:
+                yield VectoPyArray._from_chunks(self._dtype, [list(chunk)])
+
+    def collect(self):
+        """Materialize the whole (finite) stream into one VectoPyArray."""
+        result = VectoPyArray._from_chunks(self._dtype, (list(chunk) for chunk in self._source))
+        if not len(result):
+            raise ValueError("Cannot collect an empty stream.")
+        return result
+
+    def sum(self):
+        """Sum of all values."""
+        total = self._dtype(0)
+        for chunk in self._source:
+            total += sum(chunk)
+        return total
+
+    def min(self):
+        """Minimum value."""
+        return self._extreme(min)
+
+    def max(self):
+        """Maximum value."""
+        return self._extreme(max)
+
+    def _extreme(self, pick):
+        best = None
+        for chunk in self._source:
+            if chunk:
+                value = pick(chunk)
+                best = value if best is None else pick(best, value)
+        if best is None:
+            raise ValueError("Cannot reduce an empty stream.")
+        return best
+
+    def running_stats(self):
+        """Count, mean, variance, std, min and max of the stream in one pass."""
+        stats = RunningStats()
+        for chunk in self._source:
+            stats.update(chunk)
+        return stats
+
+    def mean(self):
+        """Mean of all values."""
+        total, count = self._dtype(0), 0
+        for chunk in self._source:
+            total += sum(chunk)
+            count += len(chunk)
+        if not count:
+            raise ValueError("Cannot compute mean of empty stream.")
+        return total / count
+
+    def std(self):
+        """Standard deviation of all values."""
+        stats = self.running_stats()
+        if not stats.count:
+            raise ValueError("Cannot compute standard deviation of empty stream.")
+        return stats.std
+
+
+def stream(iterable, dtype=float, chunk_size=_CHUNK_SIZE):
+    """Start a lazy pipeline over any iterable, read `chunk_size` values at a time."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    py_type = _resolve_dtype(dtype)[0]
+    values = iter(iterable)
+
+    def chunks():
+        while True:
+            chunk = list(map(py_type, islice(values, chunk_size)))
+            if not chunk:
+                return
+            yield chunk
+
+    return Stream(chunks(), py_type)
@@ -3,42 +3,280 @@ Time series operations for NDArray1D.
 """
 
 from .arrays import VectoPyArray
+from . import parallel
+from ._internals import _CHUNK_SIZE
+from array import array as _typed_array
+from collections import deque
+from itertools import accumulate, repeat
+import math
+import operator
 
-def moving_average(self, window):
-    """Calculate moving average with given window size."""
+# ---- Sliding-window engine ----
+# Each state generator walks the window's end across the data once. For every end
+# position e = 1, ..., n + tail it yields the state of the window data[e - window:e]
+# (clipped to the data), updated in O(1) amortized time from the previous window:
+# the entering element is added and the element falling out is removed. The `tail`
+# extra steps only remove elements; centered windows need them at the end.
+
+def _window_sums(data, window, tail, exact):
+    """Window sums; float data is summed with Neumaier compensation."""
+    n = len(data)
+    if exact:
+        total = 0
+        for e in range(n + tail):
+            if e < n:
+                total += data[e]
+            if e >= window:
+                total -= data[e - window]
+            yield total
+        return
+    total = compensation = 0.0
+    for e in range(n + tail):
+        if e < n:
+            x = data[e]
+            t = total + x
+            if abs(total) >= abs(x):
+                compensation += (total - t) + x
+            else:
+                compensation += (x - t) + total
+            total = t
+        if e >= window:
+            x = -data[e - window]
+            t = total + x
+            if abs(total) >= abs(x):
+                compensation += (total - t) + x
+            else:
+                compensation += (x - t) + total
+            total = t
+        yield total + compensation
+
+def _window_moments(data, window, tail):
+    """(count, mean, M2) of each window, with Welford's add and remove updates."""
+    n = len(data)
+    count, mean, m2 = 0, 0.0, 0.0
+    same = 0  # length of the run of equal values ending at the newest element
+    for e in range(n + tail):
+        if e < n:
+            x = data[e]
+            same = same + 1 if same and x == data[e - 1] else 1
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        if e >= window:
+            x = data[e - window]
+            count -= 1
+            if count:
+                delta = x - mean
+                mean -= delta / count
+                m2 -= delta * (x - mean)
+            else:
+                mean, m2 = 0.0, 0.0
+        if count and same >= count:
+            # A constant window: reset exactly, dropping the rounding left by removals
+            mean, m2 = float(data[min(e, n - 1)]), 0.0
+        # Rounding can push M2 of a near-constant window slightly below zero
+        yield count, mean, m2 if m2 > 0 else 0.0
+
+def _window_extremes(data, window, tail, better):
+    """Window min (better=operator.lt) or max (operator.gt) from a monotonic deque."""
+    n = len(data)
+    candidates = deque()  # indices whose values get strictly worse from front to back
+    for e in range(n + tail):
+        if e < n:
+            x = data[e]
+            while candidates and not better(data[candidates[-1]], x):
+                candidates.pop()
+            candidates.append(e)
+        if candidates and candidates[0] <= e - window:
+            candidates.popleft()
+        yield data[candidates[0]] if candidates else None
+
+def _rolling(self, window, min_periods, center, states, finish):
+    """Run a state generator over the array and build the output of one rolling method."""
+    n = len(self._data)
     if window <= 0:
         raise ValueError("Window size must be positive.")
-    if window > len(self._data):
+    if window > n:
         raise ValueError("Window size cannot be larger than array size.")
-    
-    result = []
-    for i in range(len(self._data) - window + 1):
-        window_data = self._data[i:i + window]
-        window_avg = sum(window_data) / window
-        result.append(window_avg)
-    
-    return VectoPyArray((len(result),), dtype=float, buffer=result)
+    if min_periods is None:
+        min_periods = window
+    if not 1 <= min_periods <= window:
+        raise ValueError("min_periods must be between 1 and the window size.")
+    # A centered window ending at e is reported at e - 1 - offset instead of e - 1
+    offset = (window - 1) // 2 if center else 0
+
+    def values():
+        result = []
+        for e, state in enumerate(states(self._data, window, offset), 1):
+            if e <= offset:
+                continue
+            count = min(e, n) - max(e - window, 0)
+            result.append(finish(state, count) if count >= min_periods else math.nan)
+            if len(result) == _CHUNK_SIZE:
+                yield result
+                result = []
+        yield result
+
+    return VectoPyArray._from_chunks(float, values())
+
+def rolling_sum(self, window, min_periods=None, center=False):
+    """Sum over a sliding window, in O(n) time.
+
+    Element i covers the `window` elements ending at i (or centered on i). Windows
+    with fewer than `min_periods` elements (default: the full window) give NaN.
+    """
+    exact = self._dtype is int
+    return _rolling(self, window, min_periods, center,
+                    lambda data, w, tail: _window_sums(data, w, tail, exact),
+                    lambda total, count: total)
+
+def rolling_mean(self, window, min_periods=None, center=False):
+    """Mean over a sliding window, in O(n) time; see `rolling_sum`."""
+    exact = self._dtype is int
+    return _rolling(self, window, min_periods, center,
+                    lambda data, w, tail: _window_sums(data, w, tail, exact),
+                    lambda total, count: total / count)
+
+def rolling_min(self, window, min_periods=None, center=False):
+    """Minimum over a sliding window, in O(n) time; see `rolling_sum`."""
+    return _rolling(self, window, min_periods, center,
+                    lambda data, w, tail: _window_extremes(data, w, tail, operator.lt),
+                    lambda value, count: value)
+
+def rolling_max(self, window, min_periods=None, center=False):
+    """Maximum over a sliding window, in O(n) time; see `rolling_sum`."""
+    return _rolling(self, window, min_periods, center,
+                    lambda data, w, tail: _window_extremes(data, w, tail, operator.gt),
+                    lambda value, count: value)
+
+def _variance(state, count, ddof):
+    return state[2] / (count - ddof) if count > ddof else math.nan
+
+def rolling_var(self, window, min_periods=None, center=False, ddof=0):
+    """Variance over a sliding window, in O(n) time; see `rolling_sum`.
+
+    `ddof=0` gives the population variance, like `std()`; use `ddof=1` for the sample variance.
+    """
+    return _rolling(self, window, min_periods, center, _window_moments,
+                    lambda state, count: _variance(state, count, ddof))
+
+def rolling_std(self, window, min_periods=None, center=False, ddof=0):
+    """Standard deviation over a sliding window, in O(n) time; see `rolling_var`."""
+    return _rolling(self, window, min_periods, center, _window_moments,
+                    lambda state, count: math.sqrt(_variance(state, count, ddof)))
+
+def _prefix_sums(data, exact):
+    """Prefix sums of `data` with a leading 0, as (high, low) parts.
+
+    Integer data gives exact sums in a typed 'q' buffer (a list of Python ints if they
+    overflow 64 bits) and no low part. Float data is summed with
+    Neumaier compensation: `high` holds the rounded running total and `low` the
+    accumulated rounding error, so a window sum (high[e] - high[s]) + (low[e] - low[s])
+    keeps full precision even far into a long series.
+    """
+    if exact:
+        try:
+            return _typed_array('q', accumulate(data, initial=0)), None
+        except OverflowError:
+            return list(accumulate(data, initial=0)), None
+    high = _typed_array('d', [0.0]) * (len(data) + 1)
+    low = _typed_array('d', [0.0]) * (len(data) + 1)
+    total = compensation = 0.0
+    for i, x in enumerate(data, 1):
+        t = total + x
+        if abs(total) >= abs(x):
+            compensation += (total - t) + x
+        else:
+            compensation += (x - t) + total
+        total = t
+        high[i] = total
+        low[i] = compensation
+    return high, low
+
+def _window_averages(prefix, window):
+    """Averages of every full window from prefix sums, computed with C-level map passes."""
+    high, low = prefix
+    # Slices of memoryviews share the prefix arrays instead of copying them
+    if isinstance(high, _typed_array):
+        high = memoryview(high)
+    if low is not None:
+        low = memoryview(low)
+    sums = map(operator.sub, high[window:], high[:-window])
+    if low is not None:
+        sums = map(operator.add, sums, map(operator.sub, low[window:], low[:-window]))
+    return VectoPyArray._from_storage(float, _typed_array('d', map(operator.truediv, sums, repeat(window))))
+
+def _check_window(arr, window):
+    if window <= 0:
+        raise ValueError("Window size must be positive.")
+    if window > len(arr._data):
+        raise ValueError("Window size cannot be larger than array size.")
+
+def multi_window(arr, windows):
+    """Moving averages of `arr` for several window sizes, as a dict {window: array}.
+
+    The data is read once to build compensated prefix sums; each window is then
+    derived from them in O(n), without touching the source data again. The prefix
+    sums take O(n) extra memory, so a single window uses `rolling_mean` instead.
+    """
+    for window in windows:
+        _check_window(arr, window)
+    prefix = _prefix_sums(arr._data, arr._dtype is int)
+    return {window: _window_averages(prefix, window) for window in windows}
+
+def moving_average(self, window=None, windows=None):
+    """Calculate moving average with given window size.
+
+    Pass `windows=[...]` instead to get a dict {window: array} for several sizes
+    from a single pass over the data (see `multi_window`).
+    """
+    if windows is not None:
+        return multi_window(self, windows)
+    if window is None:
+        raise TypeError("moving_average() needs a window or a list of windows.")
+    _check_window(self, window)
+    # Only full windows: one running total, chunk by chunk, instead of prefix sums
+    return self.rolling_mean(window)[window - 1:].copy()
 
 def diff(self):
     """Calculate differences between consecutive elements."""
     if len(self._data) < 2:
         raise ValueError("Need at least 2 elements for differences.")
-    differences = [self._data[i + 1] - self._data[i] for i in range(len(self._data) - 1)]
-    return VectoPyArray((len(differences),), dtype=self._dtype, buffer=differences)
 
-def cumulative_sum(self):
+    def differences():
+        previous = None
+        for chunk in self._chunks():
+            result = list(map(operator.sub, chunk[1:], chunk))
+            if previous is not None:
+                # Stitch the difference across the chunk boundary
+                result.insert(0, chunk[0] - previous)
+            previous = chunk[-1]
+            yield result
+
+    return VectoPyArray._from_chunks(self._dtype, differences())
+
+def cumulative_sum(self, workers=None):
     """Calculate cumulative sum (prefix sum)."""
-    result = []
-    current_sum = self._dtype(0)
-    for item in self._data:
-        current_sum += item
-        result.append(current_sum)
-    return VectoPyArray(self.shape, dtype=self._dtype, buffer=result)
+    storage = parallel.cumulative_sum(self, workers)
+    if storage is not None:
+        return VectoPyArray._from_storage(self._dtype, storage)
+
+    def prefix_sums():
+        current_sum = self._dtype(0)
+        for chunk in self._chunks():
+            sums = accumulate(chunk, initial=current_sum)
+            next(sums)
+            result = list(sums)
+            current_sum = result[-1]
+            yield result
+
+    return VectoPyArray._from_chunks(self._dtype, prefix_sums())
 
 def shift(self, periods=1):
     """Shift array elements by periods."""
     if periods == 0:
-        return VectoPyArray(self.shape, dtype=self._dtype, buffer=self._data.copy())
+        return VectoPyArray(self.shape, dtype=self._dtype, buffer=self._data[:])
     
     shifted_data = [self._dtype(0)] * len(self._data)
     if periods > 0:
@@ -49,6 +287,12 @@ def shift(self, periods=1):
     return VectoPyArray(self.shape, dtype=self._dtype, buffer=shifted_data)
 
 # Attach methods to VectoPyArray
+VectoPyArray.rolling_sum = rolling_sum
+VectoPyArray.rolling_mean = rolling_mean
+VectoPyArray.rolling_min = rolling_min
+VectoPyArray.rolling_max = rolling_max
+VectoPyArray.rolling_var = rolling_var
+VectoPyArray.rolling_std = rolling_std
 VectoPyArray.moving_average = moving_average
 VectoPyArray.diff = diff
 VectoPyArray.cumulative_sum = cumulative_sum
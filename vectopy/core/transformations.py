@@ -4,41 +4,60 @@ Data transformation operations for VectoPyArray.
 
 from .arrays import VectoPyArray
 
-def normalize(self):
+def _result(self, values, dtype, out):
+    """Wrap `values` in a new array, or write them into `out` when one is given."""
+    if out is None:
+        return VectoPyArray(self.shape, dtype=dtype, buffer=values)
+    return out._write(values, dtype)
+
+def normalize(self, out=None):
     """Normalize the vector to have mean 0 and standard deviation 1."""
     # This is a unique VectoPy method!
     if len(self._data) < 2:
         raise ValueError("Normalization requires at least two elements.")
-    mu = self.mean()
+    # std() finds the mean in the same pass and caches it, so mean() is free afterwards
     sigma = self.std()
+    mu = self.mean()
     if sigma == 0:
-        return VectoPyArray(self.shape, dtype=float, buffer=[0.0] * self._size)
+        return _result(self, [0.0] * self._size, float, out)
     normalized_data = [(x - mu) / sigma for x in self._data]
-    return VectoPyArray(self.shape, dtype=float, buffer=normalized_data)
+    return _result(self, normalized_data, float, out)
 
-def clip(self, min_val, max_val):
+def clip(self, min_val, max_val, out=None):
     """Clip the values in the array to be between min_val and max_val."""
     clipped_data = [max(min_val, min(x, max_val)) for x in self._data]
-    return VectoPyArray(self.shape, dtype=self._dtype, buffer=clipped_data)
+    return _result(self, clipped_data, self._dtype, out)
 
 def reverse(self):
     """Return a reversed copy of the array."""
     return VectoPyArray(self.shape, dtype=self._dtype, buffer=list(reversed(self._data)))
 
-def minmax_scale(self):
+def minmax_scale(self, out=None):
     """Scale array to [0, 1] range."""
     if not self._data:
         raise ValueError("Cannot scale empty array.")
-    min_val = self.min()
-    max_val = self.max()
+    min_val, max_val = self.minmax()
     if min_val == max_val:
-        return VectoPyArray(self.shape, dtype=float, buffer=[0.5] * self._size)
+        return _result(self, [0.5] * self._size, float, out)
     scaled_data = [(x - min_val) / (max_val - min_val) for x in self._data]
-    return VectoPyArray(self.shape, dtype=float, buffer=scaled_data)
+    return _result(self, scaled_data, float, out)
+
+def robust_scale(self, out=None):
+    """Center on the median and scale by the interquartile range (robust to outliers)."""
+    if not self._data:
+        raise ValueError("Cannot scale empty array.")
+    # One selection pass finds all three quartiles
+    q1, med, q3 = self.quantile([0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    if iqr == 0:
+        return _result(self, [0.0] * self._size, float, out)
+    scaled_data = [(x - med) / iqr for x in self._data]
+    return _result(self, scaled_data, float, out)
 
 # Attach methods to VectoPyArray
 VectoPyArray.normalize = normalize
 VectoPyArray.clip = clip
 VectoPyArray.reverse = reverse
 VectoPyArray.minmax_scale = minmax_scale
+VectoPyArray.robust_scale = robust_scale
 
@@ -48,6 +48,23 @@ def test_all_same():
     assert result == 7  # 5/5 is definitely majority!
 
 
+def test_majority_approx():
+    """Test the single-pass sketch-based majority element."""
+    arr = vp.array(list(range(1000)) + [-3] * 1200)
+    assert arr.majority_element(approx=True, k=8) == -3
+    try:
+        vp.array([1, 2, 1, 2]).majority_element(approx=True)
+        assert False, "Should have raised an error!"
+    except ValueError as e:
+        assert "No majority" in str(e)
+    # More distinct values than counters: every counter cancels out
+    try:
+        vp.arange(2000).majority_element(approx=True)
+        assert False, "Should have raised an error!"
+    except ValueError as e:
+        assert "No majority" in str(e)
+
+
 # Test unique method
 def test_basic_unique():
     """Test basic duplicate removal."""
@@ -81,6 +98,45 @@ def test_single_element_unique():
     assert len(result) == 1
 
 
+def test_unique_index_and_counts():
+    """Test first indices and counts come out aligned, in first-occurrence order."""
+    arr = vp.array([3, 1, 3, 2, 1, 3])
+    values, index, counts = arr.unique(return_index=True, return_counts=True)
+    assert values.data == [3, 1, 2]
+    assert index.data == [0, 1, 3]
+    assert counts.data == [3, 2, 1]
+    assert arr.unique(return_counts=True)[1].data == [3, 2, 1]
+    # Sorted arrays use the run boundaries
+    arr = vp.array([1, 1, 2, 5, 5, 5])
+    arr.is_sorted()
+    values, index, counts = arr.unique(return_index=True, return_counts=True)
+    assert (values.data, index.data, counts.data) == ([1, 2, 5], [0, 2, 3], [2, 1, 3])
+
+def test_unique_keeps_storage_whether_sorted_or_not():
+    """Test the sorted and unsorted paths return the same values in the same storage."""
+    for values, dtype in (([1, 1, 2, 5], 'i'), ([1, 1, 2, 5], int), ([0.5, 0.5, 2.0], float)):
+        for options in ({}, {'return_index': True}, {'return_counts': True},
+                        {'return_index': True, 'return_counts': True}):
+            unsorted = vp.array(values, dtype=dtype).unique(**options)
+            known_sorted = vp.array(values, dtype=dtype)
+            assert known_sorted.is_sorted()
+            result = known_sorted.unique(**options)
+            if options:
+                unsorted, result = unsorted[0], result[0]
+            assert sorted(unsorted.data) == result.data
+            assert (unsorted.dtype, unsorted.typecode) == (result.dtype, result.typecode)
+
+def test_count_distinct():
+    """Test exact and HyperLogLog distinct counts."""
+    arr = vp.array([i % 3000 for i in range(10000)])
+    assert arr.count_distinct() == 3000
+    assert abs(arr.count_distinct(approx=True) - 3000) <= 0.05 * 3000
+    assert abs(arr.count_distinct(approx=True, p=10) - 3000) <= 0.15 * 3000
+    arr = vp.array([1.5, 1.5, 2.5])
+    arr.is_sorted()
+    assert arr.count_distinct() == 2
+
+
 # Test is_monotonic  
 def test_strictly_increasing():
     """Test strictly increasing array."""
@@ -120,4 +176,59 @@ def test_single_element():
 def test_up_then_down():
     """Test array that increases then decreases."""
     arr = vp.array([1, 2, 3, 2, 1])
-    assert arr.is_monotonic() == False  # Not monotonic
\ No newline at end of file
+    assert arr.is_monotonic() == False  # Not monotonic
+
+# Test sorting and searching
+def test_sort_and_argsort():
+    """Test sort returns a flagged sorted copy and argsort its order."""
+    arr = vp.array([30, 10, 20, 10])
+    result = arr.sort()
+    assert result.data == [10, 10, 20, 30]
+    assert result.is_sorted() == True
+    assert arr.is_sorted() == False
+    assert arr.argsort().data == [1, 3, 2, 0]
+
+def test_searchsorted():
+    """Test single and batched binary search on both sides."""
+    arr = vp.array([1, 3, 3, 5, 8])
+    assert arr.searchsorted(3) == 1
+    assert arr.searchsorted(3, side='right') == 3
+    assert arr.searchsorted([0, 4, 9]).data == [0, 3, 5]
+    assert arr.searchsorted(vp.array([5, 6])).data == [3, 4]
+
+def test_sorted_fast_paths():
+    """Test queries on a sorted array, and that a write clears the sorted flag."""
+    arr = vp.array([9, 2, 7, 2, 5, 1]).sort()
+    assert arr.min() == 1 and arr.max() == 9
+    assert arr.median() == 3.5
+    assert 7 in arr and 4 not in arr
+    assert arr.count_range(2, 7) == 4
+    assert arr.unique().data == [1, 2, 5, 7, 9]
+    arr.data[0] = 10
+    assert arr.is_sorted() == False
+    assert arr.min() == 2
+    assert arr.contains(10) == True
+
+
+# Test selection helpers
+def test_top_k():
+    """Test the k largest and smallest values, best first."""
+    arr = vp.array([5, 1, 9, 3, 7, 9])
+    assert arr.top_k(3).data == [9, 9, 7]
+    assert arr.top_k(2, largest=False).data == [1, 3]
+    assert arr.top_k(10).data == [9, 9, 7, 5, 3, 1]
+
+def test_argpartition():
+    """Test the k-th element lands in its sorted position with the rest split around it."""
+    data = [8, 3, 5, 1, 9, 2]
+    order = vp.array(data).argpartition(2).data
+    assert sorted(order) == list(range(6))
+    assert data[order[2]] == 3
+    assert all(data[i] < 3 for i in order[:2])
+    assert all(data[i] > 3 for i in order[3:])
+
+def test_argmax_argmin():
+    """Test positions of the first maximum and minimum."""
+    arr = vp.array([4, 9, 1, 9, 1])
+    assert arr.argmax() == 1
+    assert arr.argmin() == 2
@@ -75,4 +75,90 @@ def test_dot_product():
     arr_a = vp.array([1, 2, 3])
     arr_b = vp.array([1, 2])
     with pytest.raises(ShapeError):
-        arr_a.dot(arr_b)
\ No newline at end of file
+        arr_a.dot(arr_b)
+
+def test_inplace_operators():
+    """Test in-place operators mutate the existing buffer."""
+    arr = vp.array([1.0, 2.0, 3.0])
+    original = arr
+    arr += vp.array([1.0, 1.0, 1.0])
+    arr -= 0.5
+    arr *= 2
+    arr /= 4
+    assert arr is original
+    assert arr.data == [0.75, 1.25, 1.75]
+
+def test_inplace_on_view_updates_base():
+    """Test in-place operations on a view write into the base array."""
+    arr = vp.array([1, 2, 3, 4])
+    view = arr[::2]
+    view += 10
+    assert arr.data == [11, 2, 13, 4]
+
+def test_inplace_cannot_downcast():
+    """Test int arrays reject in-place float results."""
+    from vectopy.core._internals import DtypeError
+    arr = vp.array([1, 2, 3])
+    with pytest.raises(DtypeError):
+        arr /= 2
+    with pytest.raises(DtypeError):
+        arr += 0.5
+    assert arr.data == [1, 2, 3]
+
+def test_inplace_results_that_do_not_fit():
+    """Test results that cannot be packed into the target buffer raise DtypeError and leave it unchanged."""
+    from vectopy.core._internals import DtypeError
+    arr = vp.array([1, 2, 3])
+    with pytest.raises(DtypeError):
+        arr += 2 ** 70
+    assert arr.data == [1, 2, 3]
+    out = vp.zeros(3, dtype=int)
+    with pytest.raises(DtypeError):
+        vp.array([1, 2, 3]).clip(1.5, 2.5, out=out)
+    assert out.data == [0, 0, 0]
+
+def test_inplace_on_readonly_array():
+    """Test writes to read-only memory raise ValueError and leave the data unchanged."""
+    from array import array
+    arr = vp.frombuffer(array('d', [1.0, 2.0, 3.0]).tobytes())
+    with pytest.raises(ValueError, match="read-only"):
+        arr += 1
+    with pytest.raises(ValueError, match="read-only"):
+        arr[1:].data[0] = 5.0
+    assert arr.data == [1.0, 2.0, 3.0]
+
+def test_out_parameter():
+    """Test arithmetic functions write into a preallocated output."""
+    a = vp.array([1, 2, 3])
+    b = vp.array([4, 5, 6])
+    out = vp.zeros(3)
+    assert vp.add(a, b, out=out) is out
+    assert out.data == [5.0, 7.0, 9.0]
+    vp.divide(b, a, out=out)
+    assert out.data == [4.0, 2.5, 2.0]
+    assert vp.multiply(a, 2).data == [2, 4, 6]
+    with pytest.raises(ShapeError):
+        vp.subtract(a, b, out=vp.zeros(2))
+
+
+def test_kernels_are_cached():
+    """Test one kernel is built per operator, dtype pair and operand kind."""
+    import operator
+    from vectopy.core.kernels import get_kernel
+    a = vp.array([1, 2, 3])
+    a + a
+    kernel = get_kernel(operator.add, int, int, False)
+    assert kernel is get_kernel(operator.add, int, int, False)
+    assert kernel is not get_kernel(operator.add, int, int, True)
+    assert kernel.dtype == int
+    assert get_kernel(operator.truediv, int, int, False).dtype == float
+
+def test_kernel_dtype_rules():
+    """Test result dtypes and typed storage of kernel results."""
+    ints = vp.array([1, 2, 3])
+    assert (ints * 2).dtype == int
+    assert (ints * 2).typecode == 'q'
+    assert (ints * 2.0).dtype == float
+    assert (ints / 1).data == [1.0, 2.0, 3.0]
+    big = ints * 2 ** 62
+    assert big.data == [2 ** 62, 2 ** 63, 3 * 2 ** 62]  # overflows int64, kept as Python ints
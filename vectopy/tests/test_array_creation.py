@@ -59,4 +59,161 @@ def test_arange_creation():
 def test_empty_array_error():
     """Test error for empty input."""
     with pytest.raises(ValueError):
-        vp.array([])
\ No newline at end of file
+        vp.array([])
+
+def test_typed_storage():
+    """Test int and float data is packed in typed array.array buffers."""
+    int_arr = vp.array([1, 2, 3])
+    float_arr = vp.array([1.5, 2.5])
+    assert int_arr.typecode == 'q'
+    assert float_arr.typecode == 'd'
+    assert int_arr.itemsize == 8
+    assert float_arr.nbytes == 16
+
+def test_narrow_typecode_dtype():
+    """Test creating arrays with a narrower typecode as dtype."""
+    arr = vp.zeros(4, dtype='i')
+    assert arr.dtype == int
+    assert arr.typecode == 'i'
+    assert arr.nbytes == 16
+    assert arr.data == [0, 0, 0, 0]
+
+def test_object_storage_fallback():
+    """Test values that don't fit a machine type keep working as Python objects."""
+    arr = vp.array([2 ** 70, 1])
+    assert arr.typecode is None
+    assert arr.sum() == 2 ** 70 + 1
+
+def test_data_writes_through():
+    """Test writes through .data update the array."""
+    arr = vp.array([1, 2, 3])
+    arr.data[1] = 20
+    assert arr[1] == 20
+    assert arr.data == [1, 20, 3]
+
+def test_data_slice_and_invalid_writes():
+    """Test slice writes through .data and values that do not fit the buffer."""
+    from vectopy.core._internals import DtypeError, ShapeError
+    arr = vp.array([1, 2, 3, 4])
+    arr.data[1:3] = [7, 8]
+    arr.data[::2] = (0, 0)
+    assert arr.data == [0, 7, 0, 4]
+    with pytest.raises(DtypeError):
+        arr.data[0] = 2.5
+    with pytest.raises(DtypeError):
+        arr.data[0] = 2 ** 70
+    with pytest.raises(DtypeError):
+        arr.data[:2] = [1.5, 2]
+    with pytest.raises(ShapeError):
+        arr.data[:2] = [1]
+    assert arr.data == [0, 7, 0, 4]
+
+
+def test_slice_is_view():
+    """Test slices share memory with the parent array."""
+    arr = vp.array([1, 2, 3, 4, 5])
+    view = arr[1:4]
+    assert view.data == [2, 3, 4]
+    assert view.base is arr
+    assert view.offset == 1
+    arr.data[2] = 30
+    assert view[1] == 30
+    view.data[0] = 20
+    assert arr[1] == 20
+
+def test_stepped_slice_view():
+    """Test stepped and reversed slices, and slices of slices."""
+    arr = vp.arange(10)
+    view = arr[8:0:-2]
+    assert view.data == [8, 6, 4, 2]
+    assert view.strides == (-16,)
+    inner = view[1:3]
+    assert inner.data == [6, 4]
+    assert inner.base is arr
+    assert inner.offset == 6
+
+def test_methods_on_views():
+    """Test attached methods run directly on views."""
+    arr = vp.array([1, 2, 3, 4, 5, 6])
+    view = arr[::2]
+    assert view.sum() == 9
+    assert view.mean() == 3
+    assert view.diff().data == [2, 2]
+    assert view.moving_average(2).data == [2.0, 4.0]
+
+def test_copy_owns_data():
+    """Test copy() detaches the data from the parent."""
+    arr = vp.array([1, 2, 3, 4])
+    copied = arr[1:3].copy()
+    assert copied.base is None
+    arr.data[1] = 99
+    assert copied.data == [2, 3]
+
+
+def test_frombuffer_shares_memory():
+    """Test frombuffer wraps existing memory without copying."""
+    from array import array
+    raw = array('d', [1.0, 2.0, 3.0])
+    arr = vp.frombuffer(raw, dtype=float)
+    assert arr.data == [1.0, 2.0, 3.0]
+    raw[0] = 10.0
+    assert arr[0] == 10.0
+
+def test_frombuffer_bytes_offset_count():
+    """Test frombuffer on raw bytes with offset and count."""
+    raw = vp.array([1, 2, 3, 4]).tobytes()
+    arr = vp.frombuffer(raw, dtype=int, offset=8, count=2)
+    assert arr.data == [2, 3]
+    assert arr.readonly
+    with pytest.raises(ValueError):
+        vp.frombuffer(b'\x00' * 5, dtype=int)
+
+def test_to_memoryview_and_tobytes():
+    """Test exporting the array's memory."""
+    arr = vp.array([1.5, 2.5])
+    view = arr.to_memoryview()
+    view[1] = 4.5
+    assert arr.data == [1.5, 4.5]
+    assert vp.frombuffer(arr[::-1].tobytes()).data == [4.5, 1.5]
+
+def test_array_interface():
+    """Test the NumPy-style __array_interface__ description."""
+    arr = vp.array([1, 2, 3, 4])
+    interface = arr.__array_interface__
+    assert interface['shape'] == (4,)
+    assert interface['typestr'][1:] == 'i8'
+    strided = arr[::2].__array_interface__
+    assert strided['strides'] == (16,)
+    assert strided['offset'] == 0
+
+
+def test_memmap_roundtrip(tmp_path):
+    """Test writing through a memmap and reading it back from disk."""
+    path = tmp_path / "series.bin"
+    arr = vp.memmap(path, dtype=float, mode='w+', shape=4)
+    arr.data[0] = 1.5
+    arr.data[3] = 4.5
+    arr.flush()
+    assert path.stat().st_size == 32
+
+    loaded = vp.memmap(path, dtype=float, mode='r')
+    assert loaded.data == [1.5, 0.0, 0.0, 4.5]
+    assert loaded.readonly
+    assert loaded.sum() == 6.0
+    assert loaded.max() == 4.5
+
+def test_memmap_copy_on_write(tmp_path):
+    """Test copy-on-write memmaps never change the file."""
+    path = tmp_path / "series.bin"
+    path.write_bytes(vp.array([1, 2, 3]).tobytes())
+    arr = vp.memmap(path, dtype=int, mode='c')
+    arr.data[0] = 10
+    arr.flush()
+    assert vp.memmap(path, dtype=int, mode='r').data == [1, 2, 3]
+
+def test_memmap_errors(tmp_path):
+    """Test invalid memmap arguments."""
+    with pytest.raises(ValueError):
+        vp.memmap(tmp_path / "a.bin", mode='x')
+    with pytest.raises(ValueError):
+        vp.memmap(tmp_path / "b.bin", mode='w+')
@@ -0,0 +1,65 @@
+"""
+Test cases for Batch, many same-length vectors in one buffer.
+"""
+
+import math
+import pytest
+import vectopy as vp
+from vectopy.core._internals import ShapeError, DtypeError
+
+ROWS = [[1.0, 2.0, 3.0], [4.0, 0.0, -4.0], [2.0, 2.0, 2.0]]
+
+def test_batch_rows_are_views():
+    """Test rows are zero-copy VectoPyArray views of the shared buffer."""
+    batch = vp.Batch(ROWS)
+    assert batch.shape == (3, 3)
+    assert batch.tolist() == ROWS
+    row = batch[-2]
+    assert isinstance(row, vp.VectoPyArray)
+    assert row.sum() == 0.0
+    row.data[1] = 6.0
+    assert batch.tolist()[1] == [4.0, 6.0, -4.0]
+    assert row.sum() == 6.0
+    assert batch.flat.sum() == 18.0
+    assert batch[1:].tolist() == batch.tolist()[1:]
+    assert [list(r) for r in batch] == batch.tolist()
+
+def test_batch_dots():
+    """Test batched and pairwise dot products agree with VectoPyArray.dot."""
+    batch = vp.Batch(ROWS)
+    query = vp.array([1.0, -1.0, 0.5])
+    assert batch.dot(query).data == [vp.array(r).dot(query) for r in ROWS]
+    gram = batch.pairwise_dots()
+    assert gram.shape == (3, 3)
+    assert gram.tolist()[0] == [14.0, -8.0, 12.0]
+    other = vp.Batch([[1, 0, 0], [0, 1, 0]], dtype=int)
+    assert batch.pairwise_dots(other).tolist() == [[1.0, 2.0], [4.0, 0.0], [2.0, 2.0]]
+    assert other.dot([3, 4, 5]).dtype == int
+    with pytest.raises(ShapeError):
+        batch.dot([1.0, 2.0])
+
+def test_batch_row_statistics():
+    """Test row-wise mean/std/normalize/minmax_scale match the per-array methods."""
+    batch = vp.Batch(ROWS)
+    assert batch.mean().data == [2.0, 0.0, 2.0]
+    for got, row in zip(batch.std(), ROWS):
+        assert math.isclose(got, vp.array(row).std())
+    normalized = batch.normalize().tolist()
+    for got, row in zip(normalized[:2], ROWS):
+        assert all(math.isclose(a, b) for a, b in zip(got, vp.array(row).normalize()))
+    assert normalized[2] == [0.0, 0.0, 0.0]
+    assert batch.minmax_scale().tolist() == [[0.0, 0.5, 1.0], [1.0, 0.5, 0.0], [0.5, 0.5, 0.5]]
+
+def test_batch_errors_and_from_flat():
+    """Test ragged rows, bad values and flat construction."""
+    with pytest.raises(ShapeError):
+        vp.Batch([[1.0, 2.0], [3.0]])
+    with pytest.raises(DtypeError):
+        vp.Batch([[1, 2], [3, 2 ** 70]], dtype=int)
+    flat = vp.arange(6, dtype=float)
+    batch = vp.Batch.from_flat(flat, 2)
+    assert batch.tolist() == [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]]
+    flat.data[0] = 9.0
+    assert batch[0].data == [9.0, 1.0]
+    with pytest.raises(ShapeError):
+        vp.Batch.from_flat(flat, 4)
@@ -0,0 +1,71 @@
+"""
+Test cases for the growable ChunkedArray.
+"""
+
+import pytest
+import vectopy as vp
+
+def test_chunked_append_and_extend():
+    """Test values fill fixed-size chunks in order."""
+    arr = vp.ChunkedArray(dtype=int, chunk_size=4)
+    for value in range(6):
+        arr.append(value)
+    arr.extend(range(6, 11))
+    assert len(arr) == 11
+    assert arr.num_chunks == 3
+    assert list(arr) == list(range(11))
+    assert arr[9] == 9 and arr[-1] == 10
+    assert arr[3:6].data == [3, 4, 5]
+
+def test_chunked_consolidate():
+    """Test consolidation into one contiguous VectoPyArray."""
+    arr = vp.ChunkedArray([1.5, 2.5, 3.5], chunk_size=2)
+    flat = arr.consolidate()
+    assert isinstance(flat, vp.VectoPyArray)
+    assert flat == vp.array([1.5, 2.5, 3.5])
+
+def test_chunked_reductions():
+    """Test per-chunk reductions match the flat array."""
+    values = [7, -3, 12, 5, 0, 9, -8]
+    arr = vp.ChunkedArray(values, dtype=int, chunk_size=3)
+    flat = vp.array(values)
+    assert arr.sum() == flat.sum()
+    assert arr.min() == -8 and arr.max() == 12
+    assert arr.mean() == flat.mean()
+    assert abs(arr.std() - flat.std()) < 1e-12
+
+def test_chunked_scans_stitch_boundaries():
+    """Test diff and cumulative_sum across chunk boundaries."""
+    values = [1, 4, 9, 16, 25, 36, 49]
+    arr = vp.ChunkedArray(values, dtype=int, chunk_size=3)
+    assert list(arr.diff()) == [3, 5, 7, 9, 11, 13]
+    assert list(arr.cumulative_sum()) == [1, 5, 14, 30, 55, 91, 140]
+    assert arr.diff().num_chunks == 2
+
+def test_chunked_object_fallback_and_errors():
+    """Test oversized integers fall back to object storage and empty reductions raise."""
+    arr = vp.ChunkedArray(dtype=int)
+    arr.append(2 ** 70)
+    arr.append(1)
+    assert arr.sum() == 2 ** 70 + 1
+    with pytest.raises(ValueError):
+        vp.ChunkedArray().mean()
+
+def test_chunked_describe():
+    """Test describe() runs chunk by chunk and matches the consolidated array."""
+    data = [(i * 31) % 97 for i in range(1000)]
+    chunked = vp.ChunkedArray(data, dtype=int, chunk_size=64)
+    summary = chunked.describe((0.1, 0.5, 0.99))
+    expected = vp.array(data).describe((0.1, 0.5, 0.99))
+    assert summary.quantiles == expected.quantiles
+    assert (summary.sum, summary.min, summary.max) == (sum(data), 0, 96)
+
+def test_chunked_feeds_running_stats_and_sketches():
+    """Test ChunkedArray and Stream share the _chunks() protocol of VectoPyArray."""
+    stats = vp.stats.RunningStats(vp.ChunkedArray([1.0, 2.0]))
+    assert (stats.count, stats.mean) == (2, 1.5)
+    stats.update(vp.ChunkedArray(range(3, 11), dtype=float, chunk_size=3))
+    assert (stats.count, stats.mean) == (10, 5.5)
+    assert vp.stats.RunningStats(vp.stream(range(5), dtype=float)).mean == 2.0
+    sketch = vp.sketches.MisraGries(3, vp.ChunkedArray([7, 7, 1, 7, 2], chunk_size=2))
+    assert sketch.most_common(1) == [(7, 3)]
@@ -15,9 +15,9 @@ def test_explain_int_array(capsys):
     # Check key information
     assert "Shape: (3,)" in output
     assert "Dtype: <class 'int'>" in output
-    assert "Strides: (4,)" in output
+    assert "Strides: (8,)" in output  # int64 ('q') storage
     assert "Underlying Data: [10, 20, 30]" in output
-    assert "Memory Size: 12 bytes" in output
+    assert "Memory Size: 24 bytes" in output
 
 
 def test_explain_float_array(capsys):
@@ -31,4 +31,29 @@ def test_explain_float_array(capsys):
     assert "Shape: (3,)" in output
     assert "Dtype: <class 'float'>" in output
     assert "Strides: (8,)" in output  # 8 bytes for float
-    assert "Memory Size: 24 bytes" in output  # 3 * 8 = 24
\ No newline at end of file
+    assert "Memory Size: 24 bytes" in output  # 3 * 8 = 24
+
+
+def test_explain_narrow_typecode(capsys):
+    """Test explain reports the real itemsize of a narrower typecode."""
+    arr = vp.array([1.5, 2.5, 3.5], dtype='f')
+    arr.explain()
+
+    output = capsys.readouterr().out
+
+    assert "Dtype: <class 'float'>" in output
+    assert "Strides: (4,)" in output  # 4 bytes for float32
+    assert "Memory Size: 12 bytes" in output
+
+
+def test_explain_view(capsys):
+    """Test explain reports real strides and base for a stepped slice."""
+    arr = vp.array([1, 2, 3, 4, 5, 6])
+    arr[1::2].explain()
+
+    output = capsys.readouterr().out
+
+    assert "Shape: (3,)" in output
+    assert "Strides: (16,)" in output  # every second 8-byte element
+    assert "view starting at element 1" in output
+    assert "Underlying Data: [2, 4, 6]" in output
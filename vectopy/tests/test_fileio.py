@@ -0,0 +1,75 @@
+"""
+Test cases for VectoPyArray binary save/load.
+"""
+
+import pytest
+import vectopy as vp
+
+def test_save_load_roundtrip(tmp_path):
+    """Test saving and loading int and float arrays."""
+    path = tmp_path / "ints.vpy"
+    vp.save(path, vp.array([1, -2, 3]))
+    loaded = vp.load(path)
+    assert loaded.data == [1, -2, 3]
+    assert loaded.dtype == int
+
+    path = tmp_path / "floats.vpy"
+    vp.save(path, vp.array([1.5, 2.5], dtype='f'))
+    loaded = vp.load(path)
+    assert loaded.data == [1.5, 2.5]
+    assert loaded.typecode == 'f'
+
+def test_save_view(tmp_path):
+    """Test saving a strided view writes only its elements."""
+    path = tmp_path / "view.vpy"
+    vp.save(path, vp.arange(10)[::3])
+    assert vp.load(path).data == [0, 3, 6, 9]
+
+def test_checksum_detects_corruption(tmp_path):
+    """Test a stored checksum catches corrupted payloads."""
+    path = tmp_path / "checked.vpy"
+    vp.save(path, vp.array([1.0, 2.0, 3.0]), checksum=True)
+    assert vp.load(path).data == [1.0, 2.0, 3.0]
+    raw = bytearray(path.read_bytes())
+    raw[-1] ^= 0xFF
+    path.write_bytes(bytes(raw))
+    with pytest.raises(ValueError, match="Checksum"):
+        vp.load(path)
+
+def test_load_mmap_mode(tmp_path):
+    """Test loading with mmap_mode maps the file instead of copying it."""
+    path = tmp_path / "mapped.vpy"
+    vp.save(path, vp.array([1, 2, 3, 4]))
+    mapped = vp.load(path, mmap_mode='r+')
+    assert mapped.sum() == 10
+    mapped.data[0] = 100
+    mapped.flush()
+    assert vp.load(path).data == [100, 2, 3, 4]
+    assert vp.load(path, mmap_mode='r').readonly
+
+def test_archive_roundtrip(tmp_path):
+    """Test saving and loading several named arrays in one file."""
+    path = tmp_path / "dataset.vpz"
+    vp.savez(path, prices=vp.array([1.5, 2.5, 3.5]), volume=vp.array([10, 20, 30]))
+    for mmap_mode in (None, 'r'):
+        dataset = vp.load(path, mmap_mode=mmap_mode)
+        assert sorted(dataset) == ['prices', 'volume']
+        assert dataset['prices'].data == [1.5, 2.5, 3.5]
+        assert dataset['volume'].data == [10, 20, 30]
+
+def test_load_rejects_other_files(tmp_path):
+    """Test loading a file that isn't in the VectoPy format."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not an array")
+    with pytest.raises(ValueError):
+        vp.load(path)
+
+def test_save_rejects_object_storage(tmp_path):
+    """Test arrays in object storage raise DtypeError and no file is written."""
+    from vectopy.core._internals import DtypeError
+    big = vp.array([2 ** 70, 1])
+    with pytest.raises(DtypeError):
+        vp.save(tmp_path / "big.vpy", big)
+    with pytest.raises(DtypeError):
+        vp.savez(tmp_path / "big.vpz", small=vp.array([1, 2]), big=big)
+    assert list(tmp_path.iterdir()) == []
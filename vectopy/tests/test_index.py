@@ -0,0 +1,77 @@
+"""
+Test cases for the vp.index nearest-neighbour indexes.
+"""
+
+import math
+import random
+import pytest
+import vectopy as vp
+from vectopy.core._internals import ShapeError
+
+def _clustered(n, dim=8, clusters=10, seed=0):
+    """Points scattered around a few random centers."""
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(clusters)]
+    return [[x + rng.gauss(0, 0.2) for x in rng.choice(centers)] for _ in range(n)]
+
+def _brute_force(data, query, k, metric):
+    if metric == 'l2':
+        scored = [(-math.dist(query, x), i) for i, x in enumerate(data)]
+    else:
+        scale = (lambda v: math.sqrt(sum(a * a for a in v))) if metric == 'cosine' else (lambda v: 1.0)
+        scored = [(sum(a * b for a, b in zip(query, x)) / (scale(query) * scale(x)), i) for i, x in enumerate(data)]
+    return [i for _, i in sorted(scored, reverse=True)[:k]]
+
+def test_flat_index_exact():
+    """Test the flat index returns the brute-force neighbours with correct scores."""
+    data = _clustered(500)
+    for metric in ('cosine', 'l2', 'ip'):
+        index = vp.index.FlatIndex(8, metric).add(data[:300]).add(vp.Batch(data[300:]))
+        assert len(index) == 500
+        for query in data[:5]:
+            results = index.search(query, k=5)
+            assert [i for i, _ in results] == _brute_force(data, query, 5, metric)
+        best_id, best_score = index.search(data[7], k=1)[0]
+        if metric == 'l2':
+            assert best_id == 7 and best_score == pytest.approx(0.0, abs=1e-6)
+        elif metric == 'cosine':
+            assert best_score == pytest.approx(1.0)
+
+def test_ivf_index_recall():
+    """Test IVF recall grows with nprobe and reaches the exact result when every list is probed."""
+    data = _clustered(1000)
+    queries = _clustered(20, seed=1)
+    for metric in ('cosine', 'l2'):
+        flat = vp.index.FlatIndex(8, metric).add(data)
+        ivf = vp.index.IVFIndex(8, nlist=16, metric=metric, nprobe=2).train(data).add(data)
+        truth = flat.search_batch(queries, k=10)
+        for nprobe, expected in ((2, 0.8), (16, 1.0)):
+            found = ivf.search_batch(queries, k=10, nprobe=nprobe)
+            recall = sum(len({i for i, _ in a} & {i for i, _ in b}) for a, b in zip(found, truth)) / 200
+            assert recall >= expected
+        assert ivf.search(queries[0], k=10, nprobe=16) == truth[0]
+
+def test_index_save_load(tmp_path):
+    """Test both indexes give the same answers after a save/load round trip."""
+    data = _clustered(400)
+    ivf = vp.index.IVFIndex(8, nlist=8, metric='l2').train(data).add(data)
+    ivf.save(tmp_path / "ivf.vpy")
+    loaded = vp.index.IVFIndex.load(tmp_path / "ivf.vpy")
+    assert (loaded.nlist, loaded.nprobe, loaded.metric, len(loaded)) == (8, 8, 'l2', 400)
+    assert loaded.search(data[3], k=5) == ivf.search(data[3], k=5)
+    flat = vp.index.FlatIndex(8, 'ip').add(data)
+    flat.save(tmp_path / "flat.vpy")
+    assert vp.index.FlatIndex.load(tmp_path / "flat.vpy").search(data[3], k=5) == flat.search(data[3], k=5)
+
+def test_index_errors():
+    """Test invalid metrics, shapes and untrained IVF use raise."""
+    with pytest.raises(ValueError):
+        vp.index.FlatIndex(4, 'manhattan')
+    with pytest.raises(ShapeError):
+        vp.index.FlatIndex(4).add([[1.0, 2.0]])
+    ivf = vp.index.IVFIndex(4, nlist=4)
+    with pytest.raises(ValueError):
+        ivf.add([[1.0, 2.0, 3.0, 4.0]])
+    with pytest.raises(ValueError):
+        ivf.train([[1.0, 2.0, 3.0, 4.0]])
+    assert vp.index.FlatIndex(4).search([1.0, 0.0, 0.0, 0.0]) == []
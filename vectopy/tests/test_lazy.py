@@ -0,0 +1,48 @@
+"""
+Test cases for lazy VectoPyArray expressions.
+"""
+
+import pytest
+import vectopy as vp
+from vectopy.core._internals import ShapeError
+
+def test_lazy_matches_eager():
+    """Test a fused expression gives the same result as eager arithmetic."""
+    a = vp.array([1, 2, 3])
+    b = vp.array([0.5, 0.5, 0.5])
+    c = vp.array([2, 2, 2])
+    d = vp.array([10, 20, 30])
+    expr = (vp.lazy(a) - b) * c + d
+    assert isinstance(expr, vp.LazyArray)
+    assert expr.dtype == float
+    assert expr.evaluate() == (a - b) * c + d
+
+def test_lazy_reductions():
+    """Test reductions fold into the expression without evaluating it."""
+    a = vp.array([1, 2, 3, 4])
+    expr = vp.lazy(a) * 2 + 1
+    assert expr.sum() == 24
+    assert isinstance(expr.sum(), int)
+    assert expr.mean() == 6.0
+    assert expr.dot(a) == 3 + 10 + 21 + 36
+
+def test_lazy_scalars_and_reflected_ops():
+    """Test scalars on either side and VectoPyArrays on the left."""
+    a = vp.array([1, 2, 4])
+    assert (10 - vp.lazy(a)).evaluate().data == [9, 8, 6]
+    assert (8 / vp.lazy(a)).evaluate().data == [8.0, 4.0, 2.0]
+    assert (a + vp.lazy(a) * a).evaluate().data == [2, 6, 20]
+
+def test_lazy_evaluate_out():
+    """Test evaluating into a preallocated array."""
+    a = vp.array([1.0, 2.0])
+    out = vp.zeros(2)
+    assert (vp.lazy(a) * a).evaluate(out=out) is out
+    assert out.data == [1.0, 4.0]
+
+def test_lazy_shape_mismatch():
+    """Test mismatched shapes are reported when the expression is built."""
+    with pytest.raises(ShapeError):
+        vp.lazy(vp.array([1, 2])) + vp.array([1, 2, 3])
+    with pytest.raises(TypeError):
+        vp.lazy([1, 2])
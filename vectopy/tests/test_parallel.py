@@ -0,0 +1,50 @@
+"""
+Test cases for the multi-process execution engine.
+"""
+
+import math
+import pytest
+import vectopy as vp
+
+@pytest.fixture
+def parallel_settings():
+    """Restore the global parallel settings after a test."""
+    saved = vp.get_parallel()
+    yield
+    vp.set_parallel(**saved)
+
+def test_parallel_reductions(parallel_settings):
+    """Test reductions split across workers match the serial results."""
+    vp.set_parallel(threshold=0)
+    arr = vp.array([3.5, -1.0, 7.25, 2.0, 9.5, 0.5, 4.0])
+    assert arr.sum(workers=3) == arr.sum()
+    assert arr.min(workers=3) == -1.0
+    assert arr.max(workers=3) == 9.5
+    assert math.isclose(arr.mean(workers=3), arr.mean())
+    assert math.isclose(arr.std(workers=3), arr.std())
+    assert arr.dot(arr, workers=2) == arr.dot(arr)
+
+def test_parallel_cumulative_sum(parallel_settings):
+    """Test the carry fix-up pass joins the per-worker prefix sums."""
+    vp.set_parallel(threshold=0)
+    arr = vp.arange(1, 12)
+    assert arr.cumulative_sum(workers=3).data == arr.cumulative_sum().data
+
+def test_parallel_elementwise(parallel_settings):
+    """Test element-wise operations with the global worker setting."""
+    vp.set_parallel(workers=2, threshold=0)
+    a = vp.array([1, 2, 3, 4, 5])
+    b = vp.array([0.5, 1.5, 2.5, 3.5, 4.5])
+    assert (a + b).data == [1.5, 3.5, 5.5, 7.5, 9.5]
+    assert (a * 3).data == [3, 6, 9, 12, 15]
+    assert vp.divide(a, 2, workers=1).data == [0.5, 1.0, 1.5, 2.0, 2.5]
+    assert (a * 2 ** 62).data[1] == 2 ** 63  # overflows int64: serial fallback
+
+def test_small_arrays_stay_serial(parallel_settings):
+    """Test arrays below the threshold never start workers."""
+    from vectopy.core import parallel
+    vp.set_parallel(workers=4, threshold=1000)
+    assert parallel._workers_for(vp.arange(10), None) == 0
+    assert parallel._workers_for(vp.arange(2000), None) == 4
+    with pytest.raises(ValueError):
+        vp.set_parallel(workers=0)
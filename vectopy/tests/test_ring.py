@@ -0,0 +1,55 @@
+"""
+Test cases for the fixed-capacity RingArray.
+"""
+
+import math
+
+import pytest
+import vectopy as vp
+
+def test_ring_push_evicts_oldest():
+    """Test push keeps only the last `capacity` values, in order."""
+    ring = vp.RingArray(3, dtype=int)
+    for value in [1, 2, 3, 4, 5]:
+        ring.push(value)
+    assert list(ring) == [3, 4, 5]
+    assert len(ring) == 3 and ring.is_full()
+    assert ring[0] == 3 and ring[-1] == 5
+    assert ring.snapshot() == vp.array([3, 4, 5])
+
+def test_ring_live_statistics():
+    """Test running statistics follow values arriving and leaving."""
+    ring = vp.RingArray(4)
+    ring.extend([10.0, 1.0, 7.0, 3.0, 5.0, 2.0])
+    assert list(ring) == [7.0, 3.0, 5.0, 2.0]
+    assert ring.sum() == 17.0
+    assert ring.mean() == 4.25
+    assert ring.min() == 2.0 and ring.max() == 7.0
+    assert math.isclose(ring.std(), vp.array([7.0, 3.0, 5.0, 2.0]).std())
+    ring.push(1.0)
+    assert ring.max() == 5.0 and ring.min() == 1.0
+
+def test_ring_array_methods():
+    """Test other VectoPyArray methods run on a snapshot."""
+    ring = vp.RingArray(5, dtype=int)
+    ring.extend(range(8))
+    assert ring.median() == 5
+    assert ring.diff().data == [1, 1, 1, 1]
+    assert ring[1:3].data == [4, 5]
+
+def test_ring_empty():
+    """Test statistics of an empty ring raise ValueError."""
+    ring = vp.RingArray(2)
+    with pytest.raises(ValueError):
+        ring.mean()
+    with pytest.raises(ValueError):
+        vp.RingArray(0)
+
+def test_ring_extremes_are_stored_values():
+    """Test min/max report the values as stored, like a snapshot does."""
+    ring = vp.RingArray(3)
+    ring.extend([1, 2, 3, 4])
+    assert (repr(ring.min()), repr(ring.max())) == ('2.0', '4.0')
+    assert ring.min() == ring.snapshot().min()
+    ring.push(7)
+    assert repr(ring.max()) == '7.0'
@@ -0,0 +1,100 @@
+"""
+Test cases for the mergeable frequency sketches.
+"""
+
+import pytest
+import vectopy as vp
+from collections import Counter
+
+def _skewed(n=5000):
+    """Values 0..n//10 with a few heavy hitters mixed in."""
+    return [i % (n // 10) for i in range(n)] + [-5] * (n // 4) + [-7] * (n // 8)
+
+def test_misra_gries_bounds():
+    """Test estimates undercount by at most `error`, which is at most n/(k+1)."""
+    data = _skewed()
+    sketch = vp.sketches.MisraGries(20, data)
+    exact = Counter(data)
+    assert sketch.count == len(data)
+    assert sketch.error <= len(data) / 21
+    for value in exact:
+        assert exact[value] - sketch.error <= sketch.estimate(value) <= exact[value]
+    assert [value for value, _ in sketch.most_common(2)] == [-5, -7]
+    assert set(sketch.heavy_hitters(0.1)) >= {-5}
+
+def test_misra_gries_merge():
+    """Test sketches built on separate chunks merge with the same guarantees."""
+    data = _skewed()
+    left = vp.sketches.MisraGries(20, data[:3000])
+    right = vp.sketches.MisraGries(20, vp.array(data[3000:]))
+    merged = left.merge(right)
+    exact = Counter(data)
+    assert merged.count == len(data)
+    assert merged.error <= len(data) / 21
+    assert exact[-5] - merged.error <= merged.estimate(-5) <= exact[-5]
+
+def test_count_min_sketch():
+    """Test Count-Min never undercounts and merges exactly."""
+    data = _skewed()
+    exact = Counter(data)
+    sketch = vp.sketches.CountMinSketch(width=256, depth=4, values=vp.ChunkedArray(data, dtype=int, chunk_size=512))
+    for value in (-5, -7, 0, 17, 12345):
+        assert sketch.estimate(value) >= exact[value]
+    assert sketch.estimate(-5) <= exact[-5] + len(data) * 3 / 256
+    left = vp.sketches.CountMinSketch(width=256, depth=4, values=data[:1000])
+    right = vp.sketches.CountMinSketch(width=256, depth=4, values=data[1000:])
+    assert left.merge(right).estimate(-5) == sketch.estimate(-5)
+    with pytest.raises(ValueError):
+        left.merge(vp.sketches.CountMinSketch(width=128, depth=4))
+
+def test_count_min_from_error():
+    """Test sizing the table from an error target."""
+    sketch = vp.sketches.CountMinSketch.from_error(0.01, delta=0.01)
+    assert sketch.width == 272 and sketch.depth == 5
+    assert sketch.push(3.5).estimate(3.5) == 1
+
+def _rank_error(data, value, q):
+    ordered = sorted(data)
+    low = sum(1 for x in ordered if x < value) / len(data)
+    high = sum(1 for x in ordered if x <= value) / len(data)
+    return 0 if low <= q <= high else min(abs(low - q), abs(high - q))
+
+def test_kll_sketch_accuracy():
+    """Test quantiles stay within the rank error while retaining few items."""
+    data = [(i * 7919) % 10007 / 3 for i in range(20000)]
+    sketch = vp.sketches.KLLSketch.from_error(0.02, seed=1)
+    for start in range(0, len(data), 1000):
+        sketch.update(data[start:start + 1000])
+    assert sketch.count == len(data)
+    assert sketch.size < 1000
+    for q, value in zip((0.1, 0.5, 0.9), sketch.quantile([0.1, 0.5, 0.9])):
+        assert _rank_error(data, value, q) <= 0.02
+    assert sketch.quantile(0) == min(data) and sketch.quantile(1) == max(data)
+    assert abs(sketch.rank(sketch.quantile(0.5)) - 0.5) <= 0.02
+
+def test_kll_sketch_merge():
+    """Test sketches of separate parts merge into one covering all values."""
+    data = [float(i) for i in range(10000)]
+    left = vp.sketches.KLLSketch(100, seed=2, values=data[::2])
+    merged = left.merge(vp.sketches.KLLSketch(100, seed=3, values=vp.array(data[1::2])))
+    assert merged.count == 10000
+    assert abs(merged.quantile(0.5) - 5000) <= 0.03 * 10000
+    with pytest.raises(ValueError):
+        merged.merge(vp.sketches.KLLSketch(200))
+    with pytest.raises(ValueError):
+        vp.sketches.KLLSketch().quantile(0.5)
+
+def test_hyperloglog():
+    """Test distinct counts stay within a few standard errors and merge like a union."""
+    left = vp.sketches.HyperLogLog(12, range(20000))
+    right = vp.sketches.HyperLogLog(12, vp.array([float(i) for i in range(10000, 30000)]))
+    assert abs(left.cardinality() - 20000) <= 4 * left.error * 20000
+    union = left.merge(right)
+    assert union.count == 40000
+    assert abs(union.cardinality() - 30000) <= 4 * union.error * 30000
+    # Small cardinalities fall back to linear counting and are nearly exact
+    assert round(vp.sketches.HyperLogLog(values=[7, 7, 8, 9]).cardinality()) == 3
+    with pytest.raises(ValueError):
+        union.merge(vp.sketches.HyperLogLog(10))
+    with pytest.raises(ValueError):
+        vp.sketches.HyperLogLog(3)
@@ -4,6 +4,7 @@ Test cases for VectoPyArray statistical operations.
 
 import vectopy as vp
 import math
+from array import array
 
 # Test sum() method
 def test_sum_op():
@@ -101,6 +102,14 @@ def test_std_op():
     arr = vp.array([5, 5, 5, 5, 5])
     assert arr.std() == 0.0
 
+# Test minmax() method
+def test_minmax_op():
+    arr = vp.array([5, -2, 8, 0])
+    assert arr.minmax() == (-2, 8)
+    # The same pass also fills the min() and max() caches
+    assert arr.min() == -2
+    assert arr.cache_info().hits == 1
+
 # Test median() method
 def test_median_op():
     arr = vp.array([1, 2, 3, 4, 5])
@@ -118,6 +127,85 @@ def test_median_op():
     arr = vp.array([42])
     assert arr.median() == 42
 
+def test_median_large_unsorted():
+    """Test selection-based median on data with many duplicates and distinct values."""
+    data = [(i * 7919) % 1000 for i in range(5001)] + [3] * 500
+    arr = vp.array(data)
+    assert arr.median() == sorted(data)[len(data) // 2]
+    arr = vp.array(data[:-1])
+    ordered = sorted(data[:-1])
+    assert arr.median() == (ordered[len(ordered) // 2 - 1] + ordered[len(ordered) // 2]) / 2
+
+def test_median_approx():
+    """Test the sketch-based median and quantiles are within their rank error."""
+    data = [(i * 7919) % 10007 for i in range(50000)]
+    arr = vp.array(data)
+    assert abs(arr.median(approx=True, eps=0.01) - arr.median()) <= 0.01 * 10007
+    low, high = arr.quantile([0.05, 0.95], approx=True, eps=0.01)
+    assert abs(low - 500) <= 0.01 * 10007 and abs(high - 9506) <= 0.01 * 10007
+    # The sketch is built once per array and eps
+    assert arr.percentile(50, approx=True, eps=0.01) == arr.median(approx=True, eps=0.01)
+    assert arr.cache_info().hits >= 2
+
+# Test quantile() and percentile() methods
+def test_quantile_methods():
+    """Test the interpolation modes on an even-length array."""
+    arr = vp.array([7, 1, 3, 5])
+    assert arr.quantile(0.5) == 4.0
+    assert arr.quantile([0, 0.25, 1]) == [1.0, 2.5, 7.0]
+    assert arr.quantile(0.25, method='lower') == 1
+    assert arr.quantile(0.25, method='higher') == 3
+    assert arr.quantile(0.25, method='nearest') == 3
+    assert arr.quantile(0.25, method='midpoint') == 2.0
+    assert arr.percentile([50, 100]) == [4.0, 7.0]
+
+def test_quantile_invalid():
+    """Test out-of-range quantiles and unknown methods raise ValueError."""
+    arr = vp.array([1, 2, 3])
+    for args in ((1.5,), (0.5, 'cubic')):
+        try:
+            arr.quantile(*args)
+            assert False, "Should have raised an error!"
+        except ValueError:
+            pass
+
+# Test describe() method
+def test_describe_op():
+    """Test the summary matches the individual reductions."""
+    data = [(i * 37) % 101 - 50.5 for i in range(1000)]
+    arr = vp.array(data)
+    summary = arr.describe()
+    assert summary.count == 1000
+    assert summary.min == arr.min() and summary.max == arr.max()
+    assert math.isclose(summary.mean, arr.mean())
+    assert math.isclose(summary.std, arr.std())
+    assert summary.quantiles == dict(zip((0.25, 0.5, 0.75), arr.quantile([0.25, 0.5, 0.75])))
+    assert summary.as_dict()['50%'] == arr.median()
+    assert arr.describe() is summary
+
+def test_describe_chunked(tmp_path):
+    """Test the chunked path gives the same quantiles on a memmap, for every method."""
+    data = [(i * 7919) % 1000 / 8 for i in range(20001)] + [3.0] * 500
+    path = tmp_path / "values.bin"
+    path.write_bytes(array('d', data).tobytes())
+    mapped = vp.memmap(path, dtype=float, mode='r')
+    arr = vp.array(data)
+    qs = (0, 0.1, 0.333, 0.5, 0.9, 1)
+    for method in ('linear', 'lower', 'higher', 'nearest', 'midpoint'):
+        expected = arr.describe(qs, method)
+        summary = mapped.describe(qs, method, chunked=True)
+        assert summary.quantiles == expected.quantiles
+        assert summary.count == expected.count
+        assert math.isclose(summary.variance, expected.variance)
+
+def test_describe_empty():
+    """Test describing an empty array raises ValueError."""
+    try:
+        vp.array([]).describe()
+        assert False, "Should have raised an error!"
+    except ValueError:
+        pass
+
 # Test mode() method
 def test_mode_op():
     arr = vp.array([1, 2, 2, 3, 3, 3, 4, 4, 4, 4])
@@ -141,6 +229,22 @@ def test_mode_op():
     arr = vp.array([0, 0, 1, 2, 3])
     assert arr.mode() == 0
 
+
+def test_mode_approx():
+    """Test the sketch-based mode agrees with the exact one."""
+    arr = vp.array([1, 1, 2, 2, 3, 3, 3])
+    assert arr.mode(approx=True) == 3
+    # More distinct values than counters: only the heavy value survives
+    arr = vp.array(list(range(2000)) + [5] * 50)
+    assert arr.mode(approx=True, k=16) == 5
+
+def test_mode_approx_all_distinct():
+    """Test all-distinct data (more than k values) raises instead of crashing."""
+    try:
+        vp.arange(2000).mode(approx=True)
+        assert False, "Should have raised an error!"
+    except ValueError as e:
+        assert "approx=False" in str(e)
     
 def test_methods_attached_to_class():
     int_array = vp.array([1, 2, 3, 4, 5])
@@ -158,4 +262,100 @@ def test_methods_attached_to_class():
     assert callable(int_array.mean)
     assert callable(int_array.std)
     assert callable(int_array.median)
-    assert callable(int_array.mode)
\ No newline at end of file
+    assert callable(int_array.mode)
+
+# Test RunningStats accumulator
+def test_running_stats_chunks_and_merge():
+    """Test chunked updates and merges agree with the whole-array results."""
+    data = [3.5, -1.0, 7.25, 2.0, 9.5, 0.5, 4.0, 6.0]
+    arr = vp.array(data)
+    left = vp.stats.RunningStats().update(data[:3])
+    right = vp.stats.RunningStats(data[3:5]).update(vp.array(data[5:]))
+    merged = left.merge(right)
+    assert merged.count == 8
+    assert math.isclose(merged.mean, arr.mean())
+    assert math.isclose(merged.std, arr.std())
+    assert merged.min == -1.0
+    assert merged.max == 9.5
+
+def test_running_stats_push():
+    """Test single-value Welford updates."""
+    stats = vp.stats.RunningStats()
+    for x in [2, 4, 4, 4, 5, 5, 7, 9]:
+        stats.push(x)
+    assert stats.mean == 5
+    assert math.isclose(stats.variance, 4.0)
+    assert stats.std == 2.0
+    assert stats.sum == 40
+
+def test_running_stats_stable():
+    """Test std stays accurate for values with a large offset."""
+    arr = vp.array([1e9 + x for x in (4.0, 7.0, 13.0, 16.0)])
+    assert math.isclose(arr.std(), math.sqrt(22.5))
+    assert math.isclose(arr.running_stats().variance, 22.5)
+
+def test_running_stats_empty():
+    """Test empty statistics raise instead of dividing by zero."""
+    stats = vp.stats.RunningStats()
+    try:
+        stats.mean
+        assert False, "Should have raised an error!"
+    except ValueError as e:
+        assert "No values" in str(e)
+
+
+# Test memoized reductions
+def test_reduction_cache_hits():
+    """Test repeated reductions are served from the cache."""
+    arr = vp.array([1.0, 2.0, 3.0, 4.0])
+    assert arr.std() == arr.std()
+    # std() also cached the mean, min and max it found in the same pass
+    assert arr.mean() == 2.5
+    assert arr.min() == 1.0
+    info = arr.cache_info()
+    assert info.hits == 3
+    assert info.misses == 2
+    arr.cache_clear()
+    assert arr.cache_info().hits == 0
+    assert arr.cache_info().currsize == 0
+
+def test_reduction_cache_invalidation():
+    """Test writes through .data, in-place operators and views invalidate cached results."""
+    arr = vp.array([1, 2, 3, 4])
+    view = arr[1:3]
+    assert arr.sum() == 10
+    assert view.sum() == 5
+    arr.data[0] = 11
+    assert arr.sum() == 20
+    view.data[0] = 12
+    assert arr.sum() == 30
+    assert view.sum() == 15
+    arr += 1
+    assert arr.max() == 13
+    assert view.sum() == 17
+    assert arr.version == 3
+
+def test_reduction_cache_untracked_memory():
+    """Test arrays over external buffers always recompute."""
+    raw = bytearray(array('d', [1.0, 2.0]).tobytes())
+    arr = vp.frombuffer(raw)
+    assert arr.sum() == 3.0
+    raw[:8] = array('d', [5.0]).tobytes()
+    assert arr.sum() == 7.0
+    assert arr.cache_info().misses == 0
+
+def test_reduction_cache_exported_memory():
+    """Test writes through exported memory are never hidden by a cached result."""
+    arr = vp.array([1.0, 2.0, 3.0])
+    view = arr[1:]
+    assert (arr.sum(), view.max()) == (6.0, 3.0)
+    arr.to_memoryview()[2] = 10.0
+    assert (arr.sum(), view.max()) == (13.0, 10.0)
+    other = vp.array([1, 2])
+    assert other.sum() == 3
+    other.__array_interface__['data'][0] = 5
+    assert other.sum() == 7
+    saved = vp.array([1.0, 2.0])
+    saved.tobytes()
+    saved.sum()
+    assert saved.sum() == 3.0 and saved.cache_info().hits == 1
@@ -0,0 +1,43 @@
+"""
+Test cases for lazy streaming pipelines.
+"""
+
+import itertools
+
+import pytest
+import vectopy as vp
+
+def test_stream_stages_match_array_methods():
+    """Test each stage gives the same values as the array method, across chunk boundaries."""
+    data = [5, 3, 8, 1, 9, 2, 7, 4, 6, 0, 11]
+    arr = vp.array(data)
+    stream = lambda: vp.stream(data, dtype=int, chunk_size=3)
+    assert stream().diff().collect() == arr.diff()
+    assert stream().shift(4).collect() == arr.shift(4)
+    assert stream().shift(-2).collect() == arr.shift(-2)
+    assert stream().cumulative_sum().collect() == arr.cumulative_sum()
+    assert stream().moving_average(4).collect() == arr.moving_average(4)
+    assert stream().clip(2, 8).collect() == arr.clip(2, 8)
+    assert stream().minmax_scale(fit_on=arr).collect() == arr.minmax_scale()
+
+def test_stream_is_lazy_on_unbounded_input():
+    """Test a pipeline over an infinite iterator only reads what is consumed."""
+    pipeline = vp.stream(itertools.count(), chunk_size=4).diff().minmax_scale(fit_on=(0, 2))
+    first = next(pipeline.batches(3))
+    assert first.data == [0.5, 0.5, 0.5]
+    assert first.dtype == float
+
+def test_stream_reductions():
+    """Test terminal reductions consume the stream chunk by chunk."""
+    values = range(1, 101)
+    assert vp.stream(values, dtype=int, chunk_size=7).sum() == 5050
+    assert vp.stream(values, chunk_size=7).mean() == 50.5
+    assert vp.stream(values, chunk_size=7).max() == 100.0
+    assert vp.stream(values, chunk_size=7).std() == vp.array(list(values)).std()
+    with pytest.raises(ValueError):
+        vp.stream([]).min()
+
+def test_stream_batches():
+    """Test batches of a fixed size, with a shorter last batch."""
+    batches = list(vp.stream(range(10), dtype=int, chunk_size=4).batches(3))
+    assert [batch.data for batch in batches] == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
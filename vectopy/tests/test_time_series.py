@@ -2,6 +2,8 @@
 Test cases for VectoPyArray time series operations.
 """
 
+import math
+
 import vectopy as vp
 
 # Test moving_average method
@@ -53,6 +55,69 @@ def test_negative_numbers():
     # Windows: [-2,-1,0]=-1.0, [-1,0,1]=0.0, [0,1,2]=1.0
     assert result.data == [-1.0, 0.0, 1.0]
 
+def test_moving_average_windows():
+    """Test several window sizes from one prefix-sum pass."""
+    arr = vp.array([1, 2, 3, 4, 5, 6])
+    result = arr.moving_average(windows=[1, 2, 6])
+    assert sorted(result) == [1, 2, 6]
+    assert result[1].data == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert result[2].data == [1.5, 2.5, 3.5, 4.5, 5.5]
+    assert result[6].data == [3.5]
+    assert vp.time_series.multi_window(arr, [3])[3] == arr.moving_average(3)
+
+def test_moving_average_compensated():
+    """Test float windows stay exact far into a series with a large offset."""
+    arr = vp.array([1e9 + 0.1 * (i % 3) for i in range(3000)])
+    result = arr.moving_average(windows=[3])[3]
+    assert all(abs(x - (1e9 + 0.1)) < 1e-6 for x in result)
+
+def test_moving_average_large_ints():
+    """Test int prefix sums fall back from the 64-bit buffer to exact Python ints."""
+    arr = vp.array([2 ** 62, 2 ** 62, 2 ** 62, 0])
+    result = arr.moving_average(windows=[2, 3])
+    assert result[2].data == [2.0 ** 62, 2.0 ** 62, 2.0 ** 61]
+    assert result[3].data == [2.0 ** 62, 2.0 ** 63 / 3]
+    assert arr.moving_average(2) == result[2]
+
+# Test rolling window methods
+def test_rolling_sum_mean():
+    """Test rolling sum and mean, with NaN for incomplete windows."""
+    arr = vp.array([1, 2, 3, 4, 5])
+    result = arr.rolling_sum(3)
+    assert math.isnan(result[0]) and math.isnan(result[1])
+    assert result.data[2:] == [6.0, 9.0, 12.0]
+    assert arr.rolling_mean(3, min_periods=1).data == [1.0, 1.5, 2.0, 3.0, 4.0]
+
+def test_rolling_min_max():
+    """Test rolling extremes from the monotonic deque."""
+    arr = vp.array([4, 2, 12, 3, 8, 1, 7])
+    assert arr.rolling_min(3).data[2:] == [2.0, 2.0, 3.0, 1.0, 1.0]
+    assert arr.rolling_max(3).data[2:] == [12.0, 12.0, 12.0, 8.0, 8.0]
+
+def test_rolling_std_var():
+    """Test rolling variance matches a direct computation and is exactly 0 for constant windows."""
+    arr = vp.array([2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0])
+    assert arr.rolling_std(8).data[-1] == 2.0
+    assert arr.rolling_var(3).data[3] == 0.0
+    assert abs(arr.rolling_var(2, ddof=1).data[1] - 2.0) < 1e-12
+
+def test_rolling_center():
+    """Test centered windows and min_periods at both edges."""
+    arr = vp.array([1, 2, 3, 4, 5])
+    assert arr.rolling_sum(3, min_periods=2, center=True).data == [3.0, 6.0, 9.0, 12.0, 9.0]
+    result = arr.rolling_sum(4, center=True)
+    assert result.data[2] == 10.0
+    assert math.isnan(result[4])
+
+def test_rolling_invalid_min_periods():
+    """Test min_periods outside 1..window is rejected."""
+    arr = vp.array([1, 2, 3])
+    try:
+        arr.rolling_mean(2, min_periods=3)
+        assert False, "Should have raised an error!"
+    except ValueError as e:
+        assert "min_periods" in str(e)
+
     
 # Test diff method
 def test_basic_diff():
@@ -178,4 +243,16 @@ def test_full_shift():
     arr = vp.array([1, 2, 3, 4, 5])
     result = arr.shift(5)  # Shift right by full length
     # [1,2,3,4,5] → [0,0,0,0,0] (all elements shifted out)
-    assert result.data == [0, 0, 0, 0, 0]
\ No newline at end of file
+    assert result.data == [0, 0, 0, 0, 0]
+
+# Test chunked scans across chunk boundaries
+def test_scans_across_chunks():
+    """Test diff and cumulative_sum stitch results between chunks."""
+    n = 70000  # larger than one processing chunk
+    arr = vp.arange(n)
+    assert arr.diff().data == [1] * (n - 1)
+    csum = arr.cumulative_sum()
+    assert len(csum) == n
+    assert csum[n - 1] == n * (n - 1) // 2
+    assert arr.sum() == n * (n - 1) // 2
+    assert arr.max() == n - 1
@@ -157,4 +157,29 @@ def test_float_reverse():
     arr = vp.array([1.1, 2.2, 3.3, 4.4])
     result = arr.reverse()
     assert result.data == [4.4, 3.3, 2.2, 1.1]  # Decimals reversed
-    assert result.dtype == float
\ No newline at end of file
+    assert result.dtype == float
+
+# Test out= buffers
+def test_transformations_out():
+    """Test clip, normalize and minmax_scale write into a given output."""
+    arr = vp.array([10, 20, 30])
+    out = vp.zeros(3)
+    assert arr.minmax_scale(out=out) is out
+    assert out.data == [0.0, 0.5, 1.0]
+    arr.clip(15, 25, out=out)
+    assert out.data == [15.0, 20.0, 25.0]
+    arr.normalize(out=out)
+    assert abs(out.mean()) < 0.0001
+
+# Test robust_scale method
+def test_robust_scale():
+    """Test median/IQR scaling ignores the size of an outlier."""
+    arr = vp.array([1, 2, 3, 4, 100])
+    result = arr.robust_scale()
+    assert result.data == [-1.0, -0.5, 0.0, 0.5, 48.5]
+    assert result.dtype == float
+
+def test_robust_scale_constant():
+    """Test a zero interquartile range scales everything to 0.0."""
+    arr = vp.array([4, 4, 4, 4, 9])
+    assert arr.robust_scale().data == [0.0, 0.0, 0.0, 0.0, 0.0]